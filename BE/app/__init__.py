@@ -1,12 +1,15 @@
 # BE/app/__init__.py
 from flask import Flask
 from flask_cors import CORS
+from flask_migrate import upgrade
 import logging
 import os
 from pathlib import Path
 
 from config.config import Config
-from extensions import db
+from extensions import db, migrate
+from utils.database import build_engine_options
+from utils.upload_limits import DatasetUploadRequest
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +18,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / 'migrations'
+
 def create_app(config_class=Config):
     """Application factory pattern"""
     
@@ -22,6 +27,9 @@ def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
     
+    # Dataset upload routes get their own request size limit
+    app.request_class = DatasetUploadRequest
+    
     # Enable CORS for frontend communication
     CORS(app, resources={
         r"/api/*": {
@@ -31,8 +39,17 @@ def create_app(config_class=Config):
         }
     })
     
-    # Initialize extensions
+    # Initialize extensions (worker processes inherit the SQLALCHEMY_* settings)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', build_engine_options(
+        app.config['SQLALCHEMY_DATABASE_URI'],
+        pool_size=app.config.get('DB_POOL_SIZE', 10),
+        max_overflow=app.config.get('DB_MAX_OVERFLOW', 20),
+        pool_timeout=app.config.get('DB_POOL_TIMEOUT', 30),
+        pool_recycle=app.config.get('DB_POOL_RECYCLE', 1800),
+        sqlite_busy_timeout_ms=app.config.get('SQLITE_BUSY_TIMEOUT_MS', 30000)
+    ))
     db.init_app(app)
+    migrate.init_app(app, db, directory=str(MIGRATIONS_DIR))
     
     # Create necessary directories
     models_dir = Path(app.config.get('MODELS_PATH', 'models_output'))
@@ -48,10 +65,13 @@ def create_app(config_class=Config):
     from routes import register_routes
     register_routes(app)
     
-    # Create database tables
+    # Create database tables, then bring existing databases up to date:
+    # create_all skips tables that already exist, so columns and indexes
+    # added later come from the migrations in BE/migrations
     with app.app_context():
         try:
             db.create_all()
+            upgrade(directory=str(MIGRATIONS_DIR))
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating database tables: {str(e)}")
@@ -8,12 +8,64 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///automl.db')
     
+    # Database connection pool and SQLite lock wait (engine options are built from these)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a server connection is replaced
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "30000"))
+    
     # AutoML specific configuration
     # Calculate path relative to BE directory (where run.py is)
     MODELS_PATH = os.getenv("MODELS_PATH", 
                            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "models_output"))
+    DATASETS_PATH = os.getenv("DATASETS_PATH",
+                             os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "datasets"))
+    UPLOADS_PATH = os.getenv("UPLOADS_PATH",
+                            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "uploads"))
     MAX_TRAINING_TIME = int(os.getenv("MAX_TRAINING_TIME", "7200"))  # 2 hours max
     MAX_PREDICTION_BATCH_SIZE = int(os.getenv("MAX_PREDICTION_BATCH_SIZE", "10000"))
+    PREDICTION_STREAM_CHUNK_ROWS = int(os.getenv("PREDICTION_STREAM_CHUNK_ROWS", "10000"))  # Rows scored per chunk when streaming
+    
+    # Loaded model cache configuration
+    MODEL_CACHE_MAX_MB = int(os.getenv("MODEL_CACHE_MAX_MB", "2048"))
+    MODEL_CACHE_PINNED = [uuid for uuid in os.getenv("MODEL_CACHE_PINNED", "").split(",") if uuid.strip()]
+    MODEL_SERVE_DEPLOYMENT_ARTIFACT = os.getenv("MODEL_SERVE_DEPLOYMENT_ARTIFACT", "true").lower() == "true"  # Serve the lean copy when training built one
+    MODEL_METADATA_CACHE_TTL = float(os.getenv("MODEL_METADATA_CACHE_TTL", "30"))  # Seconds; 0 disables the cache
+    
+    # Startup warm-up: AutoGluon is imported and hot models are loaded before readiness is reported
+    WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    WARMUP_PRELOAD_MODELS = [uuid for uuid in os.getenv("WARMUP_PRELOAD_MODELS", "").split(",") if uuid.strip()]
+    WARMUP_PRELOAD_TOP_N = int(os.getenv("WARMUP_PRELOAD_TOP_N", "5"))  # Most recently used hot models to preload
+    
+    # Cold storage of idle models (compressed archives, rehydrated on load)
+    # Opt-in: set MODEL_ARCHIVE_AFTER_DAYS to archive models idle that long every MODEL_ARCHIVE_SWEEP_HOURS;
+    # with 0 models are only archived through POST /api/models/storage/archive
+    MODEL_ARCHIVE_AFTER_DAYS = float(os.getenv("MODEL_ARCHIVE_AFTER_DAYS", "0"))
+    MODEL_ARCHIVE_SWEEP_HOURS = float(os.getenv("MODEL_ARCHIVE_SWEEP_HOURS", "6"))
+    
+    # Garbage collection of orphan model directories and stale training records
+    MODEL_GC_INTERVAL_MINUTES = float(os.getenv("MODEL_GC_INTERVAL_MINUTES", "0"))  # Opt-in; 0 leaves runs to POST /api/models/gc
+    MODEL_GC_GRACE_MINUTES = float(os.getenv("MODEL_GC_GRACE_MINUTES", "30"))  # Entries touched more recently are left alone
+    MODEL_GC_IO_MB_PER_S = float(os.getenv("MODEL_GC_IO_MB_PER_S", "50"))
+    MODEL_GC_FILES_PER_S = float(os.getenv("MODEL_GC_FILES_PER_S", "500"))
+    
+    # Prediction micro-batching configuration (opt-in, tunable per model)
+    PREDICTION_BATCHING_ENABLED = os.getenv("PREDICTION_BATCHING_ENABLED", "false").lower() == "true"
+    PREDICTION_BATCH_WINDOW_MS = float(os.getenv("PREDICTION_BATCH_WINDOW_MS", "5"))
+    PREDICTION_BATCH_MAX_ROWS = int(os.getenv("PREDICTION_BATCH_MAX_ROWS", "512"))
+    
+    # Offline batch-scoring job configuration
+    SCORING_INPUT_PATH = os.getenv("SCORING_INPUT_PATH",
+                                  os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "scoring_inputs"))
+    SCORING_WORKERS = int(os.getenv("SCORING_WORKERS", "1"))
+    SCORING_CHUNK_ROWS = int(os.getenv("SCORING_CHUNK_ROWS", "50000"))
+    
+    # Training job queue configuration
+    TRAINING_WORKERS = int(os.getenv("TRAINING_WORKERS", "2"))  # Worker processes running fit()
+    TRAINING_CPU_BUDGET = int(os.getenv("TRAINING_CPU_BUDGET", "0"))  # 0 = all cores
+    TRAINING_MEMORY_BUDGET_GB = float(os.getenv("TRAINING_MEMORY_BUDGET_GB", "0"))  # 0 = all physical memory
+    TRAINING_HEARTBEAT_SECONDS = float(os.getenv("TRAINING_HEARTBEAT_SECONDS", "60"))  # Keep well below MODEL_GC_GRACE_MINUTES
     
     # Logging configuration
     LOG_TO_STDOUT = os.getenv("LOG_TO_STDOUT", "true").lower() == "true"
@@ -25,7 +77,10 @@ class Config:
     JSON_SORT_KEYS = False
     
     # File upload limits
-    MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB max file size
+    MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB max request size
+    # Dataset files spooled to disk (/train/upload, /predict/stream, scoring jobs): 5GB unless
+    # MAX_DATASET_UPLOAD_MB says otherwise; 0 = no limit
+    MAX_DATASET_UPLOAD_LENGTH = int(os.getenv("MAX_DATASET_UPLOAD_MB", "5120")) * 1024 * 1024 or None
     
     @staticmethod
     def init_app(app):
@@ -5,6 +5,20 @@ from datetime import datetime
 
 class TrainedModel(db.Model):
     __tablename__ = 'trained_models'
+    __table_args__ = (
+        # Status-filtered listings walk this index in creation order
+        db.Index('ix_trained_models_status_created_at', 'status', 'created_at'),
+    )
+    
+    # Fields returned by to_dict, in order
+    SERIALIZED_FIELDS = (
+        'id', 'uuid', 'name', 'model_path', 'target_feature', 'problem_type',
+        'time_limit', 'eval_metric', 'presets', 'verbosity', 'inference_limit_ms', 'status',
+        'best_score', 'best_model_name', 'error_message', 'feature_columns',
+        'deployment_model_name', 'full_artifact_bytes', 'deployment_artifact_bytes',
+        'full_latency_ms', 'deployment_latency_ms', 'dataset_filename', 'dataset_hash',
+        'created_at', 'updated_at'
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     uuid = db.Column(db.String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4()))
@@ -18,38 +32,40 @@ class TrainedModel(db.Model):
     eval_metric = db.Column(db.String(100))
     presets = db.Column(db.String(100))
     verbosity = db.Column(db.Integer)
+    inference_limit_ms = db.Column(db.Float)  # Per-row predict time budget of the serving model
     
     # Model status and results
     status = db.Column(db.String(50), default='training')  # training, completed, failed, deleted
+    heartbeat_at = db.Column(db.DateTime)  # Refreshed by the process owning the job while it is queued or running
     best_score = db.Column(db.Float)
     best_model_name = db.Column(db.String(255))
     error_message = db.Column(db.Text)
     
+    # Model details computed once when training completes
+    feature_columns = db.Column(db.JSON)
+    leaderboard = db.Column(db.JSON)
+    feature_importance = db.Column(db.JSON)
+    
+    # Deployment artifact (refit best model only), with sizes and single-row latencies before and after
+    deployment_model_name = db.Column(db.String(255))
+    full_artifact_bytes = db.Column(db.BigInteger)
+    deployment_artifact_bytes = db.Column(db.BigInteger)
+    full_latency_ms = db.Column(db.Float)
+    deployment_latency_ms = db.Column(db.Float)
+    
     # Metadata
     dataset_filename = db.Column(db.String(255))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    dataset_hash = db.Column(db.String(64), index=True)  # Dataset store reference
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'uuid': self.uuid,
-            'name': self.name,
-            'model_path': self.model_path,
-            'target_feature': self.target_feature,
-            'problem_type': self.problem_type,
-            'time_limit': self.time_limit,
-            'eval_metric': self.eval_metric,
-            'presets': self.presets,
-            'verbosity': self.verbosity,
-            'status': self.status,
-            'best_score': self.best_score,
-            'best_model_name': self.best_model_name,
-            'error_message': self.error_message,
-            'dataset_filename': self.dataset_filename,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self, fields=None):
+        """Serialize the model, optionally only the given fields"""
+        data = {}
+        for name in fields or self.SERIALIZED_FIELDS:
+            value = getattr(self, name)
+            data[name] = value.isoformat() if isinstance(value, datetime) else value
+        return data
     
     def __repr__(self):
         return f'<TrainedModel {self.name} ({self.uuid}) - {self.status}>'
\ No newline at end of file
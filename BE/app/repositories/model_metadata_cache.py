@@ -0,0 +1,99 @@
+# BE/app/repositories/model_metadata_cache.py
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+@dataclass(frozen=True)
+class ModelMetadata:
+    """Read-only snapshot of the model fields needed to serve predictions"""
+    uuid: str
+    name: str
+    status: str
+    target_feature: str
+    problem_type: str
+    model_path: str
+
+    @classmethod
+    def from_model(cls, model) -> 'ModelMetadata':
+        return cls(
+            uuid=model.uuid,
+            name=model.name,
+            status=model.status,
+            target_feature=model.target_feature,
+            problem_type=model.problem_type,
+            model_path=model.model_path
+        )
+
+class ModelMetadataCache:
+    """
+    Thread-safe TTL cache of model metadata snapshots
+
+    Writers invalidate entries explicitly; the TTL only bounds staleness
+    for changes made by other processes. Every invalidation bumps a
+    generation counter, and a snapshot read from the database before an
+    invalidation is not stored, so a slow reader cannot put back a row
+    that has just been changed. Beyond max_entries the least recently
+    used snapshots are dropped.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: 'OrderedDict[str, Tuple[float, ModelMetadata]]' = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def configure(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None) -> None:
+        """Change the cache settings; a TTL of 0 disables caching"""
+        with self._lock:
+            if ttl_seconds is not None:
+                self.ttl_seconds = ttl_seconds
+            if max_entries is not None:
+                self.max_entries = max_entries
+            self._entries.clear()
+            self._generation += 1
+
+    def get(self, model_uuid: str) -> Optional[ModelMetadata]:
+        """Get a cached snapshot, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(model_uuid)
+            if entry is None:
+                return None
+
+            expires_at, metadata = entry
+            if expires_at <= time.monotonic():
+                del self._entries[model_uuid]
+                return None
+
+            self._entries.move_to_end(model_uuid)
+            return metadata
+
+    def generation(self) -> int:
+        """Get the token to pass to put() for a snapshot about to be read"""
+        with self._lock:
+            return self._generation
+
+    def put(self, metadata: ModelMetadata, generation: int) -> None:
+        """Store a snapshot unless an invalidation happened since it was read"""
+        with self._lock:
+            if self.ttl_seconds <= 0 or generation != self._generation:
+                return
+
+            self._entries[metadata.uuid] = (time.monotonic() + self.ttl_seconds, metadata)
+            self._entries.move_to_end(metadata.uuid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, model_uuid: str) -> None:
+        """Drop the snapshot of a model that changed"""
+        with self._lock:
+            self._entries.pop(model_uuid, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
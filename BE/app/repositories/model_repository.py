@@ -1,9 +1,15 @@
 # BE/app/repositories/model_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from models import TrainedModel
 from extensions import db
+from repositories.model_metadata_cache import ModelMetadata, ModelMetadataCache
 from services.base import TrainingConfig, ModelStatus
+from sqlalchemy import and_, or_, inspect
+from sqlalchemy.orm import load_only
+from utils.database import run_with_retry
+import base64
+import json
 import uuid
 from datetime import datetime
 
@@ -11,17 +17,40 @@ class IModelRepository(ABC):
     """Interface for model repository"""
     
     @abstractmethod
-    def create(self, training_config: TrainingConfig, model_path: str, dataset_filename: str) -> TrainedModel:
+    def create(
+        self, 
+        training_config: TrainingConfig, 
+        model_path: str, 
+        dataset_filename: str, 
+        model_uuid: Optional[str] = None,
+        dataset_hash: Optional[str] = None
+    ) -> TrainedModel:
         pass
     
     @abstractmethod
     def get_by_uuid(self, model_uuid: str) -> Optional[TrainedModel]:
         pass
     
+    @abstractmethod
+    def get_metadata(self, model_uuid: str) -> Optional[ModelMetadata]:
+        pass
+    
     @abstractmethod
     def get_all(self) -> List[TrainedModel]:
         pass
     
+    @abstractmethod
+    def list_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        problem_type: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[TrainedModel], Optional[str]]:
+        pass
+    
     @abstractmethod
     def update(self, model: TrainedModel) -> TrainedModel:
         pass
@@ -33,15 +62,63 @@ class IModelRepository(ABC):
     @abstractmethod
     def exists(self, model_uuid: str) -> bool:
         pass
+    
+    @abstractmethod
+    def get_feature_columns(self, model_uuid: str) -> Optional[List[str]]:
+        pass
+    
+    @abstractmethod
+    def count_by_dataset_hash(self, dataset_hash: str) -> int:
+        pass
+    
+    @abstractmethod
+    def get_status_index(self) -> Dict[str, Tuple[str, datetime]]:
+        pass
+    
+    @abstractmethod
+    def touch_heartbeat(self, model_uuids: Sequence[str]) -> int:
+        pass
+    
+    @abstractmethod
+    def fail_stale_training(self, model_uuids: Sequence[str], error_message: str, seen_before: datetime) -> int:
+        pass
+
+# Fields update_status copies from its additional data
+STATUS_DETAIL_FIELDS = (
+    'best_score', 'best_model_name', 'error_message', 'eval_metric',
+    'feature_columns', 'leaderboard', 'feature_importance',
+    'deployment_model_name', 'full_artifact_bytes', 'deployment_artifact_bytes',
+    'full_latency_ms', 'deployment_latency_ms', 'dataset_hash'
+)
+
+# Rows per statement when updating many models by UUID
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Shared by every repository of the process, so any of them can invalidate it
+_shared_metadata_cache = ModelMetadataCache()
+
+def _last_seen():
+    """Training heartbeat, falling back to the last update of rows without one"""
+    return db.func.coalesce(TrainedModel.heartbeat_at, TrainedModel.updated_at)
 
 class ModelRepository(IModelRepository):
     """Concrete implementation of model repository"""
     
-    def create(self, training_config: TrainingConfig, model_path: str, dataset_filename: str) -> TrainedModel:
+    def __init__(self, metadata_cache: Optional[ModelMetadataCache] = None):
+        self.metadata_cache = metadata_cache or _shared_metadata_cache
+    
+    def create(
+        self, 
+        training_config: TrainingConfig, 
+        model_path: str, 
+        dataset_filename: str, 
+        model_uuid: Optional[str] = None,
+        dataset_hash: Optional[str] = None
+    ) -> TrainedModel:
         """Create a new trained model record"""
         try:
             model = TrainedModel(
-                uuid=str(uuid.uuid4()),
+                uuid=model_uuid or str(uuid.uuid4()),
                 name=training_config.model_name,
                 model_path=model_path,
                 target_feature=training_config.target_feature,
@@ -50,14 +127,20 @@ class ModelRepository(IModelRepository):
                 eval_metric=training_config.eval_metric,
                 presets=training_config.presets,
                 verbosity=training_config.verbosity,
+                inference_limit_ms=training_config.inference_limit_ms,
                 dataset_filename=dataset_filename,
+                dataset_hash=dataset_hash,
                 status=ModelStatus.TRAINING.value,
-                created_at=datetime.utcnow()
+                created_at=datetime.utcnow(),
+                heartbeat_at=datetime.utcnow()
             )
             
-            db.session.add(model)
-            db.session.commit()
-            return model
+            def insert() -> TrainedModel:
+                db.session.add(model)
+                db.session.commit()
+                return model
+            
+            return run_with_retry(insert, db.session, f"insert of model {model.uuid}")
             
         except Exception as e:
             db.session.rollback()
@@ -67,58 +150,284 @@ class ModelRepository(IModelRepository):
         """Get model by UUID"""
         return TrainedModel.query.filter_by(uuid=model_uuid).first()
     
+    def get_metadata(self, model_uuid: str) -> Optional[ModelMetadata]:
+        """
+        Get the serving metadata of a model, from the cache when possible
+        
+        Reads through to the database on a miss. Used on the prediction
+        and status polling paths instead of get_by_uuid.
+        """
+        metadata = self.metadata_cache.get(model_uuid)
+        if metadata is not None:
+            return metadata
+        
+        generation = self.metadata_cache.generation()
+        model = self.get_by_uuid(model_uuid)
+        if not model:
+            return None
+        
+        metadata = ModelMetadata.from_model(model)
+        self.metadata_cache.put(metadata, generation)
+        return metadata
+    
+    def invalidate_metadata(self, model_uuid: str) -> None:
+        """Drop the cached metadata of a model changed outside this repository"""
+        self.metadata_cache.invalidate(model_uuid)
+    
     def get_all(self) -> List[TrainedModel]:
         """Get all models ordered by creation date"""
         return TrainedModel.query.order_by(TrainedModel.created_at.desc()).all()
     
+    def list_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        problem_type: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[TrainedModel], Optional[str]]:
+        """
+        Get one page of models, newest first
+        
+        Pages are keyed on (created_at, id) rather than offsets, so each page
+        is an index range scan no matter how deep it is. With fields only
+        those columns are loaded.
+        
+        Returns:
+            Tuple of (models, cursor of the next page or None on the last page)
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = TrainedModel.query
+        
+        if status:
+            query = query.filter(TrainedModel.status == status)
+        if problem_type:
+            query = query.filter(TrainedModel.problem_type == problem_type)
+        if name_prefix:
+            query = query.filter(TrainedModel.name.startswith(name_prefix, autoescape=True))
+        
+        if cursor:
+            created_at, model_id = _decode_cursor(cursor)
+            query = query.filter(or_(
+                TrainedModel.created_at < created_at,
+                and_(TrainedModel.created_at == created_at, TrainedModel.id < model_id)
+            ))
+        
+        if fields:
+            # The sort key is always loaded to build the next cursor
+            columns = set(fields) | {'id', 'created_at'}
+            query = query.options(load_only(*(getattr(TrainedModel, name) for name in columns)))
+        
+        models = (
+            query.order_by(TrainedModel.created_at.desc(), TrainedModel.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        
+        if len(models) <= limit:
+            return models, None
+        
+        models = models[:limit]
+        return models, _encode_cursor(models[-1])
+    
     def update(self, model: TrainedModel) -> TrainedModel:
         """Update existing model"""
-        try:
+        # A rollback discards pending changes, so they are reapplied on each attempt
+        changes = {
+            attribute.key: attribute.value
+            for attribute in inspect(model).attrs
+            if attribute.history.has_changes()
+        }
+        
+        def commit() -> TrainedModel:
+            for key, value in changes.items():
+                setattr(model, key, value)
             db.session.commit()
             return model
+        
+        try:
+            return run_with_retry(commit, db.session, f"update of model {model.uuid}")
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to update model: {str(e)}")
+        finally:
+            self.metadata_cache.invalidate(model.uuid)
     
     def delete(self, model_uuid: str) -> bool:
         """Delete model by UUID"""
-        try:
-            model = self.get_by_uuid(model_uuid)
-            if not model:
-                return False
-            
-            db.session.delete(model)
+        def delete() -> bool:
+            deleted = TrainedModel.query.filter_by(uuid=model_uuid).delete(synchronize_session=False)
             db.session.commit()
-            return True
+            return deleted > 0
+        
+        try:
+            return run_with_retry(delete, db.session, f"delete of model {model_uuid}")
             
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to delete model: {str(e)}")
+        finally:
+            self.metadata_cache.invalidate(model_uuid)
     
     def exists(self, model_uuid: str) -> bool:
         """Check if model exists"""
-        return TrainedModel.query.filter_by(uuid=model_uuid).first() is not None
+        return self.get_metadata(model_uuid) is not None
     
-    def update_status(self, model_uuid: str, status: ModelStatus, additional_data: dict = None) -> bool:
-        """Update model status and additional data"""
-        try:
-            model = self.get_by_uuid(model_uuid)
-            if not model:
-                return False
+    def get_feature_columns(self, model_uuid: str) -> Optional[List[str]]:
+        """Get the stored feature columns of a model, without its other details"""
+        model = TrainedModel.query.options(load_only(TrainedModel.feature_columns)).filter_by(uuid=model_uuid).first()
+        return model.feature_columns if model else None
+    
+    def count_by_dataset_hash(self, dataset_hash: str) -> int:
+        """Count the models referencing a stored dataset"""
+        return TrainedModel.query.filter_by(dataset_hash=dataset_hash).count()
+    
+    def get_status_index(self) -> Dict[str, Tuple[str, datetime]]:
+        """
+        Get the status and last sign of life of every model, without loading full rows
+        
+        The last sign of life is the training heartbeat, or the last update
+        for rows that never had one.
+        """
+        rows = db.session.query(TrainedModel.uuid, TrainedModel.status, _last_seen()).all()
+        return {model_uuid: (status, last_seen) for model_uuid, status, last_seen in rows}
+    
+    def touch_heartbeat(self, model_uuids: Sequence[str]) -> int:
+        """
+        Refresh the heartbeat of training jobs, in bulk
+        
+        Leaves updated_at alone: the heartbeat is not a change of the model.
+        
+        Returns:
+            Number of models refreshed
+        """
+        touched = 0
+        now = datetime.utcnow()
+        
+        for start in range(0, len(model_uuids), BULK_UPDATE_BATCH_SIZE):
+            batch = list(model_uuids[start:start + BULK_UPDATE_BATCH_SIZE])
             
-            model.status = status.value
+            def update() -> int:
+                updated = (
+                    TrainedModel.query
+                    .filter(TrainedModel.uuid.in_(batch), TrainedModel.status == ModelStatus.TRAINING.value)
+                    .update(
+                        {'heartbeat_at': now, 'updated_at': TrainedModel.updated_at},
+                        synchronize_session=False
+                    )
+                )
+                db.session.commit()
+                return updated
             
-            if additional_data:
-                if 'best_score' in additional_data:
-                    model.best_score = additional_data['best_score']
-                if 'best_model_name' in additional_data:
-                    model.best_model_name = additional_data['best_model_name']
-                if 'error_message' in additional_data:
-                    model.error_message = additional_data['error_message']
+            try:
+                touched += run_with_retry(update, db.session, f"heartbeat of {len(batch)} models")
+            except Exception as e:
+                db.session.rollback()
+                raise Exception(f"Failed to refresh training heartbeats: {str(e)}")
+        
+        return touched
+    
+    def fail_stale_training(self, model_uuids: Sequence[str], error_message: str, seen_before: datetime) -> int:
+        """
+        Mark models still in TRAINING as FAILED, in bulk
+        
+        Models that left TRAINING, or whose heartbeat was refreshed since
+        seen_before, are not touched.
+        
+        Returns:
+            Number of models marked as FAILED
+        """
+        failed = 0
+        
+        for start in range(0, len(model_uuids), BULK_UPDATE_BATCH_SIZE):
+            batch = list(model_uuids[start:start + BULK_UPDATE_BATCH_SIZE])
+            
+            def update() -> int:
+                updated = (
+                    TrainedModel.query
+                    .filter(
+                        TrainedModel.uuid.in_(batch),
+                        TrainedModel.status == ModelStatus.TRAINING.value,
+                        _last_seen() < seen_before
+                    )
+                    .update(
+                        {'status': ModelStatus.FAILED.value, 'error_message': error_message},
+                        synchronize_session=False
+                    )
+                )
+                db.session.commit()
+                return updated
             
+            try:
+                failed += run_with_retry(update, db.session, f"bulk failure of {len(batch)} models")
+            except Exception as e:
+                db.session.rollback()
+                raise Exception(f"Failed to update model status: {str(e)}")
+            finally:
+                for model_uuid in batch:
+                    self.metadata_cache.invalidate(model_uuid)
+        
+        return failed
+    
+    def update_model_path(self, model_uuid: str, model_path: str) -> bool:
+        """Point a model at the directory its artifacts were moved to"""
+        def update() -> bool:
+            updated = TrainedModel.query.filter_by(uuid=model_uuid).update(
+                {'model_path': model_path},
+                synchronize_session=False
+            )
             db.session.commit()
-            return True
+            return updated > 0
+        
+        try:
+            return run_with_retry(update, db.session, f"path update of model {model_uuid}")
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to update model path: {str(e)}")
+        finally:
+            self.metadata_cache.invalidate(model_uuid)
+    
+    def update_status(self, model_uuid: str, status: ModelStatus, additional_data: dict = None) -> bool:
+        """
+        Update model status and additional data
+        
+        Runs as a single UPDATE statement, so the write lock is held only
+        for that statement and the commit.
+        """
+        values = {'status': status.value}
+        if additional_data:
+            values.update({
+                key: additional_data[key]
+                for key in STATUS_DETAIL_FIELDS
+                if key in additional_data
+            })
+        
+        def update() -> bool:
+            updated = TrainedModel.query.filter_by(uuid=model_uuid).update(values, synchronize_session=False)
+            db.session.commit()
+            return updated > 0
+        
+        try:
+            return run_with_retry(update, db.session, f"status update of model {model_uuid}")
             
         except Exception as e:
             db.session.rollback()
-            raise Exception(f"Failed to update model status: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Failed to update model status: {str(e)}")
+        finally:
+            self.metadata_cache.invalidate(model_uuid)
+
+def _encode_cursor(model: TrainedModel) -> str:
+    """Encode the sort key of the last model of a page as an opaque cursor"""
+    key = json.dumps([model.created_at.isoformat(), model.id])
+    return base64.urlsafe_b64encode(key.encode('utf-8')).decode('ascii')
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a page cursor into its (created_at, id) sort key"""
+    try:
+        created_at, model_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(created_at), int(model_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -5,7 +5,8 @@ import logging
 from routes.training_routes import training_bp
 from routes.models_routes import models_bp
 from routes.predictions_routes import predictions_bp
-from services.container import initialize_services
+from routes.datasets_routes import datasets_bp
+from services.container import initialize_services, get_model_warmup
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,46 @@ def register_routes(app: Flask):
         # Get configuration from app config if available
         models_config = {
             'ml_service': {
-                'models_path': app.config.get('MODELS_PATH', 'models_output')
+                'models_path': app.config.get('MODELS_PATH', 'models_output'),
+                'cache_max_memory_mb': app.config.get('MODEL_CACHE_MAX_MB', 2048),
+                'pinned_models': app.config.get('MODEL_CACHE_PINNED', []),
+                'serve_deployment_artifacts': app.config.get('MODEL_SERVE_DEPLOYMENT_ARTIFACT', True),
+                'archive_after_days': app.config.get('MODEL_ARCHIVE_AFTER_DAYS', 0),
+                'archive_sweep_hours': app.config.get('MODEL_ARCHIVE_SWEEP_HOURS', 6)
+            },
+            'model_repository': {
+                'metadata_cache_ttl': app.config.get('MODEL_METADATA_CACHE_TTL', 30.0)
+            },
+            'prediction_batcher': {
+                'enabled': app.config.get('PREDICTION_BATCHING_ENABLED', False),
+                'window_ms': app.config.get('PREDICTION_BATCH_WINDOW_MS', 5.0),
+                'max_rows': app.config.get('PREDICTION_BATCH_MAX_ROWS', 512)
+            },
+            'scoring_jobs': {
+                'input_path': app.config.get('SCORING_INPUT_PATH', 'scoring_inputs'),
+                'max_workers': app.config.get('SCORING_WORKERS', 1),
+                'chunk_rows': app.config.get('SCORING_CHUNK_ROWS', 50000)
+            },
+            'model_gc': {
+                'interval_minutes': app.config.get('MODEL_GC_INTERVAL_MINUTES', 0),
+                'grace_minutes': app.config.get('MODEL_GC_GRACE_MINUTES', 30),
+                'io_mb_per_second': app.config.get('MODEL_GC_IO_MB_PER_S', 50),
+                'files_per_second': app.config.get('MODEL_GC_FILES_PER_S', 500)
+            },
+            'dataset_store': {
+                'datasets_path': app.config.get('DATASETS_PATH', 'datasets')
+            },
+            'warmup': {
+                'enabled': app.config.get('WARMUP_ENABLED', True),
+                'preload_models': app.config.get('WARMUP_PRELOAD_MODELS', []),
+                'preload_top_n': app.config.get('WARMUP_PRELOAD_TOP_N', 5)
+            },
+            'training_queue': {
+                'app': app,
+                'max_workers': app.config.get('TRAINING_WORKERS', 2),
+                'cpu_budget': app.config.get('TRAINING_CPU_BUDGET', 0),
+                'memory_budget_gb': app.config.get('TRAINING_MEMORY_BUDGET_GB', 0),
+                'heartbeat_seconds': app.config.get('TRAINING_HEARTBEAT_SECONDS', 60)
             }
         }
         initialize_services(models_config)
@@ -31,6 +71,7 @@ def register_routes(app: Flask):
     app.register_blueprint(training_bp)
     app.register_blueprint(models_bp)
     app.register_blueprint(predictions_bp)
+    app.register_blueprint(datasets_bp)
     
     logger.info("All route blueprints registered successfully")
     
@@ -44,6 +85,23 @@ def register_routes(app: Flask):
             'version': '1.0.0'
         }, 200
     
+    # Add readiness endpoint for load balancers and rolling restarts
+    @app.route('/api/ready', methods=['GET'])
+    def readiness_check():
+        """
+        Readiness check endpoint
+        
+        Returns:
+            200 once startup warm-up (AutoGluon import and hot model
+            preloading) has finished, 503 while it is still running
+        """
+        warmup = get_model_warmup()
+        ready = warmup.is_ready()
+        return {
+            'status': 'ready' if ready else 'warming_up',
+            'warmup': warmup.get_status()
+        }, 200 if ready else 503
+    
     # Add API documentation endpoint
     @app.route('/api/docs', methods=['GET'])
     def api_docs():
@@ -52,22 +110,44 @@ def register_routes(app: Flask):
             'api_version': '1.0.0',
             'endpoints': {
                 'training': {
-                    'POST /api/training/train': 'Train a new model',
-                    'GET /api/training/status/<uuid>': 'Get training status'
+                    'POST /api/training/train': 'Submit a model training job',
+                    'POST /api/training/train/upload': 'Submit a model training job with a CSV/Parquet file upload',
+                    'GET /api/training/status/<uuid>': 'Get training status',
+                    'GET /api/training/resources': 'Get training resource usage'
                 },
                 'models': {
-                    'GET /api/models': 'List all models',
+                    'GET /api/models': 'List models a page at a time, with filters',
                     'GET /api/models/<uuid>': 'Get model details',
                     'DELETE /api/models/<uuid>': 'Delete a model',
-                    'GET /api/models/<uuid>/info': 'Get model ML info'
+                    'GET /api/models/<uuid>/manifest': 'Get model input schema',
+                    'GET /api/models/<uuid>/info': 'Get model ML info',
+                    'POST /api/models/<uuid>/pin': 'Pin a model in the predictor cache',
+                    'DELETE /api/models/<uuid>/pin': 'Unpin a model from the predictor cache',
+                    'GET /api/models/cache': 'Get predictor cache statistics',
+                    'GET /api/models/storage': 'Get disk usage per model and storage tier',
+                    'POST /api/models/storage/archive': 'Archive models idle for a number of days',
+                    'GET /api/models/<uuid>/storage': 'Get disk usage and storage tier of a model',
+                    'GET /api/models/gc': 'Get the last garbage collection report',
+                    'POST /api/models/gc': 'Start a garbage collection run'
+                },
+                'datasets': {
+                    'GET /api/datasets/<hash>': 'Get a stored dataset'
                 },
                 'predictions': {
                     'POST /api/predictions/<uuid>/predict': 'Make predictions',
                     'POST /api/predictions/<uuid>/predict/batch': 'Batch predictions',
-                    'GET /api/predictions/<uuid>/predict/sample': 'Get prediction sample'
+                    'POST /api/predictions/<uuid>/predict/stream': 'Stream predictions for a large file',
+                    'GET /api/predictions/<uuid>/predict/sample': 'Get prediction sample',
+                    'POST /api/predictions/<uuid>/jobs': 'Submit an offline batch-scoring job',
+                    'GET /api/predictions/<uuid>/jobs': 'List batch-scoring jobs',
+                    'GET /api/predictions/<uuid>/jobs/<job_id>': 'Get batch-scoring job progress',
+                    'GET /api/predictions/<uuid>/jobs/<job_id>/result': 'Download batch-scoring results (Parquet)',
+                    'GET /api/predictions/<uuid>/batching': 'Get micro-batching settings',
+                    'PUT /api/predictions/<uuid>/batching': 'Update micro-batching settings'
                 },
                 'utility': {
                     'GET /api/health': 'Health check',
+                    'GET /api/ready': 'Readiness check (503 until startup warm-up finishes)',
                     'GET /api/docs': 'API documentation'
                 }
             }
@@ -0,0 +1,53 @@
+# BE/app/routes/datasets_routes.py
+from flask import Blueprint, jsonify
+import logging
+
+from services.container import get_model_service
+from utils.request_validators import validate_dataset_hash
+
+logger = logging.getLogger(__name__)
+
+datasets_bp = Blueprint('datasets', __name__, url_prefix='/api/datasets')
+
+@datasets_bp.route('/<dataset_hash>', methods=['GET'])
+def get_dataset(dataset_hash: str):
+    """
+    Get a stored dataset by content hash
+    
+    Clients can check whether a dataset is already stored (using the
+    SHA-256 of the file) and train on it with "datasetHash" instead of
+    uploading it again.
+    
+    Returns:
+    {
+        "success": true,
+        "dataset": {
+            "dataset_hash": "string",
+            "filename": "string",
+            "headers": ["col1", "col2", ...],
+            "total_rows": int,
+            "source_size": int,
+            "stored_size": int,
+            "references": int,
+            "created_at": "string"
+        }
+    }
+    """
+    try:
+        if not validate_dataset_hash(dataset_hash):
+            return jsonify({'error': 'Invalid dataset hash format'}), 400
+        
+        model_service = get_model_service()
+        dataset = model_service.get_dataset_info(dataset_hash)
+        
+        if dataset is None:
+            return jsonify({'error': 'Dataset not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'dataset': dataset
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error retrieving dataset {dataset_hash}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
@@ -1,19 +1,31 @@
 # BE/app/routes/models_routes.py
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 import logging
 from typing import Dict, Any
 
+from models import TrainedModel
 from services.container import get_model_service
-from utils.request_validators import validate_uuid
+from utils.request_validators import validate_uuid, validate_model_list_params
 
 logger = logging.getLogger(__name__)
 
 models_bp = Blueprint('models', __name__, url_prefix='/api/models')
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
 @models_bp.route('', methods=['GET'])
 def get_all_models():
     """
-    Get all trained models
+    Get a page of trained models, newest first
+    
+    Query parameters:
+    - limit: page size (default: 100, max: 500)
+    - cursor: next_cursor of the previous page
+    - status: only models with this status
+    - problem_type: only models of this problem type
+    - name: only models whose name starts with this prefix
+    - fields: comma-separated fields to return (default: all)
     
     Returns:
     {
@@ -30,23 +42,232 @@ def get_all_models():
                 "created_at": "string",
                 ...
             }
-        ]
+        ],
+        "count": int,
+        "next_cursor": "string or null"
     }
     """
     try:
+        error = validate_model_list_params(request.args, TrainedModel.SERIALIZED_FIELDS, MAX_PAGE_SIZE)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        fields = None
+        if 'fields' in request.args:
+            fields = [name.strip() for name in request.args['fields'].split(',') if name.strip()]
+        
         model_service = get_model_service()
-        models = model_service.get_all_models()
+        try:
+            page = model_service.list_models(
+                request.args.get('limit', DEFAULT_PAGE_SIZE, type=int),
+                cursor=request.args.get('cursor'),
+                status=request.args.get('status'),
+                problem_type=request.args.get('problem_type'),
+                name_prefix=request.args.get('name'),
+                fields=fields
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         return jsonify({
             'success': True,
-            'models': models,
-            'count': len(models)
+            'models': page['models'],
+            'count': len(page['models']),
+            'next_cursor': page['next_cursor']
         }), 200
         
     except Exception as e:
         logger.error(f"Error retrieving models: {str(e)}")
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
 
+@models_bp.route('/cache', methods=['GET'])
+def get_cache_stats():
+    """
+    Get statistics of the loaded predictor cache
+    
+    Returns:
+    {
+        "success": true,
+        "cache": {
+            "entries": int,
+            "memory_bytes": int,
+            "max_memory_bytes": int,
+            "hits": int,
+            "misses": int,
+            "hit_ratio": float,
+            "evictions": int,
+            "pinned": ["uuid", ...],
+            "models": ["uuid", ...]
+        }
+    }
+    """
+    try:
+        model_service = get_model_service()
+        
+        return jsonify({
+            'success': True,
+            'cache': model_service.get_cache_stats()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting cache stats: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@models_bp.route('/storage', methods=['GET'])
+def get_storage_usage():
+    """
+    Get the disk usage of all models, per model and per storage tier
+    
+    Hot models keep their artifacts as files; cold models have them in a
+    compressed archive and are rehydrated on their next load.
+    
+    Returns:
+    {
+        "success": true,
+        "storage": {
+            "tiers": {
+                "hot": {"models": int, "bytes": int},
+                "cold": {"models": int, "bytes": int}
+            },
+            "total_bytes": int,
+            "archiving_available": bool,
+            "models": [
+                {
+                    "model_uuid": "string",
+                    "tier": "hot|cold",
+                    "files_bytes": int,
+                    "archive_bytes": int,
+                    "total_bytes": int,
+                    "last_used_at": "string"
+                }
+            ]
+        }
+    }
+    """
+    try:
+        model_service = get_model_service()
+        
+        return jsonify({
+            'success': True,
+            'storage': model_service.get_storage_usage()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting storage usage: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@models_bp.route('/storage/archive', methods=['POST'])
+def archive_idle_models():
+    """
+    Archive the models not used for a number of days
+    
+    Expected JSON payload (optional):
+    {
+        "olderThanDays": float (default: MODEL_ARCHIVE_AFTER_DAYS, required when it is 0)
+    }
+    
+    Returns:
+    {
+        "success": true,
+        "archived": ["uuid", ...],
+        "failed": ["uuid", ...],
+        "reclaimed_bytes": int
+    }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        older_than_days = data.get('olderThanDays', current_app.config.get('MODEL_ARCHIVE_AFTER_DAYS', 0) or None)
+        if older_than_days is None:
+            return jsonify({'error': 'olderThanDays is required when MODEL_ARCHIVE_AFTER_DAYS is not set'}), 400
+        if isinstance(older_than_days, bool) or not isinstance(older_than_days, (int, float)) or older_than_days < 0:
+            return jsonify({'error': 'olderThanDays must be a non-negative number'}), 400
+        
+        model_service = get_model_service()
+        try:
+            result = model_service.archive_idle_models(older_than_days)
+        except RuntimeError as e:
+            return jsonify({'error': str(e)}), 503
+        
+        return jsonify({'success': True, **result}), 200
+        
+    except Exception as e:
+        logger.error(f"Error archiving models: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@models_bp.route('/gc', methods=['GET'])
+def get_garbage_collection_status():
+    """
+    Get the state of the model garbage collector and its last report
+    
+    Returns:
+    {
+        "success": true,
+        "gc": {
+            "available": bool,
+            "running": bool,
+            "last_report": {
+                "started_at": "string",
+                "duration_seconds": float,
+                "dry_run": bool,
+                "scanned_directories": int,
+                "orphan_directories": ["uuid", ...],
+                "failed_directories": ["uuid", ...],
+                "scratch_directories": ["string", ...],
+                "stale_training_models": ["uuid", ...],
+                "stale_training_failed": int,
+                "reclaimed_bytes": int,
+                "errors": ["string", ...]
+            }
+        }
+    }
+    """
+    try:
+        model_service = get_model_service()
+        
+        return jsonify({
+            'success': True,
+            'gc': model_service.get_garbage_collection_status()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting garbage collection status: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@models_bp.route('/gc', methods=['POST'])
+def start_garbage_collection():
+    """
+    Start reclaiming orphan model directories and stale training records
+    
+    The run is rate-limited and happens in the background; its report is
+    returned by GET /api/models/gc once it finishes.
+    
+    Expected JSON payload (optional):
+    {
+        "dryRun": bool (default: false)
+    }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        dry_run = data.get('dryRun', False)
+        if not isinstance(dry_run, bool):
+            return jsonify({'error': 'dryRun must be a boolean'}), 400
+        
+        model_service = get_model_service()
+        try:
+            model_service.start_garbage_collection(dry_run)
+        except RuntimeError as e:
+            return jsonify({'error': str(e)}), 409
+        
+        return jsonify({
+            'success': True,
+            'running': True,
+            'dry_run': dry_run
+        }), 202
+        
+    except Exception as e:
+        logger.error(f"Error starting garbage collection: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
 @models_bp.route('/<model_uuid>', methods=['GET'])
 def get_model_by_uuid(model_uuid: str):
     """
@@ -131,7 +352,15 @@ def get_model_info(model_uuid: str):
             'feature_importance': model.get('feature_importance'),
             'detailed_leaderboard': model.get('detailed_leaderboard'),
             'best_score': model.get('best_score'),
-            'best_model_name': model.get('best_model_name')
+            'best_model_name': model.get('best_model_name'),
+            'inference_limit_ms': model.get('inference_limit_ms'),
+            'deployment': {
+                'model_name': model['deployment_model_name'],
+                'full_artifact_bytes': model['full_artifact_bytes'],
+                'deployment_artifact_bytes': model['deployment_artifact_bytes'],
+                'full_latency_ms': model['full_latency_ms'],
+                'deployment_latency_ms': model['deployment_latency_ms']
+            } if model.get('deployment_model_name') else None
         }
         
         return jsonify({
@@ -141,4 +370,104 @@ def get_model_info(model_uuid: str):
         
     except Exception as e:
         logger.error(f"Error getting model info for {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@models_bp.route('/<model_uuid>/manifest', methods=['GET'])
+def get_model_manifest(model_uuid: str):
+    """
+    Get the input schema of a model
+    
+    Read from the manifest written at training time: feature names,
+    dtypes, category vocabularies, label and problem type.
+    """
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        manifest = model_service.get_model_manifest(model_uuid)
+        
+        if manifest is None:
+            return jsonify({'error': 'Manifest not available for this model'}), 404
+        
+        return jsonify({
+            'success': True,
+            'model_uuid': model_uuid,
+            'manifest': manifest
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting manifest for {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@models_bp.route('/<model_uuid>/storage', methods=['GET'])
+def get_model_storage(model_uuid: str):
+    """
+    Get the disk usage and storage tier of a model
+    
+    Returns:
+    {
+        "success": true,
+        "storage": {
+            "model_uuid": "string",
+            "tier": "hot|cold",
+            "files_bytes": int,
+            "archive_bytes": int,
+            "total_bytes": int,
+            "last_used_at": "string"
+        }
+    }
+    """
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        storage = model_service.get_model_storage(model_uuid)
+        
+        if storage is None:
+            return jsonify({'error': 'Model not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'storage': storage
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting storage of model {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@models_bp.route('/<model_uuid>/pin', methods=['POST', 'DELETE'])
+def pin_model(model_uuid: str):
+    """
+    Pin (POST) or unpin (DELETE) a model in the predictor cache
+    
+    Pinned models are never evicted, so hot models stay loaded.
+    """
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        pinned = request.method == 'POST'
+        
+        if pinned:
+            success = model_service.pin_model(model_uuid)
+        else:
+            success = model_service.unpin_model(model_uuid)
+        
+        if not success:
+            return jsonify({'error': 'Model not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'model_uuid': model_uuid,
+            'pinned': pinned
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error updating pin for model {model_uuid}: {str(e)}")
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
\ No newline at end of file
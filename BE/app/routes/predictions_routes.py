@@ -1,15 +1,36 @@
 # BE/app/routes/predictions_routes.py
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, current_app, send_file
+import itertools
+import json
 import logging
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import pandas as pd
 
 from services.container import get_model_service
-from utils.request_validators import validate_uuid, validate_prediction_request
+from services.schema_validator import SchemaValidationError
+from utils.dataset_files import get_dataset_format, spool_upload
+from utils.prediction_formats import (
+    ARROW_STREAM_MIMETYPE, JSON_MIMETYPE, read_arrow_stream,
+    available_response_mimetypes, encode_prediction_response
+)
+from utils.request_validators import (
+    validate_uuid, validate_prediction_request, validate_prediction_columns,
+    validate_batching_config, validate_scoring_job_request
+)
+from utils.upload_limits import dataset_upload
 
 logger = logging.getLogger(__name__)
 
 predictions_bp = Blueprint('predictions', __name__, url_prefix='/api/predictions')
 
+# Output formats of streaming predictions
+STREAM_MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
 @predictions_bp.route('/<model_uuid>/predict', methods=['POST'])
 def predict(model_uuid: str):
     """
@@ -31,13 +52,28 @@ def predict(model_uuid: str):
         ]
     }
     
-    Returns:
+    Or column-oriented, without repeating feature names on every row:
+    {
+        "columns": {
+            "feature1": [value1, value2, ...],
+            "feature2": [value1, value2, ...]
+        }
+    }
+    
+    Or an Arrow IPC stream with Content-Type: application/vnd.apache.arrow.stream
+    
+    Query parameters:
+    - probabilities: "false" to skip class probabilities (default "true")
+    - precision: "float32" to round probabilities to single precision
+    
+    Returns (JSON, or MessagePack / Arrow IPC stream when asked for via Accept):
     {
         "success": true,
         "model_uuid": "string",
         "model_name": "string",
         "predictions": [value1, value2, ...],
         "probabilities": [[prob1, prob2], ...] // for classification only
+        "class_labels": [class1, class2] // for classification only
         "target_feature": "string"
     }
     """
@@ -46,33 +82,44 @@ def predict(model_uuid: str):
         if not validate_uuid(model_uuid):
             return jsonify({'error': 'Invalid UUID format'}), 400
         
-        # Validate request payload
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'Invalid JSON payload'}), 400
-        
-        validation_error = validate_prediction_request(data)
-        if validation_error:
-            return jsonify({'error': validation_error}), 400
+        response_mimetype = _negotiate_response_mimetype()
+        if response_mimetype is None:
+            return jsonify({
+                'error': f'Not acceptable. Supported formats: {available_response_mimetypes()}'
+            }), 406
         
-        prediction_data = data.get('data', [])
+        # Column-oriented payloads go straight into a DataFrame
+        prediction_columns, columns_error = _read_prediction_columns(max_samples=1000)
+        if columns_error:
+            return jsonify({'error': columns_error}), 400
         
-        if not prediction_data:
-            return jsonify({'error': 'No prediction data provided'}), 400
+        if prediction_columns is not None:
+            prediction_data = []
+        else:
+            # Validate request payload
+            data = request.get_json()
+            if not data:
+                return jsonify({'error': 'Invalid JSON payload'}), 400
+            
+            validation_error = validate_prediction_request(data)
+            if validation_error:
+                return jsonify({'error': validation_error}), 400
+            
+            prediction_data = data.get('data', [])
+            
+            if not prediction_data:
+                return jsonify({'error': 'No prediction data provided'}), 400
         
         # Get model service and make predictions
         model_service = get_model_service()
-        result = model_service.predict(model_uuid, prediction_data)
+        result = model_service.predict(model_uuid, prediction_data, _wants_probabilities(), prediction_columns)
         
         if result['success']:
-            logger.info(f"Prediction completed for model: {model_uuid}, {len(prediction_data)} samples")
-            return jsonify(result), 200
+            logger.info(f"Prediction completed for model: {model_uuid}, {_count_samples(prediction_data, prediction_columns)} samples")
+            return _prediction_response(result, response_mimetype)
         else:
             logger.error(f"Prediction failed for model {model_uuid}: {result['error']}")
-            return jsonify({
-                'success': False,
-                'error': result['error']
-            }), 400
+            return jsonify(result), 400
             
     except Exception as e:
         logger.error(f"Unexpected error in prediction for {model_uuid}: {str(e)}")
@@ -86,13 +133,31 @@ def predict_batch(model_uuid: str):
     Expected form data:
     - file: CSV file with prediction data
     
-    Or JSON payload similar to /predict but for larger datasets
+    Or JSON payload similar to /predict (rows or columns) but for larger datasets,
+    or an Arrow IPC stream with Content-Type: application/vnd.apache.arrow.stream
+    
+    Limited to 10,000 samples; use /predict/stream for larger files.
+    
+    Query parameters:
+    - probabilities: "false" to skip class probabilities (default "true")
+    - precision: "float32" to round probabilities to single precision
+    
+    The response format follows the Accept header, as for /predict.
     """
     try:
         # Validate UUID format
         if not validate_uuid(model_uuid):
             return jsonify({'error': 'Invalid UUID format'}), 400
         
+        response_mimetype = _negotiate_response_mimetype()
+        if response_mimetype is None:
+            return jsonify({
+                'error': f'Not acceptable. Supported formats: {available_response_mimetypes()}'
+            }), 406
+        
+        # Limit batch size for performance
+        max_batch_size = 10000
+        
         # Handle file upload
         if 'file' in request.files:
             file = request.files['file']
@@ -103,61 +168,153 @@ def predict_batch(model_uuid: str):
                 return jsonify({'error': 'Only CSV files are supported'}), 400
             
             try:
-                import pandas as pd
                 import io
                 
                 # Read CSV file
                 csv_content = file.read().decode('utf-8')
                 df = pd.read_csv(io.StringIO(csv_content))
                 
-                # Convert to list of dictionaries
-                prediction_data = df.to_dict('records')
+                # Keep the parsed columns as they are
+                prediction_data = []
+                prediction_columns = {column: df[column].values for column in df.columns}
                 
             except Exception as e:
                 return jsonify({'error': f'Error processing CSV file: {str(e)}'}), 400
         
-        # Handle JSON payload
+        # Handle Arrow IPC or JSON payload
         else:
-            data = request.get_json()
-            if not data:
-                return jsonify({'error': 'Invalid JSON payload or no file provided'}), 400
+            prediction_columns, columns_error = _read_prediction_columns(max_samples=max_batch_size)
+            if columns_error:
+                return jsonify({'error': columns_error}), 400
             
-            prediction_data = data.get('data', [])
+            if prediction_columns is not None:
+                prediction_data = []
+            else:
+                data = request.get_json()
+                if not data:
+                    return jsonify({'error': 'Invalid JSON payload or no file provided'}), 400
+                
+                prediction_data = data.get('data', [])
         
-        if not prediction_data:
+        sample_count = _count_samples(prediction_data, prediction_columns)
+        if sample_count == 0:
             return jsonify({'error': 'No prediction data provided'}), 400
         
-        # Limit batch size for performance
-        max_batch_size = 10000
-        if len(prediction_data) > max_batch_size:
+        if sample_count > max_batch_size:
             return jsonify({
                 'error': f'Batch size too large. Maximum {max_batch_size} samples allowed'
             }), 400
         
         # Get model service and make predictions
         model_service = get_model_service()
-        result = model_service.predict(model_uuid, prediction_data)
+        result = model_service.predict(model_uuid, prediction_data, _wants_probabilities(), prediction_columns)
         
         if result['success']:
-            logger.info(f"Batch prediction completed for model: {model_uuid}, {len(prediction_data)} samples")
+            logger.info(f"Batch prediction completed for model: {model_uuid}, {sample_count} samples")
             
             # Add batch processing information
             result['batch_info'] = {
-                'total_samples': len(prediction_data),
+                'total_samples': sample_count,
                 'processing_time': None  # Could add timing info
             }
             
-            return jsonify(result), 200
+            return _prediction_response(result, response_mimetype)
         else:
             logger.error(f"Batch prediction failed for model {model_uuid}: {result['error']}")
+            return jsonify(result), 400
+            
+    except Exception as e:
+        logger.error(f"Unexpected error in batch prediction for {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@predictions_bp.route('/<model_uuid>/predict/stream', methods=['POST'])
+@dataset_upload
+def predict_stream(model_uuid: str):
+    """
+    Make predictions over a file of any size, streaming the results back
+    
+    The file is read and scored in chunks of PREDICTION_STREAM_CHUNK_ROWS
+    rows, so memory use does not grow with the file size.
+    
+    Expected form data:
+    - file: CSV or Parquet file with prediction data
+    
+    Query parameters:
+    - format: "csv" (default) or "ndjson"
+    - probabilities: "false" to skip class probabilities (default "true")
+    
+    Returns:
+    One row per input row, in input order, with a "prediction" column and
+    a "probability_<class>" column per class for classification
+    """
+    spool_path = None
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        if 'file' not in request.files:
+            return jsonify({'error': 'No file provided'}), 400
+        
+        file = request.files['file']
+        if file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        
+        output_format = request.args.get('format', 'csv').lower()
+        if output_format not in STREAM_MIMETYPES:
+            return jsonify({'error': f"Invalid format. Must be one of: {list(STREAM_MIMETYPES)}"}), 400
+        
+        try:
+            get_dataset_format(file.filename)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Stream the upload to disk so it is never held in memory
+        spool_path, _, _, _ = spool_upload(file, current_app.config['UPLOADS_PATH'])
+        
+        model_service = get_model_service()
+        result = model_service.predict_stream(
+            model_uuid,
+            spool_path,
+            current_app.config['PREDICTION_STREAM_CHUNK_ROWS'],
+            _wants_probabilities()
+        )
+        
+        if not result['success']:
+            logger.error(f"Streaming prediction failed for model {model_uuid}: {result['error']}")
             return jsonify({
                 'success': False,
                 'error': result['error']
             }), 400
-            
+        
+        # Score the first chunk up front so bad input still gets an error status
+        chunks = result['predictions']
+        try:
+            first_chunk = next(chunks, None)
+        except SchemaValidationError as e:
+            return jsonify({
+                'error': f'Invalid input: {str(e)}',
+                'validation': e.report.to_dict()
+            }), 400
+        except Exception as e:
+            return jsonify({'error': f'Error processing file: {str(e)}'}), 400
+        
+        if first_chunk is None or first_chunk.empty:
+            return jsonify({'error': 'No prediction data provided'}), 400
+        
+        # The generator owns the spooled file from here on
+        body = _stream_predictions(model_uuid, itertools.chain([first_chunk], chunks), output_format, spool_path)
+        spool_path = None
+        
+        return Response(body, mimetype=STREAM_MIMETYPES[output_format])
+        
     except Exception as e:
-        logger.error(f"Unexpected error in batch prediction for {model_uuid}: {str(e)}")
+        logger.error(f"Unexpected error in streaming prediction for {model_uuid}: {str(e)}")
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+    
+    finally:
+        if spool_path and os.path.exists(spool_path):
+            os.remove(spool_path)
 
 @predictions_bp.route('/<model_uuid>/predict/sample', methods=['GET'])
 def get_prediction_sample(model_uuid: str):
@@ -169,39 +326,346 @@ def get_prediction_sample(model_uuid: str):
         if not validate_uuid(model_uuid):
             return jsonify({'error': 'Invalid UUID format'}), 400
         
-        model_service = get_model_service()
-        model = model_service.get_model_by_uuid(model_uuid)
+        # Feature columns from the manifest or the stored details, never the predictor
+        schema = get_model_service().get_prediction_schema(model_uuid)
         
-        if model is None:
+        if schema is None:
             return jsonify({'error': 'Model not found'}), 404
         
-        # Get feature columns
-        feature_columns = model.get('feature_columns', [])
+        model = schema['metadata']
+        manifest = schema['manifest']
+        features = schema['features']
+        feature_columns = [feature['name'] for feature in features]
         
         if not feature_columns:
             return jsonify({
                 'error': 'Feature information not available for this model'
             }), 400
         
-        # Create sample data structure
+        # Create sample data structure, using a training value for categorical features
         sample_data = {
             'data': [
-                {col: f'<{col}_value>' for col in feature_columns if col != model['target_feature']}
+                {
+                    feature['name']: feature['categories'][0] if feature['categories'] else f"<{feature['name']}_value>"
+                    for feature in features if feature['name'] != model.target_feature
+                }
             ]
         }
         
         return jsonify({
             'success': True,
             'model_uuid': model_uuid,
-            'model_name': model['name'],
-            'target_feature': model['target_feature'],
-            'required_features': [col for col in feature_columns if col != model['target_feature']],
+            'model_name': model.name,
+            'target_feature': model.target_feature,
+            'required_features': [col for col in feature_columns if col != model.target_feature],
+            'schema': manifest['features'] if manifest else None,
             'sample_request': sample_data,
             'example_curl': f"""curl -X POST {request.url_root}api/predictions/{model_uuid}/predict \\
   -H "Content-Type: application/json" \\
-  -d '{{"data": [{{{', '.join([f'"{col}": "value"' for col in feature_columns if col != model['target_feature']])}}}]}}'"""
+  -d '{{"data": [{{{', '.join([f'"{col}": "value"' for col in feature_columns if col != model.target_feature])}}}]}}'"""
         }), 200
         
     except Exception as e:
         logger.error(f"Error getting prediction sample for {model_uuid}: {str(e)}")
-        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
\ No newline at end of file
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@predictions_bp.route('/<model_uuid>/batching', methods=['GET', 'PUT'])
+def batching_config(model_uuid: str):
+    """
+    Get (GET) or update (PUT) the micro-batching settings of a model
+    
+    When enabled, concurrent /predict requests for the model are collected
+    for up to window_ms or max_rows and run as one inference.
+    
+    Expected JSON payload for PUT (all fields optional):
+    {
+        "enabled": bool,
+        "window_ms": float,
+        "max_rows": int
+    }
+    """
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        
+        if request.method == 'GET':
+            config = model_service.get_batching_config(model_uuid)
+        else:
+            data = request.get_json()
+            if not isinstance(data, dict):
+                return jsonify({'error': 'Invalid JSON payload'}), 400
+            
+            validation_error = validate_batching_config(data)
+            if validation_error:
+                return jsonify({'error': validation_error}), 400
+            
+            config = model_service.update_batching_config(model_uuid, data)
+        
+        if config is None:
+            return jsonify({'error': 'Model not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'model_uuid': model_uuid,
+            'batching': config
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error handling batching settings for {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@predictions_bp.route('/<model_uuid>/jobs', methods=['POST'])
+@dataset_upload
+def submit_scoring_job(model_uuid: str):
+    """
+    Submit an offline batch-scoring job
+    
+    The input is scored in the background and the predictions are written
+    to a Parquet file under the model directory.
+    
+    Expected form data:
+    - file: CSV or Parquet file with prediction data
+    
+    Or JSON payload with one of:
+    {
+        "datasetHash": "string",  // dataset in the dataset store
+        "inputPath": "string"     // file under SCORING_INPUT_PATH on the server
+    }
+    
+    Query parameters:
+    - probabilities: "false" to skip class probabilities (default "true")
+    """
+    spool_path = None
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        
+        # Handle file upload
+        if 'file' in request.files:
+            file = request.files['file']
+            if file.filename == '':
+                return jsonify({'error': 'No file selected'}), 400
+            
+            try:
+                get_dataset_format(file.filename)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            
+            spool_path, _, _, _ = spool_upload(file, current_app.config['UPLOADS_PATH'])
+            input_path, input_name = spool_path, file.filename
+        
+        # Handle JSON payload
+        else:
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                return jsonify({'error': 'Invalid JSON payload or no file provided'}), 400
+            
+            validation_error = validate_scoring_job_request(data)
+            if validation_error:
+                return jsonify({'error': validation_error}), 400
+            
+            if 'datasetHash' in data:
+                dataset = model_service.get_dataset(data['datasetHash'])
+                if dataset is None:
+                    return jsonify({'error': f"Dataset {data['datasetHash']} not found"}), 404
+                input_path, input_name = dataset.file_path, dataset.filename
+            else:
+                input_path = model_service.resolve_scoring_input(data['inputPath'])
+                if input_path is None:
+                    return jsonify({'error': f"Input file '{data['inputPath']}' not found"}), 404
+                input_name = data['inputPath']
+        
+        try:
+            result = model_service.submit_scoring_job(
+                model_uuid,
+                input_path,
+                input_name,
+                include_probabilities=_wants_probabilities(),
+                delete_input=spool_path is not None
+            )
+        except ValueError as e:
+            return jsonify({'error': f'Error reading input file: {str(e)}'}), 400
+        
+        if not result['success']:
+            return jsonify({
+                'success': False,
+                'error': result['error']
+            }), 400
+        
+        # The job owns the spooled upload from here on
+        spool_path = None
+        
+        logger.info(f"Scoring job {result['job']['job_id']} submitted for model: {model_uuid}")
+        return jsonify(result), 202
+        
+    except Exception as e:
+        logger.error(f"Unexpected error submitting scoring job for {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+    
+    finally:
+        if spool_path and os.path.exists(spool_path):
+            os.remove(spool_path)
+
+@predictions_bp.route('/<model_uuid>/jobs', methods=['GET'])
+def list_scoring_jobs(model_uuid: str):
+    """
+    List the batch-scoring jobs of a model, newest first
+    """
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        jobs = model_service.list_scoring_jobs(model_uuid)
+        
+        if jobs is None:
+            return jsonify({'error': 'Model not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'model_uuid': model_uuid,
+            'jobs': jobs,
+            'count': len(jobs)
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error listing scoring jobs for {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@predictions_bp.route('/<model_uuid>/jobs/<job_id>', methods=['GET'])
+def get_scoring_job(model_uuid: str, job_id: str):
+    """
+    Get the status and progress of a batch-scoring job
+    """
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid) or not validate_uuid(job_id):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        job = model_service.get_scoring_job(model_uuid, job_id)
+        
+        if job is None:
+            return jsonify({'error': 'Scoring job not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'job': job
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting scoring job {job_id}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@predictions_bp.route('/<model_uuid>/jobs/<job_id>/result', methods=['GET'])
+def download_scoring_result(model_uuid: str, job_id: str):
+    """
+    Download the Parquet predictions of a completed batch-scoring job
+    """
+    try:
+        # Validate UUID format
+        if not validate_uuid(model_uuid) or not validate_uuid(job_id):
+            return jsonify({'error': 'Invalid UUID format'}), 400
+        
+        model_service = get_model_service()
+        job = model_service.get_scoring_job(model_uuid, job_id)
+        
+        if job is None:
+            return jsonify({'error': 'Scoring job not found'}), 404
+        
+        result_path = model_service.get_scoring_result_path(model_uuid, job_id)
+        if result_path is None:
+            return jsonify({
+                'error': f"Scoring job is not completed. Status: {job['status']}"
+            }), 409
+        
+        return send_file(
+            result_path,
+            mimetype='application/vnd.apache.parquet',
+            as_attachment=True,
+            download_name=f'{job_id}.parquet'
+        )
+        
+    except Exception as e:
+        logger.error(f"Error downloading scoring result {job_id}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+def _stream_predictions(
+    model_uuid: str, 
+    chunks: Iterator[pd.DataFrame], 
+    output_format: str, 
+    spool_path: str
+) -> Iterator[str]:
+    """Encode prediction chunks as they are produced, removing the input file at the end"""
+    total_rows = 0
+    try:
+        for index, chunk in enumerate(chunks):
+            total_rows += len(chunk)
+            if output_format == 'csv':
+                yield chunk.to_csv(index=False, header=index == 0)
+            else:
+                yield chunk.to_json(orient='records', lines=True).rstrip('\n') + '\n'
+        
+        logger.info(f"Streaming prediction completed for model: {model_uuid}, {total_rows} samples")
+        
+    except Exception as e:
+        # The status line is already sent: end the stream with the error instead
+        logger.error(f"Streaming prediction failed for model {model_uuid} after {total_rows} samples: {str(e)}")
+        if output_format == 'ndjson':
+            yield json.dumps({'error': f'Prediction failed: {str(e)}'}) + '\n'
+    
+    finally:
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
+
+def _read_prediction_columns(max_samples: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Read column-oriented prediction data from an Arrow IPC stream or a
+    {"columns": {...}} JSON body
+    
+    Returns:
+        Tuple of (columns, or None for a row-oriented body, error message or None)
+    """
+    if request.mimetype == ARROW_STREAM_MIMETYPE:
+        try:
+            columns = read_arrow_stream(request.get_data())
+        except Exception as e:
+            return None, f'Invalid Arrow IPC stream: {str(e)}'
+    else:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or 'columns' not in data:
+            return None, None
+        columns = data['columns']
+    
+    validation_error = validate_prediction_columns(columns, max_samples)
+    if validation_error:
+        return None, validation_error
+    return columns, None
+
+def _count_samples(prediction_data: List[Dict[str, Any]], prediction_columns: Optional[Dict[str, Any]]) -> int:
+    """Count the samples of a row- or column-oriented payload"""
+    if prediction_columns:
+        return len(next(iter(prediction_columns.values())))
+    return len(prediction_data)
+
+def _negotiate_response_mimetype() -> Optional[str]:
+    """Pick the prediction response format from the Accept header (JSON by default)"""
+    if not request.accept_mimetypes:
+        return JSON_MIMETYPE
+    return request.accept_mimetypes.best_match(available_response_mimetypes())
+
+def _prediction_response(result: Dict[str, Any], mimetype: str) -> Response:
+    """Encode a successful prediction result in the negotiated format"""
+    float32 = request.args.get('precision', 'float64').lower() == 'float32'
+    return Response(encode_prediction_response(result, mimetype, float32), status=200, mimetype=mimetype)
+
+def _wants_probabilities() -> bool:
+    """Check if the client asked for class probabilities (the default)"""
+    return request.args.get('probabilities', 'true').lower() != 'false'
\ No newline at end of file
@@ -1,11 +1,17 @@
 # BE/app/routes/training_routes.py
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
+import json
 import logging
+import os
 from typing import Dict, Any
 
 from services.base import TrainingConfig, DatasetInfo, ProblemType
 from services.container import get_model_service
-from utils.request_validators import validate_training_request
+from utils.request_validators import validate_training_request, validate_training_config
+from utils.dataset_files import (
+    get_dataset_format, spool_upload, read_dataset_headers, count_dataset_rows
+)
+from utils.upload_limits import dataset_upload
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +20,11 @@ training_bp = Blueprint('training', __name__, url_prefix='/api/training')
 @training_bp.route('/train', methods=['POST'])
 def train_model():
     """
-    Train a new machine learning model
+    Submit a training job for a new machine learning model
+    
+    Training runs in a background worker process: the response is returned
+    as soon as the job is queued, and progress can be followed through
+    GET /api/training/status/<uuid>.
     
     Expected JSON payload:
     {
@@ -32,9 +42,18 @@ def train_model():
             "timeLimit": int,
             "evalMetric": "string (optional)",
             "presets": "best_quality|good_quality_faster|optimize_for_deployment",
-            "verbosity": int
+            "verbosity": int,
+            "optimizeForDeployment": bool (optional, default false),
+            "inferenceLimitMs": number (optional, per-row predict time budget)
         }
     }
+    
+    Instead of "dataset", a dataset already in the store can be referenced
+    with "datasetHash": "string" (SHA-256 of the original file or rows).
+    
+    A new "dataset" is stored by the training worker, not in the request:
+    the response's dataset_hash is then null, and the hash is recorded on
+    the model once the worker has stored it.
     """
     try:
         # Validate request
@@ -46,45 +65,101 @@ def train_model():
         if validation_error:
             return jsonify({'error': validation_error}), 400
         
+        model_service = get_model_service()
+        
         # Extract and parse dataset
         dataset_data = data.get('dataset')
-        dataset = DatasetInfo(
-            filename=dataset_data['filename'],
-            headers=dataset_data['headers'],
-            rows=dataset_data['rows'],
-            total_rows=dataset_data.get('total_rows', len(dataset_data['rows'])),
-            file_size=dataset_data.get('file_size', 0)
-        )
+        if dataset_data is None:
+            # Reuse a stored dataset, skipping upload and parsing
+            dataset = model_service.get_dataset(data['datasetHash'])
+            if dataset is None:
+                return jsonify({'error': 'Dataset not found'}), 404
+        else:
+            dataset = DatasetInfo(
+                filename=dataset_data['filename'],
+                headers=dataset_data['headers'],
+                rows=dataset_data['rows'],
+                total_rows=dataset_data.get('total_rows', len(dataset_data['rows'])),
+                file_size=dataset_data.get('file_size', 0)
+            )
         
         # Extract and parse training configuration
-        config_data = data.get('config')
-        config = TrainingConfig(
-            model_name=config_data['modelName'],
-            target_feature=config_data['targetFeature'],
-            problem_type=ProblemType(config_data.get('problemType', 'auto')),
-            time_limit=config_data.get('timeLimit', 600),
-            eval_metric=config_data.get('evalMetric'),
-            presets=config_data.get('presets', 'best_quality'),
-            verbosity=config_data.get('verbosity', 2)
+        config = _parse_training_config(data.get('config'))
+        
+        return _submit_training(dataset, config)
+            
+    except ValueError as e:
+        logger.warning(f"Validation error in training: {str(e)}")
+        return jsonify({'error': f'Validation error: {str(e)}'}), 400
+    
+    except Exception as e:
+        logger.error(f"Unexpected error in training: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@training_bp.route('/train/upload', methods=['POST'])
+@dataset_upload
+def train_model_upload():
+    """
+    Submit a training job with the dataset uploaded as a file
+    
+    The file is streamed to disk in chunks and hashed on the way. A file
+    already in the dataset store is not parsed again; otherwise the
+    training worker builds the DataFrame straight from it, so the dataset
+    is never parsed in the request or held in memory as JSON.
+    
+    Expected form data:
+    - file: CSV or Parquet file with the training dataset
+    - config: JSON string with the same fields as the /train "config" object
+    """
+    spool_path = None
+    
+    try:
+        if 'file' not in request.files:
+            return jsonify({'error': 'No file provided'}), 400
+        
+        file = request.files['file']
+        if file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        
+        try:
+            get_dataset_format(file.filename)
+            config_data = json.loads(request.form.get('config', ''))
+        except json.JSONDecodeError:
+            return jsonify({'error': "Missing or invalid 'config' JSON field"}), 400
+        
+        if not isinstance(config_data, dict):
+            return jsonify({'error': "'config' must be a JSON object"}), 400
+        
+        config_error = validate_training_config(config_data)
+        if config_error:
+            return jsonify({'error': f"Config validation error: {config_error}"}), 400
+        
+        # Stream the upload to disk
+        spool_path, file_size, line_count, dataset_hash = spool_upload(file, current_app.config['UPLOADS_PATH'])
+        
+        try:
+            headers = read_dataset_headers(spool_path)
+            total_rows = count_dataset_rows(spool_path, line_count)
+        except Exception as e:
+            return jsonify({'error': f'Error reading dataset file: {str(e)}'}), 400
+        
+        if config_data['targetFeature'] not in headers:
+            return jsonify({'error': f"Target feature '{config_data['targetFeature']}' not found in dataset headers"}), 400
+        
+        dataset = DatasetInfo(
+            filename=file.filename,
+            headers=headers,
+            rows=[],
+            total_rows=total_rows,
+            file_size=file_size,
+            file_path=spool_path,
+            dataset_hash=dataset_hash
         )
+        config = _parse_training_config(config_data)
         
-        # Get model service and start training
-        model_service = get_model_service()
-        result = model_service.train_model(dataset, config)
-        
-        if result['success']:
-            logger.info(f"Training started successfully for model: {result['model_uuid']}")
-            return jsonify({
-                'success': True,
-                'message': 'Model training completed successfully',
-                'data': result
-            }), 200
-        else:
-            logger.error(f"Training failed: {result['error']}")
-            return jsonify({
-                'success': False,
-                'error': result['error']
-            }), 500
+        # The training job owns the spooled file from here on and deletes it once stored
+        spool_path = None
+        return _submit_training(dataset, config)
             
     except ValueError as e:
         logger.warning(f"Validation error in training: {str(e)}")
@@ -93,6 +168,45 @@ def train_model():
     except Exception as e:
         logger.error(f"Unexpected error in training: {str(e)}")
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+    
+    finally:
+        # Uploads rejected before they were handed over to a training job
+        if spool_path and os.path.exists(spool_path):
+            os.remove(spool_path)
+
+def _parse_training_config(config_data: Dict[str, Any]) -> TrainingConfig:
+    """Build the training configuration from the request payload"""
+    return TrainingConfig(
+        model_name=config_data['modelName'],
+        target_feature=config_data['targetFeature'],
+        problem_type=ProblemType(config_data.get('problemType', 'auto')),
+        time_limit=config_data.get('timeLimit', 600),
+        eval_metric=config_data.get('evalMetric'),
+        presets=config_data.get('presets', 'best_quality'),
+        verbosity=config_data.get('verbosity', 2),
+        optimize_for_deployment=config_data.get('optimizeForDeployment', False),
+        inference_limit_ms=config_data.get('inferenceLimitMs')
+    )
+
+def _submit_training(dataset: DatasetInfo, config: TrainingConfig):
+    """Submit a training job and build the response"""
+    # Get model service and submit the training job
+    model_service = get_model_service()
+    result = model_service.train_model(dataset, config)
+    
+    if result['success']:
+        logger.info(f"Training started successfully for model: {result['model_uuid']}")
+        return jsonify({
+            'success': True,
+            'message': 'Model training started',
+            'data': result
+        }), 202
+    else:
+        logger.error(f"Training failed: {result['error']}")
+        return jsonify({
+            'success': False,
+            'error': result['error']
+        }), 500
 
 @training_bp.route('/status/<model_uuid>', methods=['GET'])
 def get_training_status(model_uuid: str):
@@ -109,9 +223,27 @@ def get_training_status(model_uuid: str):
         return jsonify({
             'success': True,
             'model_uuid': model_uuid,
-            'status': status
+            'status': status,
+            'job_state': model_service.get_training_job_state(model_uuid)
         }), 200
         
     except Exception as e:
         logger.error(f"Error getting training status for {model_uuid}: {str(e)}")
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+@training_bp.route('/resources', methods=['GET'])
+def get_training_resources():
+    """
+    Get the training resource budget and current usage
+    """
+    try:
+        model_service = get_model_service()
+        
+        return jsonify({
+            'success': True,
+            'resources': model_service.get_training_resources()
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error getting training resources: {str(e)}")
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
\ No newline at end of file
@@ -10,6 +10,17 @@ class ModelStatus(Enum):
     FAILED = "failed"
     DELETED = "deleted"
 
+class ScoringJobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class WarmupState(Enum):
+    PENDING = "pending"
+    WARMING_UP = "warming_up"
+    READY = "ready"
+
 class ProblemType(Enum):
     REGRESSION = "regression"
     BINARY = "binary"
@@ -27,6 +38,16 @@ class TrainingConfig:
     presets: str = "best_quality"
     verbosity: int = 2
     
+    # Resources reserved by the training scheduler (None lets AutoGluon use the whole machine)
+    num_cpus: Optional[int] = None
+    memory_limit_gb: Optional[float] = None
+    
+    # Refit the best model on all data and clone a lean copy of it for serving
+    optimize_for_deployment: bool = False
+    
+    # Per-row predict time budget of the serving model (None serves the best-scoring model)
+    inference_limit_ms: Optional[float] = None
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             'model_name': self.model_name,
@@ -35,7 +56,11 @@ class TrainingConfig:
             'time_limit': self.time_limit,
             'eval_metric': self.eval_metric,
             'presets': self.presets,
-            'verbosity': self.verbosity
+            'verbosity': self.verbosity,
+            'num_cpus': self.num_cpus,
+            'memory_limit_gb': self.memory_limit_gb,
+            'optimize_for_deployment': self.optimize_for_deployment,
+            'inference_limit_ms': self.inference_limit_ms
         }
 
 @dataclass
@@ -46,6 +71,8 @@ class DatasetInfo:
     rows: List[List[Any]]
     total_rows: int
     file_size: int
+    file_path: Optional[str] = None  # Uploaded CSV/Parquet file, used instead of rows
+    dataset_hash: Optional[str] = None  # Content hash in the dataset store
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -53,7 +80,9 @@ class DatasetInfo:
             'headers': self.headers,
             'rows': self.rows,
             'total_rows': self.total_rows,
-            'file_size': self.file_size
+            'file_size': self.file_size,
+            'file_path': self.file_path,
+            'dataset_hash': self.dataset_hash
         }
 
 @dataclass
@@ -65,6 +94,10 @@ class TrainingResult:
     best_model_name: Optional[str] = None
     best_score: Optional[float] = None
     leaderboard: Optional[List[Dict]] = None
+    eval_metric: Optional[str] = None
+    feature_columns: Optional[List[str]] = None
+    feature_importance: Optional[Dict[str, Dict[str, Any]]] = None
+    deployment: Optional[Dict[str, Any]] = None  # Deployment artifact name, sizes and latencies
     error_message: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -75,6 +108,10 @@ class TrainingResult:
             'best_model_name': self.best_model_name,
             'best_score': self.best_score,
             'leaderboard': self.leaderboard,
+            'eval_metric': self.eval_metric,
+            'feature_columns': self.feature_columns,
+            'feature_importance': self.feature_importance,
+            'deployment': self.deployment,
             'error_message': self.error_message
         }
 
@@ -83,19 +120,81 @@ class PredictionRequest:
     """Request for model prediction"""
     model_uuid: str
     data: List[Dict[str, Any]]
+    include_probabilities: bool = True
+    columns: Optional[Dict[str, Any]] = None  # Column arrays, used instead of data
+    
+    @property
+    def num_rows(self) -> int:
+        if self.columns:
+            return len(next(iter(self.columns.values())))
+        return len(self.data)
     
 @dataclass
 class PredictionResult:
     """Result of model prediction"""
     success: bool
-    predictions: Optional[List[Any]] = None
-    probabilities: Optional[List[List[float]]] = None
+    predictions: Optional[Any] = None  # NumPy array, one value per sample
+    probabilities: Optional[Any] = None  # NumPy array, one row per sample and one column per class
+    class_labels: Optional[List[Any]] = None  # Classes of the probability columns
     error_message: Optional[str] = None
+    validation: Optional[Dict[str, Any]] = None  # Schema validation report of rejected input
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             'success': self.success,
             'predictions': self.predictions,
             'probabilities': self.probabilities,
-            'error_message': self.error_message
-        }
\ No newline at end of file
+            'class_labels': self.class_labels,
+            'error_message': self.error_message,
+            'validation': self.validation
+        }
+
+@dataclass
+class ScoringJob:
+    """Offline batch-scoring job writing predictions to a Parquet file"""
+    job_id: str
+    model_uuid: str
+    input_name: str
+    status: ScoringJobStatus = ScoringJobStatus.QUEUED
+    include_probabilities: bool = True
+    total_rows: Optional[int] = None
+    processed_rows: int = 0
+    result_size: Optional[int] = None
+    error_message: Optional[str] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'model_uuid': self.model_uuid,
+            'input_name': self.input_name,
+            'status': self.status.value,
+            'include_probabilities': self.include_probabilities,
+            'total_rows': self.total_rows,
+            'processed_rows': self.processed_rows,
+            'progress': round(self.processed_rows / self.total_rows, 4) if self.total_rows else None,
+            'result_size': self.result_size,
+            'error_message': self.error_message,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScoringJob':
+        return cls(
+            job_id=data['job_id'],
+            model_uuid=data['model_uuid'],
+            input_name=data['input_name'],
+            status=ScoringJobStatus(data['status']),
+            include_probabilities=data.get('include_probabilities', True),
+            total_rows=data.get('total_rows'),
+            processed_rows=data.get('processed_rows', 0),
+            result_size=data.get('result_size'),
+            error_message=data.get('error_message'),
+            created_at=data.get('created_at'),
+            started_at=data.get('started_at'),
+            completed_at=data.get('completed_at')
+        )
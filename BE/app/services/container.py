@@ -24,25 +24,130 @@ class ServiceContainer:
             from services.ml_service import AutoGluonMLService
             from repositories.model_repository import ModelRepository
             from services.model_service import ModelService
+            from services.training_queue import TrainingJobQueue
+            from services.training_scheduler import TrainingScheduler
+            from services.dataset_store import DatasetStore
+            from services.prediction_batcher import PredictionBatcher, BatchingConfig
+            from services.scoring_jobs import ScoringJobManager
+            from services.model_reconciler import ModelReconciler
+            from services.warmup import ModelWarmup
             
             # Initialize ML Service
             ml_service_config = config.get('ml_service', {})
             models_path = ml_service_config.get('models_path', 'models_output')
             
-            ml_service = AutoGluonMLService(models_base_path=models_path)
+            ml_service = AutoGluonMLService(
+                models_base_path=models_path,
+                cache_max_memory_mb=ml_service_config.get('cache_max_memory_mb', 2048),
+                pinned_models=ml_service_config.get('pinned_models', []),
+                serve_deployment_artifacts=ml_service_config.get('serve_deployment_artifacts', True)
+            )
             self.register_singleton('ml_service', ml_service)
             
+            archive_after_days = ml_service_config.get('archive_after_days', 0)
+            if archive_after_days > 0:
+                ml_service.storage.start_sweeper(
+                    interval_seconds=ml_service_config.get('archive_sweep_hours', 6) * 3600,
+                    older_than_days=archive_after_days
+                )
+            
             # Initialize Repository
             model_repository = ModelRepository()
+            model_repository.metadata_cache.configure(
+                ttl_seconds=config.get('model_repository', {}).get('metadata_cache_ttl', 30.0)
+            )
             self.register_singleton('model_repository', model_repository)
             
+            # Initialize Dataset Store
+            dataset_store_config = config.get('dataset_store', {})
+            dataset_store = DatasetStore(
+                datasets_path=dataset_store_config.get(
+                    'datasets_path', str(ml_service.models_base_path.parent / 'datasets')
+                )
+            )
+            self.register_singleton('dataset_store', dataset_store)
+            
+            # Initialize Training Job Queue (workers store new datasets in the dataset store)
+            training_queue_config = config.get('training_queue', {})
+            max_workers = training_queue_config.get('max_workers', 2)
+            training_scheduler = TrainingScheduler.from_config(
+                cpu_budget=training_queue_config.get('cpu_budget', 0),
+                memory_budget_gb=training_queue_config.get('memory_budget_gb', 0),
+                max_concurrent_jobs=max_workers
+            )
+            training_queue = TrainingJobQueue(
+                app=training_queue_config.get('app'),
+                models_path=str(ml_service.models_base_path),
+                datasets_path=str(dataset_store.datasets_path),
+                max_workers=max_workers,
+                scheduler=training_scheduler,
+                heartbeat_seconds=training_queue_config.get('heartbeat_seconds', 60)
+            )
+            self.register_singleton('training_queue', training_queue)
+            
+            # Initialize Prediction Batcher
+            batcher_config = config.get('prediction_batcher', {})
+            prediction_batcher = PredictionBatcher(
+                ml_service=ml_service,
+                default_config=BatchingConfig(
+                    enabled=batcher_config.get('enabled', False),
+                    window_ms=batcher_config.get('window_ms', 5.0),
+                    max_rows=batcher_config.get('max_rows', 512)
+                )
+            )
+            self.register_singleton('prediction_batcher', prediction_batcher)
+            
+            # Initialize Scoring Job Manager
+            scoring_config = config.get('scoring_jobs', {})
+            scoring_jobs = ScoringJobManager(
+                ml_service=ml_service,
+                input_base_path=scoring_config.get(
+                    'input_path', str(ml_service.models_base_path.parent / 'scoring_inputs')
+                ),
+                max_workers=scoring_config.get('max_workers', 1),
+                chunk_rows=scoring_config.get('chunk_rows', 50000)
+            )
+            self.register_singleton('scoring_jobs', scoring_jobs)
+            
+            # Initialize Model Reconciler (needs the app to reach the database from its thread)
+            model_reconciler = None
+            gc_config = config.get('model_gc', {})
+            if training_queue_config.get('app') is not None:
+                model_reconciler = ModelReconciler(
+                    app=training_queue_config['app'],
+                    ml_service=ml_service,
+                    model_repository=model_repository,
+                    grace_seconds=gc_config.get('grace_minutes', 30) * 60,
+                    io_bytes_per_second=gc_config.get('io_mb_per_second', 50) * 1024 * 1024,
+                    files_per_second=gc_config.get('files_per_second', 500)
+                )
+                if gc_config.get('interval_minutes', 0) > 0:
+                    model_reconciler.start(gc_config['interval_minutes'] * 60)
+                self.register_singleton('model_reconciler', model_reconciler)
+            
             # Initialize Model Service
             model_service = ModelService(
                 ml_service=ml_service,
-                model_repository=model_repository
+                model_repository=model_repository,
+                training_queue=training_queue,
+                dataset_store=dataset_store,
+                prediction_batcher=prediction_batcher,
+                scoring_jobs=scoring_jobs,
+                model_reconciler=model_reconciler
             )
             self.register_singleton('model_service', model_service)
             
+            # Warm up in the background: import AutoGluon and preload hot models
+            warmup_config = config.get('warmup', {})
+            model_warmup = ModelWarmup(
+                ml_service=ml_service,
+                preload_models=warmup_config.get('preload_models', []),
+                preload_top_n=warmup_config.get('preload_top_n', 0),
+                enabled=warmup_config.get('enabled', True)
+            )
+            model_warmup.start()
+            self.register_singleton('model_warmup', model_warmup)
+            
             self._initialized = True
             logger.info("Service container initialized successfully")
             
@@ -84,6 +189,14 @@ class ServiceContainer:
         """Get the model repository instance"""
         return self.get('model_repository')
     
+    def get_training_queue(self):
+        """Get the training job queue instance"""
+        return self.get('training_queue')
+    
+    def get_model_warmup(self):
+        """Get the startup warm-up instance"""
+        return self.get('model_warmup')
+    
     def clear(self) -> None:
         """Clear all registered services"""
         self._services.clear()
@@ -112,4 +225,12 @@ def get_ml_service():
 
 def get_model_repository():
     """Convenience function to get model repository"""
-    return _container.get_model_repository()
\ No newline at end of file
+    return _container.get_model_repository()
+
+def get_training_queue():
+    """Convenience function to get training job queue"""
+    return _container.get_training_queue()
+
+def get_model_warmup():
+    """Convenience function to get startup warm-up"""
+    return _container.get_model_warmup()
\ No newline at end of file
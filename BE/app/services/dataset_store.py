@@ -0,0 +1,178 @@
+# BE/app/services/dataset_store.py
+import hashlib
+import json
+import logging
+import os
+import re
+import uuid
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import pandas as pd
+
+from services.base import DatasetInfo
+from utils.dataset_files import read_dataset_file, UPLOAD_CHUNK_SIZE
+from utils.dataframe_utils import optimize_dtypes
+
+logger = logging.getLogger(__name__)
+
+DATASET_HASH_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+class DatasetStore:
+    """
+    Content-addressed store of training datasets
+
+    Every dataset is parsed once and kept as Parquet under the SHA-256 of
+    its source content, so retraining on the same data reuses the stored
+    file instead of uploading and parsing it again.
+    """
+
+    def __init__(self, datasets_path: str):
+        self.datasets_path = Path(datasets_path)
+        self.datasets_path.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Dataset store path set to: {self.datasets_path}")
+
+    @staticmethod
+    def compute_hash(dataset: DatasetInfo) -> str:
+        """Compute the content hash of an incoming dataset"""
+        digest = hashlib.sha256()
+
+        if dataset.file_path:
+            with open(dataset.file_path, 'rb') as source:
+                for chunk in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        else:
+            payload = json.dumps([dataset.headers, dataset.rows], separators=(',', ':'), default=str)
+            digest.update(payload.encode('utf-8'))
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def is_valid_hash(dataset_hash: str) -> bool:
+        """Check the format of a dataset hash"""
+        return bool(DATASET_HASH_PATTERN.match(dataset_hash or ''))
+
+    def exists(self, dataset_hash: str) -> bool:
+        """Check if a dataset is stored"""
+        return self.is_valid_hash(dataset_hash) and self._data_path(dataset_hash).exists()
+
+    def is_stored_file(self, file_path: str) -> bool:
+        """Check whether a file belongs to the store (rather than being an upload)"""
+        return Path(file_path).resolve().parent == self.datasets_path.resolve()
+
+    def ingest(self, dataset: DatasetInfo) -> DatasetInfo:
+        """
+        Store an incoming dataset unless its content is already stored
+
+        Returns the dataset pointing at the stored Parquet file.
+        """
+        dataset_hash = dataset.dataset_hash or self.compute_hash(dataset)
+
+        if self.exists(dataset_hash):
+            logger.info(f"Dataset {dataset_hash} already stored, skipping parse")
+        else:
+            df = self._load_dataframe(dataset)
+            self._write(dataset_hash, df, {
+                'dataset_hash': dataset_hash,
+                'filename': dataset.filename,
+                'headers': list(df.columns),
+                'total_rows': len(df),
+                'source_size': dataset.file_size,
+                'created_at': datetime.utcnow().isoformat()
+            })
+            logger.info(f"Dataset {dataset_hash} stored ({len(df)} rows)")
+
+        stored = self.get(dataset_hash)
+        return replace(stored, filename=dataset.filename)
+
+    def get(self, dataset_hash: str) -> Optional[DatasetInfo]:
+        """Get a stored dataset by hash"""
+        metadata = self.get_metadata(dataset_hash)
+        if metadata is None:
+            return None
+
+        return DatasetInfo(
+            filename=metadata['filename'],
+            headers=metadata['headers'],
+            rows=[],
+            total_rows=metadata['total_rows'],
+            file_size=metadata['source_size'],
+            file_path=str(self._data_path(dataset_hash)),
+            dataset_hash=dataset_hash
+        )
+
+    def get_metadata(self, dataset_hash: str) -> Optional[Dict[str, Any]]:
+        """Get the metadata of a stored dataset"""
+        if not self.exists(dataset_hash):
+            return None
+
+        try:
+            with open(self._metadata_path(dataset_hash), 'r') as metadata_file:
+                metadata = json.load(metadata_file)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read metadata of dataset {dataset_hash}: {str(e)}")
+            return None
+
+        metadata['stored_size'] = self._data_path(dataset_hash).stat().st_size
+        return metadata
+
+    def delete(self, dataset_hash: str) -> bool:
+        """Delete a stored dataset"""
+        if not self.is_valid_hash(dataset_hash):
+            return False
+
+        deleted = False
+        for path in (self._data_path(dataset_hash), self._metadata_path(dataset_hash)):
+            if path.exists():
+                path.unlink()
+                deleted = True
+
+        if deleted:
+            logger.info(f"Dataset {dataset_hash} deleted")
+        return deleted
+
+    def _load_dataframe(self, dataset: DatasetInfo) -> pd.DataFrame:
+        """Parse an incoming dataset into a typed DataFrame"""
+        if dataset.file_path:
+            df = read_dataset_file(dataset.file_path)
+        else:
+            df = pd.DataFrame(dataset.rows, columns=dataset.headers)
+
+        df.columns = df.columns.str.strip()
+        df = optimize_dtypes(df)
+
+        # Parquet needs one type per column: store mixed-type columns as text
+        for column in df.columns:
+            if df[column].dtype == object and pd.api.types.infer_dtype(df[column], skipna=True) not in ('string', 'empty'):
+                df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+
+        return df
+
+    def _write(self, dataset_hash: str, df: pd.DataFrame, metadata: Dict[str, Any]) -> None:
+        """Write a dataset and its metadata, replacing files atomically"""
+        data_path = self._data_path(dataset_hash)
+        metadata_path = self._metadata_path(dataset_hash)
+        suffix = f".{uuid.uuid4().hex}.tmp"
+
+        data_tmp = data_path.with_name(data_path.name + suffix)
+        metadata_tmp = metadata_path.with_name(metadata_path.name + suffix)
+
+        try:
+            df.to_parquet(data_tmp, index=False)
+            with open(metadata_tmp, 'w') as metadata_file:
+                json.dump(metadata, metadata_file)
+
+            # Metadata first: a visible data file always has its metadata
+            os.replace(metadata_tmp, metadata_path)
+            os.replace(data_tmp, data_path)
+        finally:
+            data_tmp.unlink(missing_ok=True)
+            metadata_tmp.unlink(missing_ok=True)
+
+    def _data_path(self, dataset_hash: str) -> Path:
+        return self.datasets_path / f"{dataset_hash}.parquet"
+
+    def _metadata_path(self, dataset_hash: str) -> Path:
+        return self.datasets_path / f"{dataset_hash}.json"
@@ -1,13 +1,23 @@
 # BE/app/services/interfaces.py
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, Optional
+from pathlib import Path
 from services.base import TrainingConfig, DatasetInfo, TrainingResult, PredictionRequest, PredictionResult
 
 class IMLService(ABC):
     """Interface for ML service"""
     
     @abstractmethod
-    def train_model(self, dataset: DatasetInfo, config: TrainingConfig) -> TrainingResult:
+    def get_model_path(self, model_uuid: str) -> Path:
+        pass
+    
+    @abstractmethod
+    def train_model(
+        self, 
+        dataset: DatasetInfo, 
+        config: TrainingConfig, 
+        model_uuid: Optional[str] = None
+    ) -> TrainingResult:
         pass
     
     @abstractmethod
@@ -18,10 +28,47 @@ class IMLService(ABC):
     def predict(self, request: PredictionRequest) -> PredictionResult:
         pass
     
+    @abstractmethod
+    def predict_chunks(
+        self, 
+        model_uuid: str, 
+        chunks: Iterable[Any], 
+        include_probabilities: bool = True
+    ) -> Iterator[Any]:
+        pass
+    
     @abstractmethod
     def get_model_info(self, model_path: str) -> Optional[Dict[str, Any]]:
         pass
     
+    @abstractmethod
+    def get_model_manifest(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        pass
+    
     @abstractmethod
     def delete_model(self, model_uuid: str) -> bool:
+        pass
+    
+    @abstractmethod
+    def preload_model(self, model_uuid: str) -> bool:
+        pass
+    
+    @abstractmethod
+    def pin_model(self, model_uuid: str) -> None:
+        pass
+    
+    @abstractmethod
+    def unpin_model(self, model_uuid: str) -> None:
+        pass
+    
+    @abstractmethod
+    def get_cache_stats(self) -> Dict[str, Any]:
+        pass
+    
+    @abstractmethod
+    def get_storage_usage(self, model_uuid: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        pass
+    
+    @abstractmethod
+    def archive_idle_models(self, older_than_days: float) -> Dict[str, Any]:
         pass
\ No newline at end of file
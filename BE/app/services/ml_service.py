@@ -1,8 +1,11 @@
 # BE/app/services/ml_service.py
+import json
 import os
 import pandas as pd
 import shutil
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 import uuid
 import logging
@@ -13,6 +16,21 @@ from services.base import (
     PredictionRequest, PredictionResult, ProblemType
 )
 from services.interfaces import IMLService
+from services.model_cache import PredictorCache, estimate_predictor_size
+from services.model_deployment import build_deployment_artifact, deployment_artifact_path
+from services.model_selection import measure_predict_times, select_model_within_budget
+from services.model_layout import INDEX_FILENAME, ModelIndex, resolve_model_path
+from services.model_storage import ModelStorageManager
+from services.model_manifest import (
+    build_model_manifest, write_model_manifest, read_model_manifest, forget_model_manifest
+)
+from services.schema_validator import SchemaValidator, SchemaValidationError
+from utils.dataset_files import read_dataset_file
+from utils.dataframe_utils import optimize_dtypes, build_prediction_frame
+
+# Bounds of the feature importance computed when training completes
+FEATURE_IMPORTANCE_SUBSAMPLE_SIZE = 1000
+FEATURE_IMPORTANCE_TIME_LIMIT = 120  # seconds
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,7 +39,13 @@ logger = logging.getLogger(__name__)
 class AutoGluonMLService(IMLService):
     """AutoGluon implementation of ML service"""
     
-    def __init__(self, models_base_path: str = "models_output"):
+    def __init__(
+        self, 
+        models_base_path: str = "models_output", 
+        cache_max_memory_mb: int = 2048, 
+        pinned_models: Optional[List[str]] = None,
+        serve_deployment_artifacts: bool = True
+    ):
         # Make sure the path is relative to the project root (where run.py is)
         import os
         if not os.path.isabs(models_base_path):
@@ -36,14 +60,49 @@ class AutoGluonMLService(IMLService):
         
         self.models_base_path = Path(models_base_path)
         self.models_base_path.mkdir(exist_ok=True)
-        self._loaded_models: Dict[str, Any] = {}  # Use Any to avoid import issues
+        self.serve_deployment_artifacts = serve_deployment_artifacts
+        self._model_cache = PredictorCache(
+            max_memory_bytes=cache_max_memory_mb * 1024 * 1024,
+            pinned=pinned_models or [],
+            # Other processes may archive a model once no process holds it
+            on_remove=lambda model_uuid: self.storage.release(model_uuid)
+        )
+        
+        # Loads in progress, shared by concurrent callers of the same model
+        self._loading: Dict[str, Future] = {}
+        self._loading_lock = threading.Lock()
+        
+        # Input validators compiled from model manifests, with the manifest they came from
+        self._schema_validators: Dict[str, Tuple[Dict[str, Any], SchemaValidator]] = {}
+        
+        # Hot and cold (archived) storage tiers of model artifacts
+        self.model_index = ModelIndex(self.models_base_path / INDEX_FILENAME)
+        self.storage = ModelStorageManager(
+            self.models_base_path,
+            self.get_model_path,
+            self.model_index,
+            is_in_use=self._is_model_in_use
+        )
         
         # Debug logging
         import logging
         logger = logging.getLogger(__name__)
         logger.info(f"Models base path set to: {self.models_base_path}")
     
-    def train_model(self, dataset: DatasetInfo, config: TrainingConfig) -> TrainingResult:
+    def get_model_path(self, model_uuid: str) -> Path:
+        """Get the directory where a model's artifacts are stored (sharded by UUID prefix)"""
+        return resolve_model_path(self.models_base_path, model_uuid)
+    
+    def get_serving_path(self, model_uuid: str) -> Path:
+        """Get the artifacts predictions are served from: the deployment copy if there is one"""
+        return self._resolve_serving_path(self.get_model_path(model_uuid))
+    
+    def train_model(
+        self, 
+        dataset: DatasetInfo, 
+        config: TrainingConfig, 
+        model_uuid: Optional[str] = None
+    ) -> TrainingResult:
         """Train a model using AutoGluon"""
         try:
             # Import AutoGluon only when needed
@@ -55,17 +114,17 @@ class AutoGluonMLService(IMLService):
                 error_message="AutoGluon not installed. Please install with: pip install autogluon"
             )
         
-        model_uuid = str(uuid.uuid4())
-        model_dir = self.models_base_path / model_uuid
+        model_uuid = model_uuid or str(uuid.uuid4())
+        model_dir = self.get_model_path(model_uuid)
         
         try:
             # Create model directory
-            model_dir.mkdir(exist_ok=True)
+            model_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Starting training for model {model_uuid}")
             logger.info(f"Model will be saved to: {model_dir}")
             
             # Convert data to DataFrame
-            df = self._prepare_dataframe(dataset)
+            df = self._prepare_dataframe(dataset, label=config.target_feature)
             
             # Validate target column
             if config.target_feature not in df.columns:
@@ -80,21 +139,35 @@ class AutoGluonMLService(IMLService):
             # Perform training
             predictor.fit(
                 train_data=df,
-                time_limit=config.time_limit,
-                presets=config.presets,
-                verbosity=config.verbosity
+                **self._build_fit_config(config)
             )
             
             # Verify the model was saved
             if not model_dir.exists():
                 raise Exception(f"Model directory was not created: {model_dir}")
             
-            # Get training results
-            leaderboard = predictor.leaderboard(silent=True)
-            best_model = leaderboard.iloc[0]
+            # Serving model: the best-scoring one, within the latency budget if there is one.
+            # Timing every model is only worth it for a budget (deployment builds time their own artifacts)
+            predict_times = None
+            if config.inference_limit_ms:
+                predict_times = self._measure_predict_times(predictor, df.drop(columns=[config.target_feature]))
+                self._apply_latency_budget(predictor, predict_times, config.inference_limit_ms)
+            
+            # Get training results, computed once so model details never need the predictor
+            metadata = self._collect_model_metadata(predictor, fallback_data=df, predict_times=predict_times)
+            
+            # Input schema for endpoints that must not load the predictor
+            write_model_manifest(model_dir, build_model_manifest(predictor, df))
+            best_model = next(
+                (entry for entry in metadata['leaderboard'] if entry['model'] == predictor.model_best),
+                metadata['leaderboard'][0]
+            )
             
-            # Cache the trained model
-            self._loaded_models[model_uuid] = predictor
+            # Optional lean copy for serving; the full artifact is served if it fails
+            deployment = None
+            if config.optimize_for_deployment:
+                deployment = self._optimize_for_deployment(predictor, model_dir, df, config.target_feature)
+            self.storage.register(model_uuid)
             
             logger.info(f"Training completed successfully for model {model_uuid}")
             logger.info(f"Model saved to: {model_dir}")
@@ -105,7 +178,11 @@ class AutoGluonMLService(IMLService):
                 model_path=str(model_dir),
                 best_model_name=str(best_model['model']),
                 best_score=float(best_model['score_val']),
-                leaderboard=leaderboard.head(5).to_dict('records')
+                leaderboard=metadata['leaderboard'],
+                eval_metric=metadata['eval_metric'],
+                feature_columns=metadata['feature_columns'],
+                feature_importance=metadata['feature_importance'],
+                deployment=deployment
             )
             
         except Exception as e:
@@ -120,84 +197,99 @@ class AutoGluonMLService(IMLService):
                 error_message=f"Training failed: {str(e)}"
             )
     
-    def load_model(self, model_path: str) -> bool:
-        """Load a trained model"""
+    def _measure_predict_times(self, predictor: Any, sample: pd.DataFrame) -> Dict[str, float]:
+        """Measure the per-row predict time of every model, empty if it cannot be measured"""
         try:
-            from autogluon.tabular import TabularPredictor
-        except ImportError:
-            logger.error("AutoGluon not installed")
-            return False
-            
+            return measure_predict_times(predictor, sample)
+        except Exception as e:
+            logger.warning(f"Could not measure predict times for {predictor.path}: {str(e)}")
+            return {}
+    
+    def _apply_latency_budget(self, predictor: Any, predict_times: Dict[str, float], limit_ms: float) -> None:
+        """Make the best-scoring model within the per-row budget the one predictions use"""
+        leaderboard = predictor.leaderboard(silent=True).to_dict(orient='records')
+        model_name, within_budget = select_model_within_budget(leaderboard, predict_times, limit_ms)
+        if model_name is None:
+            logger.warning(f"No predict times measured, keeping best model {predictor.model_best}")
+            return
+        
+        if not within_budget:
+            logger.warning(
+                f"No model predicts within {limit_ms} ms per row, using the fastest: "
+                f"{model_name} ({predict_times[model_name]} ms)"
+            )
+        elif model_name != predictor.model_best:
+            logger.info(
+                f"Best model {predictor.model_best} takes {predict_times.get(predictor.model_best)} ms per row, "
+                f"using {model_name} ({predict_times[model_name]} ms) to stay within {limit_ms} ms"
+            )
+        
+        predictor.set_model_best(model_name, save_trainer=True)
+    
+    def _optimize_for_deployment(
+        self, 
+        predictor: Any, 
+        model_dir: Path, 
+        df: pd.DataFrame, 
+        label: str
+    ) -> Optional[Dict[str, Any]]:
+        """Build the deployment copy of a freshly trained predictor, None if it fails"""
         try:
-            model_path_obj = Path(model_path)
-            logger.info(f"Attempting to load model from: {model_path_obj}")
-            
-            if not model_path_obj.exists():
-                logger.error(f"Model path does not exist: {model_path}")
-                # List what's actually in the models directory
-                if self.models_base_path.exists():
-                    logger.info(f"Available models in {self.models_base_path}:")
-                    for item in self.models_base_path.iterdir():
-                        logger.info(f"  - {item.name}")
-                else:
-                    logger.error(f"Models base path does not exist: {self.models_base_path}")
-                return False
-            
-            # Extract model UUID from path
-            model_uuid = model_path_obj.name
-            
-            # Check if already loaded
-            if model_uuid in self._loaded_models:
-                logger.info(f"Model {model_uuid} already loaded in cache")
-                return True
-            
-            # Load the model
-            predictor = TabularPredictor.load(model_path)
-            self._loaded_models[model_uuid] = predictor
-            
-            logger.info(f"Model {model_uuid} loaded successfully from {model_path}")
-            return True
-            
+            deployment = build_deployment_artifact(predictor, model_dir, df.drop(columns=[label]))
         except Exception as e:
-            logger.error(f"Failed to load model from {model_path}: {str(e)}")
-            return False
+            logger.warning(f"Deployment optimization failed for {model_dir.name}, serving the full artifact: {str(e)}")
+            return None
+        
+        logger.info(
+            f"Deployment artifact of {model_dir.name}: {deployment['deployment_model_name']}, "
+            f"{deployment['full_artifact_bytes']} -> {deployment['deployment_artifact_bytes']} bytes, "
+            f"{deployment['full_latency_ms']} -> {deployment['deployment_latency_ms']} ms per row"
+        )
+        return deployment
+    
+    def load_model(self, model_path: str) -> bool:
+        """Load a trained model, rehydrating it first if it is archived"""
+        # Check if already loaded
+        model_uuid = Path(model_path).name
+        if model_uuid in self._model_cache:
+            logger.info(f"Model {model_uuid} already loaded in cache")
+            return True
+        
+        return self._get_predictor(model_uuid, model_path) is not None
     
     def predict(self, request: PredictionRequest) -> PredictionResult:
         """Make predictions using a trained model"""
         try:
             # Load model if not cached
-            if request.model_uuid not in self._loaded_models:
-                model_path = self.models_base_path / request.model_uuid
-                if not self.load_model(str(model_path)):
-                    return PredictionResult(
-                        success=False,
-                        error_message=f"Failed to load model {request.model_uuid}"
-                    )
-            
-            predictor = self._loaded_models[request.model_uuid]
+            predictor = self._get_predictor(request.model_uuid)
+            if predictor is None:
+                return PredictionResult(
+                    success=False,
+                    error_message=f"Failed to load model {request.model_uuid}"
+                )
             
-            # Prepare data for prediction
-            df = pd.DataFrame(request.data)
+            # Prepare data for prediction, checked against the training schema
+            df = self._validate_input(request.model_uuid, build_prediction_frame(request))
             
             # Make predictions
-            predictions = predictor.predict(df)
-            
-            # Get prediction probabilities if available (for classification)
-            probabilities = None
-            try:
-                if hasattr(predictor, 'predict_proba'):
-                    prob_df = predictor.predict_proba(df)
-                    probabilities = prob_df.values.tolist()
-            except:
-                # Probabilities not available (e.g., for regression)
-                pass
+            predictions, prob_df = self._run_inference(predictor, df, request.include_probabilities)
             
             logger.info(f"Predictions completed for model {request.model_uuid}")
             
+            # Arrays are kept as NumPy: the response encoder serializes them whole
             return PredictionResult(
                 success=True,
-                predictions=predictions.tolist() if hasattr(predictions, 'tolist') else list(predictions),
-                probabilities=probabilities
+                predictions=predictions.to_numpy(),
+                probabilities=prob_df.to_numpy() if prob_df is not None else None,
+                class_labels=prob_df.columns.tolist() if prob_df is not None else None
+            )
+            
+        except SchemaValidationError as e:
+            logger.warning(f"Prediction input rejected for model {request.model_uuid}: {str(e)}")
+            return PredictionResult(
+                success=False,
+                error_message=f"Invalid input: {str(e)}",
+                validation=e.report.to_dict()
             )
             
         except Exception as e:
@@ -207,43 +299,60 @@ class AutoGluonMLService(IMLService):
                 error_message=f"Prediction failed: {str(e)}"
             )
     
+    def predict_chunks(
+        self, 
+        model_uuid: str, 
+        chunks: Iterable[pd.DataFrame], 
+        include_probabilities: bool = True
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Make predictions over a stream of DataFrames, one chunk at a time
+        
+        The predictor is loaded before returning, so a missing model fails
+        here rather than in the middle of the stream.
+        
+        Returns:
+            Iterator of DataFrames with a 'prediction' column and, for
+            classification, one 'probability_<class>' column per class
+        """
+        predictor = self._get_predictor(model_uuid)
+        if predictor is None:
+            raise ValueError(f"Model {model_uuid} not found or failed to load")
+        
+        return self._iter_chunk_predictions(model_uuid, predictor, chunks, include_probabilities)
+    
     def get_model_info(self, model_path: str) -> Optional[Dict[str, Any]]:
-        """Get information about a trained model"""
+        """
+        Get information about a trained model by loading its predictor
+        
+        Expensive: models store this metadata when training completes, so
+        this is only needed for models trained before that.
+        """
         try:
             model_path_obj = Path(model_path)
             model_uuid = model_path_obj.name
             
             # Load model if not cached
-            if model_uuid not in self._loaded_models:
-                if not self.load_model(model_path):
-                    return None
-            
-            predictor = self._loaded_models[model_uuid]
+            predictor = self._get_predictor(model_uuid)
+            if predictor is None:
+                return None
             
             # Get model information
             info = {
                 'model_uuid': model_uuid,
                 'problem_type': predictor.problem_type,
                 'label_column': predictor.label,
-                'feature_columns': list(predictor.feature_metadata_in.keys()),
-                'eval_metric': predictor.eval_metric,
             }
+            info.update(self._collect_model_metadata(predictor))
             
-            # Get leaderboard if available
-            try:
-                leaderboard = predictor.leaderboard(silent=True)
-                info['leaderboard'] = leaderboard.head(10).to_dict('records')
-                info['best_model'] = leaderboard.iloc[0]['model']
-                info['best_score'] = float(leaderboard.iloc[0]['score_val'])
-            except:
-                pass
-            
-            # Get feature importance if available
-            try:
-                importance = predictor.feature_importance(data=None, subsample_size=1000)
-                info['feature_importance'] = importance.to_dict()
-            except:
-                pass
+            # The model predictions use, which a latency budget may have moved off the top
+            best_model = next(
+                (entry for entry in info['leaderboard'] if entry['model'] == predictor.model_best),
+                None
+            )
+            if best_model is not None:
+                info['best_model'] = best_model['model']
+                info['best_score'] = best_model['score_val']
             
             return info
             
@@ -251,18 +360,25 @@ class AutoGluonMLService(IMLService):
             logger.error(f"Failed to get model info for {model_path}: {str(e)}")
             return None
     
+    def get_model_manifest(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        """Get the input schema manifest of a model, without loading its predictor"""
+        return read_model_manifest(self.get_model_path(model_uuid))
+    
     def delete_model(self, model_uuid: str) -> bool:
         """Delete model files and remove from cache"""
         try:
             # Remove from cache
-            if model_uuid in self._loaded_models:
-                del self._loaded_models[model_uuid]
+            self._model_cache.remove(model_uuid)
             
             # Delete model directory
-            model_path = self.models_base_path / model_uuid
-            if model_path.exists():
-                shutil.rmtree(model_path)
-                logger.info(f"Model {model_uuid} deleted successfully")
+            model_path = self.get_model_path(model_uuid)
+            forget_model_manifest(model_path)
+            self._schema_validators.pop(model_uuid, None)
+            with self.storage.model_lock(model_uuid):
+                if model_path.exists():
+                    shutil.rmtree(model_path)
+                    logger.info(f"Model {model_uuid} deleted successfully")
+            self.storage.forget(model_uuid)
             
             return True
             
@@ -270,9 +386,279 @@ class AutoGluonMLService(IMLService):
             logger.error(f"Failed to delete model {model_uuid}: {str(e)}")
             return False
     
-    def _prepare_dataframe(self, dataset: DatasetInfo) -> pd.DataFrame:
+    def _run_inference(
+        self, 
+        predictor: Any, 
+        df: pd.DataFrame, 
+        include_probabilities: bool = True
+    ) -> Tuple[pd.Series, Optional[pd.DataFrame]]:
+        """
+        Run a single inference pass over a DataFrame
+        
+        For classification the probabilities are computed once and the
+        labels derived from them, instead of running the feature transform
+        and the ensemble a second time through predict().
+        
+        Returns:
+            Tuple of (predictions, probabilities or None)
+        """
+        # Regression has no probabilities; skip them too when not requested
+        if not predictor.can_predict_proba or not include_probabilities:
+            return predictor.predict(df), None
+        
+        prob_df = predictor.predict_proba(df)
+        predictions = predictor.predict_from_proba(prob_df)
+        
+        return predictions, prob_df
+    
+    def _iter_chunk_predictions(
+        self, 
+        model_uuid: str, 
+        predictor: Any, 
+        chunks: Iterable[pd.DataFrame], 
+        include_probabilities: bool
+    ) -> Iterator[pd.DataFrame]:
+        """Run inference chunk by chunk, holding only one chunk in memory"""
+        row_offset = 0
+        for chunk in chunks:
+            chunk.columns = chunk.columns.str.strip()
+            chunk = self._validate_input(model_uuid, chunk, row_offset)
+            row_offset += len(chunk)
+            
+            predictions, prob_df = self._run_inference(predictor, chunk, include_probabilities)
+            
+            output = pd.DataFrame({'prediction': predictions.values})
+            if prob_df is not None:
+                for label in prob_df.columns:
+                    output[f'probability_{label}'] = prob_df[label].values
+            
+            yield output
+    
+    def _validate_input(self, model_uuid: str, df: pd.DataFrame, row_offset: int = 0) -> pd.DataFrame:
+        """
+        Check and coerce prediction input against the model's training schema
+        
+        Models without a manifest are passed through unchecked.
+        
+        Raises:
+            SchemaValidationError: if columns are missing or values cannot be coerced
+        """
+        validator = self._get_schema_validator(model_uuid)
+        if validator is None:
+            return df
+        
+        df, report = validator.validate(df, row_offset)
+        if not report.is_valid:
+            raise SchemaValidationError(report)
+        
+        if report.ignored_columns:
+            logger.debug(f"Ignored columns for model {model_uuid}: {report.ignored_columns}")
+        
+        return df
+    
+    def _get_schema_validator(self, model_uuid: str) -> Optional[SchemaValidator]:
+        """Get the input validator of a model, compiling it again when its manifest changes"""
+        manifest = self.get_model_manifest(model_uuid)
+        if manifest is None:
+            return None
+        
+        cached = self._schema_validators.get(model_uuid)
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+        
+        validator = SchemaValidator.from_manifest(manifest)
+        self._schema_validators[model_uuid] = (manifest, validator)
+        return validator
+    
+    def preload_model(self, model_uuid: str) -> bool:
+        """
+        Load a model into the cache ahead of its first request
+        
+        Does not count as a use, so preloading a model does not keep it
+        from being archived.
+        """
+        if model_uuid in self._model_cache:
+            return True
+        return self._get_predictor(model_uuid, record_use=False) is not None
+    
+    def pin_model(self, model_uuid: str) -> None:
+        """Keep a model loaded in the cache regardless of recency"""
+        self._model_cache.pin(model_uuid)
+    
+    def unpin_model(self, model_uuid: str) -> None:
+        """Let a pinned model be evicted again"""
+        self._model_cache.unpin(model_uuid)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get model cache counters and memory usage"""
+        return self._model_cache.get_stats()
+    
+    def get_storage_usage(self, model_uuid: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get the disk usage of one model, or of all models with totals per tier"""
+        if model_uuid is not None:
+            return self.storage.get_model_usage(model_uuid)
+        return self.storage.get_usage()
+    
+    def archive_idle_models(self, older_than_days: float) -> Dict[str, Any]:
+        """Compress the artifacts of models not used for older_than_days"""
+        return self.storage.archive_idle(older_than_days)
+    
+    def _is_model_in_use(self, model_uuid: str) -> bool:
+        """Check whether a model is loaded, being loaded or pinned"""
+        with self._loading_lock:
+            if model_uuid in self._loading:
+                return True
+        return model_uuid in self._model_cache or self._model_cache.is_pinned(model_uuid)
+    
+    def _get_predictor(
+        self, 
+        model_uuid: str, 
+        model_path: Optional[str] = None, 
+        record_use: bool = True
+    ) -> Optional[Any]:
+        """
+        Get a loaded predictor, loading it into the cache on a miss
+        
+        Loads are single-flight: concurrent callers asking for the same
+        cold model wait for one load instead of each loading it.
+        """
+        if record_use:
+            self.storage.mark_used(model_uuid)
+        predictor = self._model_cache.get(model_uuid)
+        if predictor is not None:
+            return predictor
+        
+        with self._loading_lock:
+            # The model may have been loaded while we waited for the lock
+            if model_uuid in self._model_cache:
+                in_flight, is_loader = None, False
+            else:
+                in_flight = self._loading.get(model_uuid)
+                is_loader = in_flight is None
+                if is_loader:
+                    in_flight = Future()
+                    self._loading[model_uuid] = in_flight
+        
+        if in_flight is None:
+            return self._model_cache.get(model_uuid)
+        
+        if not is_loader:
+            logger.info(f"Waiting for in-progress load of model {model_uuid}")
+            return in_flight.result()
+        
+        predictor = None
+        try:
+            # Registered as loading above, so the archive sweep leaves the model alone;
+            # held until evicted, so sweeps in other processes do too
+            self.storage.hold(model_uuid)
+            self.storage.ensure_hot(model_uuid, record_use=record_use)
+            predictor = self._load_predictor(model_path or str(self.get_model_path(model_uuid)))
+        except Exception as e:
+            logger.error(f"Failed to rehydrate model {model_uuid}: {str(e)}")
+        finally:
+            if predictor is None:
+                self.storage.release(model_uuid)
+            with self._loading_lock:
+                del self._loading[model_uuid]
+            in_flight.set_result(predictor)
+        
+        return predictor
+    
+    def _load_predictor(self, model_path: str) -> Optional[Any]:
+        """Load a predictor from disk and add it to the cache"""
+        try:
+            from autogluon.tabular import TabularPredictor
+        except ImportError:
+            logger.error("AutoGluon not installed")
+            return None
+            
+        try:
+            model_path_obj = Path(model_path)
+            logger.info(f"Attempting to load model from: {model_path_obj}")
+            
+            if not model_path_obj.exists():
+                index_entry = self.model_index.get(model_path_obj.name)
+                logger.error(
+                    f"Model path does not exist: {model_path} "
+                    f"(indexed at: {index_entry['path'] if index_entry else 'not indexed'})"
+                )
+                return None
+            
+            # Extract model UUID from path
+            model_uuid = model_path_obj.name
+            
+            # Load the model, from its deployment copy when it has one
+            serving_path = str(self._resolve_serving_path(model_path_obj))
+            predictor = TabularPredictor.load(serving_path)
+            self._model_cache.put(model_uuid, predictor, estimate_predictor_size(serving_path))
+            
+            logger.info(f"Model {model_uuid} loaded successfully from {serving_path}")
+            return predictor
+            
+        except Exception as e:
+            logger.error(f"Failed to load model from {model_path}: {str(e)}")
+            return None
+    
+    def _resolve_serving_path(self, model_dir: Path) -> Path:
+        if self.serve_deployment_artifacts:
+            return deployment_artifact_path(model_dir) or model_dir
+        return model_dir
+    
+    def _collect_model_metadata(
+        self, 
+        predictor: Any, 
+        fallback_data: Optional[pd.DataFrame] = None, 
+        predict_times: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Collect the details shown for a trained model
+        
+        Feature importance uses the validation data cached by the predictor;
+        presets that drop it (e.g. optimize_for_deployment) fall back to
+        fallback_data, typically the training data. Measured predict_times
+        (only taken for models with a latency budget) are added to the
+        leaderboard as predict_time_per_row_ms.
+        
+        Returns:
+            Dict with JSON-serializable feature_columns, eval_metric, the full
+            leaderboard and feature_importance (None if it cannot be computed)
+        """
+        leaderboard = predictor.leaderboard(silent=True)
+        
+        feature_importance = None
+        candidates = [None] if fallback_data is None else [None, fallback_data]
+        for data in candidates:
+            try:
+                importance = predictor.feature_importance(
+                    data=data,
+                    subsample_size=FEATURE_IMPORTANCE_SUBSAMPLE_SIZE,
+                    time_limit=FEATURE_IMPORTANCE_TIME_LIMIT,
+                    silent=True
+                )
+                feature_importance = json.loads(importance.to_json())
+                break
+            except Exception as e:
+                if data is candidates[-1]:
+                    logger.warning(f"Feature importance not available for {predictor.path}: {str(e)}")
+        
+        if predict_times:
+            leaderboard['predict_time_per_row_ms'] = leaderboard['model'].map(predict_times)
+        
+        return {
+            'feature_columns': list(predictor.features()),
+            'eval_metric': predictor.eval_metric.name,
+            # Through JSON so NumPy values and NaN become plain JSON values
+            'leaderboard': json.loads(leaderboard.to_json(orient='records')),
+            'feature_importance': feature_importance
+        }
+    
+    def _prepare_dataframe(self, dataset: DatasetInfo, label: Optional[str] = None) -> pd.DataFrame:
         """Convert dataset info to pandas DataFrame"""
-        df = pd.DataFrame(dataset.rows, columns=dataset.headers)
+        if dataset.file_path:
+            # Build the frame straight from the uploaded file
+            df = read_dataset_file(dataset.file_path)
+        else:
+            df = pd.DataFrame(dataset.rows, columns=dataset.headers)
         
         # Clean column names (remove whitespace)
         df.columns = df.columns.str.strip()
@@ -280,8 +666,38 @@ class AutoGluonMLService(IMLService):
         # Basic data cleaning
         df = df.dropna(how='all')  # Remove completely empty rows
         
+        # Compact dtypes so AutoGluon starts from typed, downcast columns
+        label = label.strip() if label else None
+        df = optimize_dtypes(df, exclude_categories=[label] if label else ())
+        
+        # Stored datasets are typed without knowing the label: keep it plain
+        if label in df.columns and isinstance(df[label].dtype, pd.CategoricalDtype):
+            df[label] = df[label].astype(object)
+        
         return df
     
+    def _build_fit_config(self, config: TrainingConfig) -> Dict[str, Any]:
+        """Build AutoGluon fit() arguments"""
+        fit_config = {
+            'time_limit': config.time_limit,
+            'presets': config.presets,
+            'verbosity': config.verbosity
+        }
+        
+        # Restrict training to the resources reserved by the scheduler
+        if config.num_cpus:
+            fit_config['num_cpus'] = config.num_cpus
+        
+        if config.memory_limit_gb:
+            # AutoGluon caps model memory as a ratio of the memory available now
+            from autogluon.common.utils.resource_utils import ResourceManager
+            available_gb = ResourceManager.get_available_virtual_mem() / (1024 ** 3)
+            fit_config['ag_args_fit'] = {
+                'ag.max_memory_usage_ratio': round(min(config.memory_limit_gb / available_gb, 1.0), 3)
+            }
+        
+        return fit_config
+    
     def _build_predictor_config(self, config: TrainingConfig, model_path: str) -> Dict[str, Any]:
         """Build AutoGluon predictor configuration"""
         predictor_config = {
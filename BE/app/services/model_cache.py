@@ -0,0 +1,154 @@
+# BE/app/services/model_cache.py
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+class PredictorCache:
+    """
+    Least-recently-used cache of loaded predictors with a memory ceiling
+
+    Each entry is charged its estimated resident size. When the total goes
+    over the ceiling the least recently used predictors are evicted, except
+    pinned ones, which stay loaded until they are unpinned. on_remove is
+    called with the model UUID of every predictor evicted or removed.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        pinned: Iterable[str] = (),
+        on_remove: Optional[Callable[[str], None]] = None
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.on_remove = on_remove
+
+        self._entries: 'OrderedDict[str, Tuple[Any, int]]' = OrderedDict()
+        self._pinned: Set[str] = set(pinned)
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, model_uuid: str) -> Optional[Any]:
+        """Get a cached predictor, marking it as most recently used"""
+        with self._lock:
+            entry = self._entries.get(model_uuid)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(model_uuid)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, model_uuid: str, predictor: Any, size_bytes: int) -> None:
+        """Add a predictor, evicting least recently used ones to stay under the ceiling"""
+        with self._lock:
+            previous = self._entries.pop(model_uuid, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+
+            self._entries[model_uuid] = (predictor, size_bytes)
+            self._memory_bytes += size_bytes
+            self._evict(keep=model_uuid)
+
+    def remove(self, model_uuid: str) -> bool:
+        """Remove a predictor from the cache"""
+        with self._lock:
+            self._pinned.discard(model_uuid)
+            entry = self._entries.pop(model_uuid, None)
+            if entry is None:
+                return False
+
+            self._memory_bytes -= entry[1]
+            self._notify_removed(model_uuid)
+            return True
+
+    def pin(self, model_uuid: str) -> None:
+        """Keep a predictor loaded regardless of recency (it may be loaded later)"""
+        with self._lock:
+            self._pinned.add(model_uuid)
+
+    def unpin(self, model_uuid: str) -> None:
+        """Make a pinned predictor evictable again"""
+        with self._lock:
+            self._pinned.discard(model_uuid)
+            self._evict()
+
+    def is_pinned(self, model_uuid: str) -> bool:
+        with self._lock:
+            return model_uuid in self._pinned
+
+    def __contains__(self, model_uuid: str) -> bool:
+        with self._lock:
+            return model_uuid in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and memory usage"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'memory_bytes': self._memory_bytes,
+                'max_memory_bytes': self.max_memory_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else None,
+                'evictions': self._evictions,
+                'pinned': sorted(self._pinned),
+                'models': list(self._entries.keys())
+            }
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used, unpinned predictors (caller holds the lock)"""
+        if self._memory_bytes <= self.max_memory_bytes:
+            return
+
+        for model_uuid in list(self._entries.keys()):
+            if self._memory_bytes <= self.max_memory_bytes:
+                break
+
+            if model_uuid == keep or model_uuid in self._pinned:
+                continue
+
+            _, size_bytes = self._entries.pop(model_uuid)
+            self._memory_bytes -= size_bytes
+            self._evictions += 1
+            self._notify_removed(model_uuid)
+            logger.info(f"Evicted model {model_uuid} from cache ({size_bytes / (1024 ** 2):.1f} MB)")
+
+        if self._memory_bytes > self.max_memory_bytes:
+            logger.warning(
+                f"Model cache over its ceiling ({self._memory_bytes / (1024 ** 2):.1f} MB used): "
+                f"only pinned or in-use models are left"
+            )
+
+    def _notify_removed(self, model_uuid: str) -> None:
+        if self.on_remove is None:
+            return
+        try:
+            self.on_remove(model_uuid)
+        except Exception as e:
+            logger.warning(f"Cache removal callback failed for model {model_uuid}: {str(e)}")
+
+def estimate_predictor_size(model_path: str) -> int:
+    """
+    Estimate the size of a predictor from its artifacts on disk
+
+    This is the total size of the files under model_path, a disk-size
+    proxy for memory: pickled models usually take a comparable amount
+    once loaded, but the actual resident size is not measured.
+    """
+    total = 0
+    for root, _, files in os.walk(model_path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
@@ -0,0 +1,97 @@
+# BE/app/services/model_deployment.py
+import logging
+import os
+import shutil
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from services.model_cache import estimate_predictor_size
+from services.model_layout import DEPLOYMENT_DIR_NAME, scratch_dir_path
+from services.model_storage import PREDICTOR_FILENAME
+
+logger = logging.getLogger(__name__)
+
+# Single-row predictions timed per measurement, after one untimed call
+LATENCY_REPEATS = 10
+
+def deployment_artifact_path(model_dir: Path) -> Optional[Path]:
+    """Get the deployment copy of a model, None if training did not produce one"""
+    deployment_dir = Path(model_dir) / DEPLOYMENT_DIR_NAME
+    if (deployment_dir / PREDICTOR_FILENAME).exists():
+        return deployment_dir
+    return None
+
+def measure_latency_ms(predictor: Any, sample: pd.DataFrame) -> float:
+    """
+    Measure the median time a predictor takes to predict one row
+
+    Models are read from disk on each call as when serving, so the
+    measurement includes loading every model the prediction goes through.
+    """
+    row = sample.head(1)
+    predictor.predict(row)
+
+    timings = []
+    for _ in range(LATENCY_REPEATS):
+        start = time.perf_counter()
+        predictor.predict(row)
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 3)
+
+def build_deployment_artifact(predictor: Any, model_dir: Path, sample: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Build the lean deployment copy of a trained predictor
+
+    The predictor is cloned to a scratch directory, where the best model is
+    refit on the full training data, without the bagged folds held out
+    for validation, and becomes the best model. A copy of the scratch
+    predictor keeping only the models that one depends on is then cloned
+    into the model directory. The full artifact itself is left as trained.
+    Both clones go to sibling directories, since AutoGluon cannot copy a
+    predictor into itself, and the deployment copy is renamed into place
+    once complete.
+
+    Args:
+        predictor: Trained predictor, saved in model_dir
+        model_dir: Model directory
+        sample: Feature rows used to time predictions
+
+    Returns:
+        Dict with the serving model name, the size in bytes and single-row
+        latency in milliseconds of the full and of the deployment artifact
+    """
+    model_dir = Path(model_dir)
+    full_artifact_bytes = estimate_predictor_size(str(model_dir))
+    # Timed on a fresh load, like the deployment copy, so neither has models already in memory
+    full_latency_ms = measure_latency_ms(type(predictor).load(str(model_dir)), sample)
+
+    refit_dir = scratch_dir_path(model_dir, 'refit')
+    staging_dir = scratch_dir_path(model_dir, DEPLOYMENT_DIR_NAME)
+    for path in (refit_dir, staging_dir):
+        if path.exists():
+            shutil.rmtree(path)
+
+    try:
+        refit = predictor.clone(path=str(refit_dir), return_clone=True)
+        refit.refit_full(model='best', set_best_to_refit_full=True)
+        refit.clone_for_deployment(path=str(staging_dir), model='best')
+        os.replace(staging_dir, model_dir / DEPLOYMENT_DIR_NAME)
+    finally:
+        for path in (refit_dir, staging_dir):
+            if path.exists():
+                shutil.rmtree(path)
+
+    deployment_dir = model_dir / DEPLOYMENT_DIR_NAME
+    deployed = type(predictor).load(str(deployment_dir))
+
+    return {
+        'deployment_model_name': str(deployed.model_best),
+        'full_artifact_bytes': full_artifact_bytes,
+        'deployment_artifact_bytes': estimate_predictor_size(str(deployment_dir)),
+        'full_latency_ms': full_latency_ms,
+        'deployment_latency_ms': measure_latency_ms(deployed, sample)
+    }
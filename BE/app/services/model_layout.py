@@ -0,0 +1,218 @@
+# BE/app/services/model_layout.py
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.request_validators import validate_uuid
+
+logger = logging.getLogger(__name__)
+
+# Models live in two levels of prefix directories: models_output/ab/cd/abcd...
+SHARD_WIDTH = 2
+SHARD_DEPTH = 2
+
+INDEX_FILENAME = 'index.sqlite'
+
+# Directories inside a model directory
+DEPLOYMENT_DIR_NAME = 'deployment'    # Lean copy of the predictor for serving
+SCORING_DIR_NAME = 'scoring'          # Batch-scoring jobs and their results
+REHYDRATE_DIR_NAME = '.rehydrating'   # Archive being unpacked
+
+def sharded_model_path(base_path: Path, model_uuid: str) -> Path:
+    """Get the sharded directory of a model"""
+    shards = [model_uuid[i * SHARD_WIDTH:(i + 1) * SHARD_WIDTH] for i in range(SHARD_DEPTH)]
+    return Path(base_path).joinpath(*shards, model_uuid)
+
+def resolve_model_path(base_path: Path, model_uuid: str) -> Path:
+    """
+    Get the directory of a model, in the sharded layout unless it still sits
+    in the legacy flat one
+
+    Costs at most two stat calls, whatever the number of models.
+    """
+    sharded_path = sharded_model_path(base_path, model_uuid)
+    if sharded_path.exists():
+        return sharded_path
+
+    flat_path = Path(base_path) / model_uuid
+    if flat_path.is_dir():
+        return flat_path
+    return sharded_path
+
+def iter_model_dirs(base_path: Path) -> Iterator[Tuple[str, Path]]:
+    """Yield (uuid, directory) for every model, in both the sharded and the flat layout"""
+    base_path = Path(base_path)
+    if not base_path.exists():
+        return
+
+    for entry in os.scandir(base_path):
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        if validate_uuid(entry.name):
+            yield entry.name, Path(entry.path)
+        elif len(entry.name) == SHARD_WIDTH:
+            yield from _iter_shard(Path(entry.path), entry.name, SHARD_DEPTH - 1)
+
+def _iter_shard(shard_path: Path, prefix: str, depth: int) -> Iterator[Tuple[str, Path]]:
+    for entry in os.scandir(shard_path):
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        if depth > 0:
+            if len(entry.name) == SHARD_WIDTH:
+                yield from _iter_shard(Path(entry.path), prefix + entry.name, depth - 1)
+        elif validate_uuid(entry.name) and entry.name.startswith(prefix):
+            yield entry.name, Path(entry.path)
+
+def scratch_dir_path(model_dir: Path, purpose: str) -> Path:
+    """
+    Get a hidden work directory next to a model directory
+
+    Used for copies of a model that cannot be built inside it; named
+    .<uuid>.<purpose> so the garbage collector can match leftovers of
+    crashed builds to their model.
+    """
+    model_dir = Path(model_dir)
+    return model_dir.parent / f".{model_dir.name}.{purpose}"
+
+def iter_scratch_dirs(base_path: Path) -> Iterator[Tuple[str, Path]]:
+    """Yield (uuid, directory) for every work directory made by scratch_dir_path"""
+    base_path = Path(base_path)
+    if not base_path.exists():
+        return
+
+    for parent in [base_path, *_iter_shard_leaves(base_path, SHARD_DEPTH)]:
+        for entry in os.scandir(parent):
+            if not entry.name.startswith('.') or not entry.is_dir(follow_symlinks=False):
+                continue
+            model_uuid, separator, _ = entry.name[1:].partition('.')
+            if separator and validate_uuid(model_uuid):
+                yield model_uuid, Path(entry.path)
+
+def _iter_shard_leaves(shard_path: Path, depth: int) -> Iterator[Path]:
+    for entry in os.scandir(shard_path):
+        if len(entry.name) != SHARD_WIDTH or not entry.is_dir(follow_symlinks=False):
+            continue
+        if depth > 1:
+            yield from _iter_shard_leaves(Path(entry.path), depth - 1)
+        else:
+            yield Path(entry.path)
+
+def migrate_flat_layout(base_path: Path, dry_run: bool = False) -> List[Tuple[str, Path, Path]]:
+    """
+    Move models from the flat layout into their shard directories
+
+    Each move is a rename within the same filesystem, so a model is never
+    half-moved. Must not run while the server has predictors loaded.
+
+    Returns:
+        List of (uuid, old directory, new directory) of the moved models
+    """
+    moved = []
+    flat_dirs = [
+        (model_uuid, model_dir) for model_uuid, model_dir in iter_model_dirs(base_path)
+        if model_dir.parent == Path(base_path)
+    ]
+
+    for model_uuid, model_dir in flat_dirs:
+        target = sharded_model_path(base_path, model_uuid)
+        if target.exists():
+            logger.warning(f"Not moving model {model_uuid}: {target} already exists")
+            continue
+
+        if not dry_run:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(model_dir, target)
+        moved.append((model_uuid, model_dir, target))
+
+    return moved
+
+class ModelIndex:
+    """
+    Persistent map of model UUID to directory, storage tier, disk size
+    and last access
+
+    Kept in a SQLite file next to the models so that usage reports and
+    idle checks read one small table instead of walking every model
+    directory. Training workers and the web process share it, so every
+    operation opens its own short-lived connection.
+    """
+
+    def __init__(self, index_path: Path):
+        self.index_path = str(index_path)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def upsert(
+        self,
+        model_uuid: str,
+        path: Path,
+        tier: Optional[str] = None,
+        size_bytes: Optional[int] = None,
+        last_access: Optional[float] = None
+    ) -> None:
+        """Add or update a model; fields left as None keep their stored value"""
+        self._execute(
+            """
+            INSERT INTO models (uuid, path, tier, size_bytes, last_access)
+            VALUES (?, ?, COALESCE(?, 'hot'), COALESCE(?, 0), ?)
+            ON CONFLICT(uuid) DO UPDATE SET
+                path = excluded.path,
+                tier = COALESCE(?, tier),
+                size_bytes = COALESCE(?, size_bytes),
+                last_access = COALESCE(?, last_access)
+            """,
+            (model_uuid, str(path), tier, size_bytes, last_access, tier, size_bytes, last_access)
+        )
+
+    def get(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT * FROM models WHERE uuid = ?", (model_uuid,))
+        return rows[0] if rows else None
+
+    def all(self) -> List[Dict[str, Any]]:
+        return self._query("SELECT * FROM models ORDER BY uuid")
+
+    def most_recently_used(self, limit: int, tier: str = 'hot') -> List[Dict[str, Any]]:
+        """Get the models of a tier used most recently, latest first"""
+        return self._query(
+            "SELECT * FROM models WHERE tier = ? AND last_access IS NOT NULL "
+            "ORDER BY last_access DESC LIMIT ?",
+            (tier, limit)
+        )
+
+    def remove(self, model_uuid: str) -> None:
+        self._execute("DELETE FROM models WHERE uuid = ?", (model_uuid,))
+
+    def _execute(self, sql: str, params: Tuple = ()) -> None:
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute(sql, params)
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        with closing(self._connect()) as connection:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, params)]
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    connection.execute('PRAGMA journal_mode=WAL')
+                    with connection:
+                        connection.execute(
+                            """
+                            CREATE TABLE IF NOT EXISTS models (
+                                uuid TEXT PRIMARY KEY,
+                                path TEXT NOT NULL,
+                                tier TEXT NOT NULL DEFAULT 'hot',
+                                size_bytes INTEGER NOT NULL DEFAULT 0,
+                                last_access REAL
+                            )
+                            """
+                        )
+                    self._initialized = True
+        return connection
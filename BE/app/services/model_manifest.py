@@ -0,0 +1,108 @@
+# BE/app/services/model_manifest.py
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Columns with more distinct training values than this get no vocabulary
+MAX_MANIFEST_CATEGORIES = 1000
+
+# Parsed manifests by path, with the modification time they were read at
+_manifest_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_manifest_cache_lock = threading.Lock()
+
+def build_model_manifest(predictor: Any, train_data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Describe the input schema of a trained predictor
+
+    Lists each input feature with its training dtype, AutoGluon type and,
+    for text and categorical features, the values seen in training.
+    """
+    raw_types = predictor.feature_metadata_in.type_map_raw
+    features = []
+
+    for name in predictor.features():
+        series = train_data[name]
+        raw_type = raw_types.get(name)
+
+        categories = None
+        if raw_type in ('object', 'category'):
+            values = series.dropna().unique()
+            if len(values) <= MAX_MANIFEST_CATEGORIES:
+                categories = sorted(pd.Series(values, dtype=object).tolist(), key=str)
+
+        features.append({
+            'name': name,
+            'dtype': str(series.dtype),
+            'type': raw_type,
+            'nullable': bool(series.isna().any()),
+            'categories': categories
+        })
+
+    class_labels = predictor.class_labels
+    return {
+        'version': MANIFEST_VERSION,
+        'label': predictor.label,
+        'problem_type': predictor.problem_type,
+        'class_labels': pd.Series(class_labels, dtype=object).tolist() if class_labels is not None else None,
+        'features': features,
+        'created_at': datetime.utcnow().isoformat()
+    }
+
+def write_model_manifest(model_dir: Path, manifest: Dict[str, Any]) -> None:
+    """Write a model's manifest next to its artifacts, atomically"""
+    manifest_path = Path(model_dir) / MANIFEST_FILENAME
+    tmp_path = manifest_path.with_name(f"{MANIFEST_FILENAME}.{uuid.uuid4().hex}.tmp")
+
+    try:
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, default=str)
+        os.replace(tmp_path, manifest_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def read_model_manifest(model_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a model's manifest without loading its predictor
+
+    Parsed manifests are kept in memory and reread only when the file
+    changes. Returns None for models trained without a manifest.
+    """
+    manifest_path = str(Path(model_dir) / MANIFEST_FILENAME)
+
+    try:
+        mtime = os.stat(manifest_path).st_mtime_ns
+    except OSError:
+        return None
+
+    with _manifest_cache_lock:
+        cached = _manifest_cache.get(manifest_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(manifest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to read manifest {manifest_path}: {str(e)}")
+        return None
+
+    with _manifest_cache_lock:
+        _manifest_cache[manifest_path] = (mtime, manifest)
+    return manifest
+
+def forget_model_manifest(model_dir: Path) -> None:
+    """Drop a model's cached manifest"""
+    with _manifest_cache_lock:
+        _manifest_cache.pop(str(Path(model_dir) / MANIFEST_FILENAME), None)
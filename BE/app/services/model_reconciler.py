@@ -0,0 +1,327 @@
+# BE/app/services/model_reconciler.py
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from services.base import ModelStatus
+from services.model_layout import iter_model_dirs, iter_scratch_dirs
+from services.model_manifest import forget_model_manifest
+
+logger = logging.getLogger(__name__)
+
+STALE_TRAINING_ERROR = "Training was interrupted before it finished"
+EMPTY_DATABASE_ERROR = (
+    "The database has no models but the models directory does; nothing was reclaimed. "
+    "Check that DATABASE_URL and MODELS_PATH belong to the same deployment"
+)
+
+class IORateLimiter:
+    """Paces file operations so a background sweep leaves I/O to serving"""
+
+    def __init__(self, bytes_per_second: float, files_per_second: float):
+        self.bytes_per_second = bytes_per_second
+        self.files_per_second = files_per_second
+
+        self._start = time.monotonic()
+        self._bytes = 0
+        self._files = 0
+
+    def consume(self, files: int = 1, nbytes: int = 0) -> None:
+        """Account for file operations, sleeping if they run ahead of the rates"""
+        self._files += files
+        self._bytes += nbytes
+
+        due = 0.0
+        if self.files_per_second > 0:
+            due = self._files / self.files_per_second
+        if self.bytes_per_second > 0:
+            due = max(due, self._bytes / self.bytes_per_second)
+
+        delay = due - (time.monotonic() - self._start)
+        if delay > 0:
+            time.sleep(delay)
+
+class ModelReconciler:
+    """
+    Reconciles the models directory with the trained_models table
+
+    Each run walks the model directories and matches them to database
+    rows, then reclaims:
+
+    - orphan directories, which have no database row;
+    - directories of FAILED models, left by crashed or killed workers;
+    - stale TRAINING rows, whose heartbeat has not been refreshed for the
+      grace period by any process, by marking them FAILED in bulk and
+      reclaiming their directories;
+    - work directories of deployment builds (.<uuid>.refit and
+      .<uuid>.deployment next to the model directory) whose model is no
+      longer training, left by crashed builds;
+    - model index entries whose directory is gone.
+
+    Only entries untouched for the grace period are considered, so models
+    being created or trained are never reclaimed. The grace period must
+    be well above the training heartbeat interval. Deletions are paced by
+    an I/O rate limiter.
+
+    An empty trained_models table next to a non-empty models directory
+    usually means the server points at another deployment's database
+    (development and production share the default MODELS_PATH), so
+    nothing is reclaimed then.
+    """
+
+    def __init__(
+        self,
+        app,
+        ml_service,
+        model_repository,
+        grace_seconds: float = 1800,
+        io_bytes_per_second: float = 50 * 1024 * 1024,
+        files_per_second: float = 500
+    ):
+        self.app = app
+        self.ml_service = ml_service
+        self.model_repository = model_repository
+        self.grace_seconds = grace_seconds
+        self.io_bytes_per_second = io_bytes_per_second
+        self.files_per_second = files_per_second
+
+        self._last_report: Optional[Dict[str, Any]] = None
+        self._running = False
+        self._lock = threading.Lock()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def run(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Run one reconciliation and return its report
+
+        With dry_run nothing is changed; the report lists what would be
+        reclaimed.
+
+        Raises:
+            RuntimeError: If a run is already in progress
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("A garbage collection run is already in progress")
+            self._running = True
+
+        try:
+            with self.app.app_context():
+                report = self._reconcile(dry_run)
+        finally:
+            with self._lock:
+                self._running = False
+
+        with self._lock:
+            self._last_report = report
+
+        logger.info(
+            f"Model garbage collection{' (dry run)' if dry_run else ''}: "
+            f"{len(report['orphan_directories'])} orphan, {len(report['failed_directories'])} failed "
+            f"and {len(report['scratch_directories'])} work directories, "
+            f"{len(report['stale_training_models'])} stale training models, "
+            f"{report['reclaimed_bytes']} bytes reclaimed"
+        )
+        return report
+
+    def run_in_background(self, dry_run: bool = False) -> None:
+        """
+        Start a run on a background thread
+
+        Raises:
+            RuntimeError: If a run is already in progress
+        """
+        if self.is_running():
+            raise RuntimeError("A garbage collection run is already in progress")
+
+        threading.Thread(target=self._run_logged, args=(dry_run,), name='model-gc', daemon=True).start()
+
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._running
+
+    def get_last_report(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._last_report
+
+    def start(self, interval_seconds: float) -> None:
+        """Run periodically on a background thread"""
+        if self._thread is not None:
+            return
+
+        def loop() -> None:
+            while not self._stop.wait(interval_seconds):
+                self._run_logged(False)
+
+        self._thread = threading.Thread(target=loop, name='model-gc-scheduler', daemon=True)
+        self._thread.start()
+        logger.info(f"Model garbage collection runs every {interval_seconds}s")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run_logged(self, dry_run: bool) -> None:
+        try:
+            self.run(dry_run)
+        except Exception as e:
+            logger.error(f"Model garbage collection failed: {str(e)}")
+
+    def _reconcile(self, dry_run: bool) -> Dict[str, Any]:
+        started_at = datetime.utcnow()
+        start = time.monotonic()
+        limiter = IORateLimiter(self.io_bytes_per_second, self.files_per_second)
+        cutoff = started_at - timedelta(seconds=self.grace_seconds)
+        models_path = self.ml_service.models_base_path
+
+        report = {
+            'started_at': started_at.isoformat(),
+            'dry_run': dry_run,
+            'scanned_directories': 0,
+            'orphan_directories': [],
+            'failed_directories': [],
+            'scratch_directories': [],
+            'stale_training_models': [],
+            'stale_training_failed': 0,
+            'stale_index_entries': 0,
+            'reclaimed_bytes': 0,
+            'errors': []
+        }
+
+        index = self.model_repository.get_status_index()
+
+        if not index and next(iter_model_dirs(models_path), None) is not None:
+            logger.warning(EMPTY_DATABASE_ERROR)
+            report['errors'].append(EMPTY_DATABASE_ERROR)
+            report['duration_seconds'] = round(time.monotonic() - start, 3)
+            return report
+
+        # TRAINING rows whose job no process has kept alive (heartbeats are in the database)
+        stale_training = [
+            model_uuid for model_uuid, (status, last_seen) in index.items()
+            if status == ModelStatus.TRAINING.value
+            and (last_seen is None or last_seen < cutoff)
+        ]
+        stale_set = set(stale_training)
+        report['stale_training_models'] = stale_training
+        if stale_training and not dry_run:
+            report['stale_training_failed'] = self.model_repository.fail_stale_training(
+                stale_training, STALE_TRAINING_ERROR, seen_before=cutoff
+            )
+
+        on_disk = set()
+
+        for model_uuid, model_dir in iter_model_dirs(models_path):
+            on_disk.add(model_uuid)
+            report['scanned_directories'] += 1
+            limiter.consume()
+
+            record = index.get(model_uuid)
+            if record is None:
+                reclaimable = report['orphan_directories']
+            elif record[0] in (ModelStatus.FAILED.value, ModelStatus.DELETED.value) or model_uuid in stale_set:
+                reclaimable = report['failed_directories']
+            else:
+                continue
+
+            try:
+                if datetime.utcfromtimestamp(model_dir.stat().st_mtime) >= cutoff:
+                    continue
+                # The row may have been created or completed since the index was read
+                if not self._is_still_reclaimable(model_uuid, record is None, dry_run):
+                    continue
+
+                report['reclaimed_bytes'] += self._reclaim(model_uuid, model_dir, limiter, dry_run)
+                reclaimable.append(model_uuid)
+            except Exception as e:
+                logger.error(f"Failed to reclaim model directory {model_uuid}: {str(e)}")
+                report['errors'].append(f"{model_uuid}: {str(e)}")
+
+        # Work directories of deployment builds that are no longer running
+        for model_uuid, scratch_dir in iter_scratch_dirs(models_path):
+            limiter.consume()
+
+            record = index.get(model_uuid)
+            if record is not None and record[0] == ModelStatus.TRAINING.value and model_uuid not in stale_set:
+                continue
+
+            try:
+                if datetime.utcfromtimestamp(scratch_dir.stat().st_mtime) >= cutoff:
+                    continue
+
+                report['reclaimed_bytes'] += self._delete_tree(scratch_dir, limiter, dry_run)
+                report['scratch_directories'].append(scratch_dir.name)
+            except Exception as e:
+                logger.error(f"Failed to reclaim work directory {scratch_dir.name}: {str(e)}")
+                report['errors'].append(f"{scratch_dir.name}: {str(e)}")
+
+        # Index entries of directories that no longer exist
+        stale_index_entries = [
+            entry['uuid'] for entry in self.ml_service.model_index.all()
+            if entry['uuid'] not in on_disk and not os.path.exists(entry['path'])
+        ]
+        if not dry_run:
+            for model_uuid in stale_index_entries:
+                self.ml_service.model_index.remove(model_uuid)
+        report['stale_index_entries'] = len(stale_index_entries)
+
+        report['duration_seconds'] = round(time.monotonic() - start, 3)
+        return report
+
+    def _is_still_reclaimable(self, model_uuid: str, orphan: bool, dry_run: bool) -> bool:
+        """Check a candidate against the database again right before reclaiming it"""
+        model = self.model_repository.get_by_uuid(model_uuid)
+        if orphan:
+            return model is None
+        if model is None:
+            return True
+
+        reclaimable_statuses = {ModelStatus.FAILED.value, ModelStatus.DELETED.value}
+        if dry_run:
+            # Stale rows are only marked FAILED on real runs
+            reclaimable_statuses.add(ModelStatus.TRAINING.value)
+        return model.status in reclaimable_statuses
+
+    def _reclaim(self, model_uuid: str, model_dir: Path, limiter: IORateLimiter, dry_run: bool) -> int:
+        """Delete a model directory at the limiter's pace, returning the bytes freed"""
+        with self.ml_service.storage.model_lock(model_uuid):
+            reclaimed = self._delete_tree(model_dir, limiter, dry_run)
+
+        if not dry_run:
+            forget_model_manifest(model_dir)
+            self.ml_service.storage.forget(model_uuid)
+        return reclaimed
+
+    def _delete_tree(self, path: Path, limiter: IORateLimiter, dry_run: bool) -> int:
+        """Delete a directory tree at the limiter's pace, returning the bytes freed"""
+        reclaimed = 0
+
+        for root, dirs, files in os.walk(path, topdown=False):
+            for name in files:
+                file_path = os.path.join(root, name)
+                try:
+                    size = os.lstat(file_path).st_size
+                    if not dry_run:
+                        os.unlink(file_path)
+                except FileNotFoundError:
+                    continue
+                reclaimed += size
+                limiter.consume(1, size)
+
+            if dry_run:
+                continue
+            for name in dirs:
+                dir_path = os.path.join(root, name)
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                else:
+                    os.rmdir(dir_path)
+
+        if not dry_run:
+            os.rmdir(path)
+        return reclaimed
@@ -0,0 +1,65 @@
+# BE/app/services/model_selection.py
+import logging
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Timed single-row leaderboards per measurement, after one untimed pass
+PREDICT_TIME_REPEATS = 3
+
+def measure_predict_times(predictor: Any, sample: pd.DataFrame) -> Dict[str, float]:
+    """
+    Measure how long every model of a predictor takes to predict one row
+
+    Each leaderboard pass predicts the row with every model, timing each
+    one together with the models it stacks on, which is what serving it
+    costs. The median of a few passes is kept.
+
+    Args:
+        predictor: Trained predictor
+        sample: Feature rows; the first one is predicted
+
+    Returns:
+        Dict of model name to milliseconds per row
+    """
+    row = sample.head(1)
+    predictor.leaderboard(row, skip_score=True, silent=True)
+
+    timings: Dict[str, List[float]] = {}
+    for _ in range(PREDICT_TIME_REPEATS):
+        leaderboard = predictor.leaderboard(row, skip_score=True, silent=True)
+        for model, seconds in zip(leaderboard['model'], leaderboard['pred_time_test']):
+            timings.setdefault(str(model), []).append(float(seconds) * 1000)
+
+    return {model: round(statistics.median(values), 3) for model, values in timings.items()}
+
+def select_model_within_budget(
+    leaderboard: List[Dict[str, Any]],
+    predict_times: Dict[str, float],
+    limit_ms: float
+) -> Tuple[Optional[str], bool]:
+    """
+    Pick the best-scoring model that predicts a row within the budget
+
+    Args:
+        leaderboard: Leaderboard entries, best validation score first
+        predict_times: Milliseconds per row of each model
+        limit_ms: Budget in milliseconds per row
+
+    Returns:
+        (model name, whether it is within the budget); the fastest model
+        when none is, and None when no model was measured
+    """
+    measured = [entry for entry in leaderboard if entry['model'] in predict_times]
+    if not measured:
+        return None, False
+
+    for entry in measured:
+        if predict_times[entry['model']] <= limit_ms:
+            return entry['model'], True
+
+    fastest = min(measured, key=lambda entry: predict_times[entry['model']])
+    return fastest['model'], False
@@ -1,13 +1,17 @@
 # BE/app/services/model_service.py
+from dataclasses import replace
+from pathlib import Path
 from typing import List, Optional, Dict, Any
 import logging
 import os
+import uuid
 
 from services.base import (
     TrainingConfig, DatasetInfo, TrainingResult, 
     PredictionRequest, PredictionResult, ModelStatus
 )
 from services.interfaces import IMLService
+from utils.dataset_files import iter_dataset_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -17,85 +21,82 @@ class ModelService:
     def __init__(
         self, 
         ml_service: Optional[IMLService] = None,
-        model_repository = None  # Use duck typing to avoid circular imports
+        model_repository = None,  # Use duck typing to avoid circular imports
+        training_queue = None,
+        dataset_store = None,
+        prediction_batcher = None,
+        scoring_jobs = None,
+        model_reconciler = None
     ):
         self.ml_service = ml_service
         self.model_repository = model_repository
+        self.training_queue = training_queue
+        self.dataset_store = dataset_store
+        self.prediction_batcher = prediction_batcher
+        self.scoring_jobs = scoring_jobs
+        self.model_reconciler = model_reconciler
     
     def train_model(self, dataset: DatasetInfo, config: TrainingConfig) -> Dict[str, Any]:
         """
-        Train a new model with the given dataset and configuration
+        Submit a training job for a new model with the given dataset and configuration
+        
+        Returns as soon as the job is queued; the worker running the job moves
+        the model record from TRAINING to COMPLETED or FAILED.
+        
+        Datasets not yet in the dataset store are parsed and stored by the
+        worker, never in the request. An uploaded file (dataset.file_path
+        outside the store) is owned by the job from here on: it is deleted
+        once stored, or here if the job cannot be queued.
         """
+        queued = False
         try:
             logger.info(f"Starting training for model: {config.model_name}")
             
             # Validate inputs
             self._validate_training_inputs(dataset, config)
             
+            # Reject jobs that could never fit in the training budget
+            self.training_queue.check_admission(dataset, config)
+            
+            # Reuse a stored dataset as is; a new one stays as received for the worker to store
+            if dataset.dataset_hash and self.dataset_store.exists(dataset.dataset_hash):
+                self._discard_upload(dataset)
+                dataset = replace(self.dataset_store.get(dataset.dataset_hash), filename=dataset.filename)
+            
+            # The same UUID identifies the database record and the model directory
+            model_uuid = str(uuid.uuid4())
+            model_path = str(self.ml_service.get_model_path(model_uuid))
+            
             # Create database record with TRAINING status
             model_record = self.model_repository.create(
                 training_config=config,
-                model_path="",  # Will be updated after training
-                dataset_filename=dataset.filename
+                model_path=model_path,
+                dataset_filename=dataset.filename,
+                model_uuid=model_uuid,
+                dataset_hash=dataset.dataset_hash
             )
             
             try:
-                # Perform ML training
-                training_result = self.ml_service.train_model(dataset, config)
+                # Hand the training over to the worker pool
+                self.training_queue.submit(model_uuid, dataset, config)
+                queued = True
                 
-                if training_result.success:
-                    # Get the ACTUAL path where AutoGluon saved the model
-                    actual_model_path = training_result.model_path
-                    
-                    # Extract the actual UUID from the path
-                    actual_uuid = os.path.basename(actual_model_path)
-                    
-                    # Update the database record with the ACTUAL UUID and path
-                    model_record.uuid = actual_uuid  # Use AutoGluon's UUID
-                    model_record.model_path = actual_model_path
-                    
-                    self.model_repository.update_status(
-                        actual_uuid,  # Use the actual UUID
-                        ModelStatus.COMPLETED,
-                        {
-                            'best_score': training_result.best_score,
-                            'best_model_name': training_result.best_model_name
-                        }
-                    )
-                    
-                    # Return the ACTUAL UUID to the frontend
-                    return {
-                        'success': True,
-                        'model_uuid': actual_uuid,  # This will match the filesystem
-                        'model_name': config.model_name,
-                        'best_score': training_result.best_score,
-                        'best_model_name': training_result.best_model_name,
-                        'leaderboard': training_result.leaderboard
-                    }
-                else:
-                    # Update status to FAILED
-                    self.model_repository.update_status(
-                        model_record.uuid,
-                        ModelStatus.FAILED,
-                        {'error_message': training_result.error_message}
-                    )
-                    
-                    logger.error(f"Training failed for model: {model_record.uuid}")
-                    
-                    return {
-                        'success': False,
-                        'model_uuid': model_record.uuid,
-                        'error': training_result.error_message
-                    }
-                    
             except Exception as e:
-                # Update status to FAILED on exception
+                # Update status to FAILED if the job could not be queued
                 self.model_repository.update_status(
                     model_record.uuid,
                     ModelStatus.FAILED,
                     {'error_message': str(e)}
                 )
                 raise
+            
+            return {
+                'success': True,
+                'model_uuid': model_uuid,
+                'model_name': config.model_name,
+                'dataset_hash': dataset.dataset_hash,
+                'status': ModelStatus.TRAINING.value
+            }
                 
         except Exception as e:
             logger.error(f"Training service error: {str(e)}")
@@ -103,14 +104,51 @@ class ModelService:
                 'success': False,
                 'error': f"Training service error: {str(e)}"
             }
+        
+        finally:
+            if not queued:
+                self._discard_upload(dataset)
     
-    def get_all_models(self) -> List[Dict[str, Any]]:
-        """Get all trained models"""
+    def _discard_upload(self, dataset: DatasetInfo) -> None:
+        """Delete the uploaded file of a dataset, leaving stored datasets alone"""
+        if dataset.file_path and not self.dataset_store.is_stored_file(dataset.file_path):
+            try:
+                os.remove(dataset.file_path)
+            except FileNotFoundError:
+                pass
+    
+    def list_models(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        problem_type: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of trained models, newest first
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         try:
-            models = self.model_repository.get_all()
-            return [model.to_dict() for model in models]
+            models, next_cursor = self.model_repository.list_page(
+                limit,
+                cursor=cursor,
+                status=status,
+                problem_type=problem_type,
+                name_prefix=name_prefix,
+                fields=fields
+            )
+            return {
+                'models': [model.to_dict(fields) for model in models],
+                'next_cursor': next_cursor
+            }
+        except ValueError:
+            raise
         except Exception as e:
-            logger.error(f"Error retrieving models: {str(e)}")
+            logger.error(f"Error listing models: {str(e)}")
             raise
     
     def get_model_by_uuid(self, model_uuid: str) -> Optional[Dict[str, Any]]:
@@ -120,17 +158,15 @@ class ModelService:
             if not model:
                 return None
             
-            model_dict = model.to_dict()
+            # Models trained before details were stored get them computed once
+            if model.status == ModelStatus.COMPLETED.value and model.feature_columns is None:
+                self._backfill_model_details(model)
             
-            # Enrich with ML model information if available
-            if model.model_path and model.status == ModelStatus.COMPLETED.value:
-                ml_info = self.ml_service.get_model_info(model.model_path)
-                if ml_info:
-                    model_dict.update({
-                        'feature_columns': ml_info.get('feature_columns', []),
-                        'feature_importance': ml_info.get('feature_importance'),
-                        'detailed_leaderboard': ml_info.get('leaderboard')
-                    })
+            model_dict = model.to_dict()
+            model_dict.update({
+                'feature_importance': model.feature_importance,
+                'detailed_leaderboard': model.leaderboard
+            })
             
             return model_dict
             
@@ -138,6 +174,56 @@ class ModelService:
             logger.error(f"Error retrieving model {model_uuid}: {str(e)}")
             raise
     
+    def get_model_manifest(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        """Get the input schema manifest of a model"""
+        if not self.model_repository.exists(model_uuid):
+            return None
+        return self.ml_service.get_model_manifest(model_uuid)
+    
+    def get_prediction_schema(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the input features a model expects, without loading its predictor
+        
+        Features come from the model manifest, or from the stored feature
+        columns for models trained without one.
+        
+        Returns:
+            Dict with the model metadata, the manifest (None without one) and
+            the features, each a dict with its name and training categories
+        """
+        metadata = self.model_repository.get_metadata(model_uuid)
+        if metadata is None:
+            return None
+        
+        manifest = self.ml_service.get_model_manifest(model_uuid)
+        if manifest:
+            features = manifest['features']
+        else:
+            features = [
+                {'name': column, 'categories': None}
+                for column in self.model_repository.get_feature_columns(model_uuid) or []
+            ]
+        
+        return {'metadata': metadata, 'manifest': manifest, 'features': features}
+    
+    def _backfill_model_details(self, model) -> None:
+        """Compute and store the details of a model trained before they were stored"""
+        ml_info = self.ml_service.get_model_info(model.model_path)
+        if not ml_info:
+            return
+        
+        self.model_repository.update_status(
+            model.uuid,
+            ModelStatus.COMPLETED,
+            {
+                'eval_metric': ml_info['eval_metric'],
+                'feature_columns': ml_info['feature_columns'],
+                'leaderboard': ml_info['leaderboard'],
+                'feature_importance': ml_info['feature_importance']
+            }
+        )
+        logger.info(f"Stored details of model {model.uuid}")
+    
     def delete_model(self, model_uuid: str) -> bool:
         """Delete a model (database record and files)"""
         try:
@@ -145,22 +231,36 @@ class ModelService:
             if not model:
                 return False
             
+            dataset_hash = model.dataset_hash
+            
             # Delete ML model files
             if model.model_path:
                 self.ml_service.delete_model(model_uuid)
             
             # Delete database record
-            return self.model_repository.delete(model_uuid)
+            deleted = self.model_repository.delete(model_uuid)
+            
+            # Drop the stored dataset once no model references it
+            if deleted and dataset_hash and self.model_repository.count_by_dataset_hash(dataset_hash) == 0:
+                self.dataset_store.delete(dataset_hash)
+            
+            return deleted
             
         except Exception as e:
             logger.error(f"Error deleting model {model_uuid}: {str(e)}")
             raise
     
-    def predict(self, model_uuid: str, prediction_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Make predictions using a trained model"""
+    def predict(
+        self, 
+        model_uuid: str, 
+        prediction_data: List[Dict[str, Any]], 
+        include_probabilities: bool = True, 
+        prediction_columns: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make predictions using a trained model, from rows or from column arrays"""
         try:
-            # Validate model exists and is ready
-            model = self.model_repository.get_by_uuid(model_uuid)
+            # Validate model exists and is ready (cached, no database round trip)
+            model = self.model_repository.get_metadata(model_uuid)
             if not model:
                 return {
                     'success': False,
@@ -176,11 +276,13 @@ class ModelService:
             # Create prediction request
             request = PredictionRequest(
                 model_uuid=model_uuid,
-                data=prediction_data
+                data=prediction_data,
+                include_probabilities=include_probabilities,
+                columns=prediction_columns
             )
             
-            # Perform prediction
-            result = self.ml_service.predict(request)
+            # Perform prediction (coalesced with concurrent requests when batching is on)
+            result = self.prediction_batcher.predict(request)
             
             if result.success:
                 logger.info(f"Prediction completed for model: {model_uuid}")
@@ -190,14 +292,18 @@ class ModelService:
                     'model_name': model.name,
                     'predictions': result.predictions,
                     'probabilities': result.probabilities,
+                    'class_labels': result.class_labels,
                     'target_feature': model.target_feature
                 }
             else:
                 logger.error(f"Prediction failed for model: {model_uuid}")
-                return {
+                response = {
                     'success': False,
                     'error': result.error_message
                 }
+                if result.validation:
+                    response['validation'] = result.validation
+                return response
                 
         except Exception as e:
             logger.error(f"Prediction service error for model {model_uuid}: {str(e)}")
@@ -206,23 +312,217 @@ class ModelService:
                 'error': f"Prediction service error: {str(e)}"
             }
     
+    def predict_stream(
+        self, 
+        model_uuid: str, 
+        file_path: str, 
+        chunk_rows: int, 
+        include_probabilities: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Make predictions over a dataset file, reading and scoring it in chunks
+        
+        Returns:
+            Dict with 'predictions', an iterator of per-chunk DataFrames, on success
+        """
+        try:
+            model = self.model_repository.get_metadata(model_uuid)
+            if not model:
+                return {
+                    'success': False,
+                    'error': f'Model {model_uuid} not found'
+                }
+            
+            if model.status != ModelStatus.COMPLETED.value:
+                return {
+                    'success': False,
+                    'error': f'Model {model_uuid} is not ready for predictions. Status: {model.status}'
+                }
+            
+            predictions = self.ml_service.predict_chunks(
+                model_uuid,
+                iter_dataset_chunks(file_path, chunk_rows),
+                include_probabilities
+            )
+            
+            return {
+                'success': True,
+                'model_uuid': model_uuid,
+                'model_name': model.name,
+                'predictions': predictions
+            }
+            
+        except Exception as e:
+            logger.error(f"Streaming prediction error for model {model_uuid}: {str(e)}")
+            return {
+                'success': False,
+                'error': f"Prediction service error: {str(e)}"
+            }
+    
+    def submit_scoring_job(
+        self, 
+        model_uuid: str, 
+        input_path: str, 
+        input_name: str, 
+        include_probabilities: bool = True, 
+        delete_input: bool = False
+    ) -> Dict[str, Any]:
+        """Queue an offline batch-scoring job over a dataset file"""
+        model = self.model_repository.get_metadata(model_uuid)
+        if not model:
+            return {
+                'success': False,
+                'error': f'Model {model_uuid} not found'
+            }
+        
+        if model.status != ModelStatus.COMPLETED.value:
+            return {
+                'success': False,
+                'error': f'Model {model_uuid} is not ready for predictions. Status: {model.status}'
+            }
+        
+        job = self.scoring_jobs.submit(
+            model_uuid,
+            input_path,
+            input_name,
+            include_probabilities=include_probabilities,
+            delete_input=delete_input
+        )
+        
+        return {
+            'success': True,
+            'job': job.to_dict()
+        }
+    
+    def resolve_scoring_input(self, input_path: str) -> Optional[str]:
+        """Resolve a server-side scoring input file"""
+        return self.scoring_jobs.resolve_input_path(input_path)
+    
+    def get_scoring_job(self, model_uuid: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the progress of a batch-scoring job"""
+        job = self.scoring_jobs.get_job(model_uuid, job_id)
+        return job.to_dict() if job else None
+    
+    def list_scoring_jobs(self, model_uuid: str) -> Optional[List[Dict[str, Any]]]:
+        """List the batch-scoring jobs of a model"""
+        if not self.model_repository.exists(model_uuid):
+            return None
+        return [job.to_dict() for job in self.scoring_jobs.list_jobs(model_uuid)]
+    
+    def get_scoring_result_path(self, model_uuid: str, job_id: str) -> Optional[Path]:
+        """Get the Parquet result file of a completed batch-scoring job"""
+        return self.scoring_jobs.get_result_path(model_uuid, job_id)
+    
+    def pin_model(self, model_uuid: str) -> bool:
+        """Keep a model loaded in the predictor cache"""
+        if not self.model_repository.exists(model_uuid):
+            return False
+        
+        self.ml_service.pin_model(model_uuid)
+        return True
+    
+    def unpin_model(self, model_uuid: str) -> bool:
+        """Let a pinned model be evicted from the predictor cache"""
+        if not self.model_repository.exists(model_uuid):
+            return False
+        
+        self.ml_service.unpin_model(model_uuid)
+        return True
+    
+    def get_batching_config(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        """Get the micro-batching settings of a model"""
+        if not self.model_repository.exists(model_uuid):
+            return None
+        return self.prediction_batcher.get_config(model_uuid).to_dict()
+    
+    def update_batching_config(self, model_uuid: str, settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Override the micro-batching settings of a model"""
+        if not self.model_repository.exists(model_uuid):
+            return None
+        return self.prediction_batcher.configure(model_uuid, **settings).to_dict()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get predictor cache statistics"""
+        return self.ml_service.get_cache_stats()
+    
+    def get_storage_usage(self) -> Dict[str, Any]:
+        """Get the disk usage of all models, with totals per storage tier"""
+        return self.ml_service.get_storage_usage()
+    
+    def get_model_storage(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        """Get the disk usage and storage tier of a model"""
+        if not self.model_repository.exists(model_uuid):
+            return None
+        return self.ml_service.get_storage_usage(model_uuid)
+    
+    def archive_idle_models(self, older_than_days: float) -> Dict[str, Any]:
+        """Move models not used for older_than_days to the compressed cold tier"""
+        return self.ml_service.archive_idle_models(older_than_days)
+    
+    def start_garbage_collection(self, dry_run: bool = False) -> None:
+        """
+        Start reclaiming orphan model directories and stale training records
+        
+        Raises:
+            RuntimeError: If a run is already in progress or collection is unavailable
+        """
+        if self.model_reconciler is None:
+            raise RuntimeError("Garbage collection is not available")
+        self.model_reconciler.run_in_background(dry_run)
+    
+    def get_garbage_collection_status(self) -> Dict[str, Any]:
+        """Get whether garbage collection is running and the report of the last run"""
+        if self.model_reconciler is None:
+            return {'available': False, 'running': False, 'last_report': None}
+        return {
+            'available': True,
+            'running': self.model_reconciler.is_running(),
+            'last_report': self.model_reconciler.get_last_report()
+        }
+    
+    def get_dataset(self, dataset_hash: str) -> Optional[DatasetInfo]:
+        """Get a stored dataset by hash"""
+        return self.dataset_store.get(dataset_hash)
+    
+    def get_dataset_info(self, dataset_hash: str) -> Optional[Dict[str, Any]]:
+        """Get the metadata and reference count of a stored dataset"""
+        metadata = self.dataset_store.get_metadata(dataset_hash)
+        if metadata is None:
+            return None
+        
+        metadata['references'] = self.model_repository.count_by_dataset_hash(dataset_hash)
+        return metadata
+    
     def get_model_status(self, model_uuid: str) -> Optional[str]:
         """Get the current status of a model"""
         try:
-            model = self.model_repository.get_by_uuid(model_uuid)
+            model = self.model_repository.get_metadata(model_uuid)
             return model.status if model else None
         except Exception as e:
             logger.error(f"Error getting model status {model_uuid}: {str(e)}")
             return None
     
+    def get_training_job_state(self, model_uuid: str) -> Optional[str]:
+        """Get the queue state of a training job ('queued' or 'running')"""
+        if self.training_queue is None:
+            return None
+        return self.training_queue.get_job_state(model_uuid)
+    
+    def get_training_resources(self) -> Dict[str, Any]:
+        """Get the training budget and how much of it is in use"""
+        return self.training_queue.get_usage()
+    
     def _validate_training_inputs(self, dataset: DatasetInfo, config: TrainingConfig) -> None:
         """Validate training inputs"""
         if not dataset.headers:
             raise ValueError("Dataset must have headers")
         
-        if not dataset.rows:
+        if not dataset.rows and not dataset.file_path:
             raise ValueError("Dataset must have data rows")
         
+        if dataset.file_path and dataset.total_rows == 0:
+            raise ValueError("Dataset file must have data rows")
+        
         if config.target_feature not in dataset.headers:
             raise ValueError(f"Target feature '{config.target_feature}' not found in dataset headers")
         
@@ -0,0 +1,527 @@
+# BE/app/services/model_storage.py
+import logging
+import os
+import shutil
+import sqlite3
+import tarfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # Optional: models are never archived without it
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows: locks then only hold within this process
+    fcntl = None
+
+from services.model_layout import REHYDRATE_DIR_NAME, SCORING_DIR_NAME, ModelIndex, iter_model_dirs
+from services.model_manifest import MANIFEST_FILENAME
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILENAME = 'artifacts.tar.zst'
+
+# Lock files in each model directory, shared by all processes serving it
+LOCK_FILENAME = '.lock'      # Held while archiving, rehydrating or deleting
+IN_USE_FILENAME = '.in_use'  # Held shared by every process with the model loaded
+
+# Written by AutoGluon once a predictor is saved; marks complete hot artifacts
+PREDICTOR_FILENAME = 'predictor.pkl'
+
+# Left outside the archive so they stay readable while a model is cold
+KEPT_ENTRIES = frozenset([MANIFEST_FILENAME, SCORING_DIR_NAME, ARCHIVE_FILENAME, LOCK_FILENAME, IN_USE_FILENAME])
+
+COMPRESSION_LEVEL = 10
+
+class ModelStorageManager:
+    """
+    Moves idle models between a hot and a cold storage tier
+
+    Hot models keep their AutoGluon artifacts as plain files. Cold models
+    have them packed into a zstd-compressed tarball inside the model
+    directory; the manifest and scoring results stay outside the archive,
+    so schema lookups and job listings work without rehydrating.
+
+    A model is idle when it has not been used for the given number of
+    days. Use times are tracked in memory on every prediction and written
+    to the model index on load and on each sweep, so they survive
+    restarts. Models the ML service holds in memory are never archived.
+
+    Several processes may serve the same models directory. Archiving,
+    rehydration and deletion of a model hold an exclusive file lock in its
+    directory, and every process holds a shared lock on the model's in-use
+    file while the model is loaded, which archiving never waits for: a
+    model loaded anywhere is skipped.
+    """
+
+    def __init__(
+        self,
+        models_base_path: Path,
+        get_model_path: Callable[[str], Path],
+        model_index: ModelIndex,
+        is_in_use: Callable[[str], bool] = lambda model_uuid: False,
+        compression_level: int = COMPRESSION_LEVEL
+    ):
+        self.models_base_path = Path(models_base_path)
+        self.get_model_path = get_model_path
+        self.model_index = model_index
+        self.is_in_use = is_in_use
+        self.compression_level = compression_level
+
+        self._last_used: Dict[str, float] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        # Descriptors of the in-use files this process holds shared locks on
+        self._held: Dict[str, int] = {}
+
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+
+    @property
+    def archiving_available(self) -> bool:
+        return zstandard is not None
+
+    @contextmanager
+    def model_lock(self, model_uuid: str) -> Iterator[None]:
+        """Hold the lock serializing archive, rehydration and deletion of a model"""
+        with self._locks_lock:
+            lock = self._locks.setdefault(model_uuid, threading.Lock())
+        with lock:
+            fd = _lock_file(self.get_model_path(model_uuid) / LOCK_FILENAME, _LOCK_EX)
+            try:
+                yield
+            finally:
+                if fd is not None:
+                    os.close(fd)
+
+    def hold(self, model_uuid: str) -> None:
+        """
+        Mark a model as loaded by this process until it is released
+
+        Waits while another process is archiving the model.
+        """
+        with self._locks_lock:
+            if model_uuid in self._held:
+                return
+
+        fd = _lock_file(self.get_model_path(model_uuid) / IN_USE_FILENAME, _LOCK_SH)
+        if fd is None:
+            return
+
+        with self._locks_lock:
+            if model_uuid in self._held:
+                os.close(fd)
+            else:
+                self._held[model_uuid] = fd
+
+    def release(self, model_uuid: str) -> None:
+        """Mark a model as no longer loaded by this process"""
+        with self._locks_lock:
+            fd = self._held.pop(model_uuid, None)
+        if fd is not None:
+            os.close(fd)
+
+    def mark_used(self, model_uuid: str) -> None:
+        """Record a use of a model; cheap enough for every prediction"""
+        self._last_used[model_uuid] = time.time()
+
+    def register(self, model_uuid: str) -> None:
+        """Add a newly trained model to the index"""
+        self._index(model_uuid, last_access=time.time())
+
+    def forget(self, model_uuid: str) -> None:
+        """Drop a deleted model from the index and the tracked uses"""
+        self._last_used.pop(model_uuid, None)
+        self.release(model_uuid)
+        with self._locks_lock:
+            self._locks.pop(model_uuid, None)
+        self.model_index.remove(model_uuid)
+
+    def is_archived(self, model_uuid: str) -> bool:
+        return (self.get_model_path(model_uuid) / ARCHIVE_FILENAME).exists()
+
+    def ensure_hot(self, model_uuid: str, record_use: bool = True) -> bool:
+        """
+        Rehydrate a cold model so its predictor can be loaded
+
+        Loading counts as a use of the model unless record_use is False.
+
+        Returns:
+            True if the model was rehydrated, False if it was already hot
+
+        Raises:
+            RuntimeError: If the model is cold and zstandard is not installed
+        """
+        if not self.is_archived(model_uuid):
+            if record_use:
+                self._touch(model_uuid)
+            return False
+
+        with self.model_lock(model_uuid):
+            model_dir = self.get_model_path(model_uuid)
+            if not (model_dir / ARCHIVE_FILENAME).exists():
+                return False
+
+            start = time.monotonic()
+            self._rehydrate(model_dir)
+            self._index(model_uuid, last_access=time.time() if record_use else None)
+
+        logger.info(f"Model {model_uuid} rehydrated from archive in {time.monotonic() - start:.2f}s")
+        return True
+
+    def archive(self, model_uuid: str, older_than_days: float = 0) -> Optional[int]:
+        """
+        Pack the artifacts of a hot model into its archive
+
+        Returns:
+            Bytes reclaimed, or None if the model was skipped because it is
+            in use, used within older_than_days, already cold or incomplete
+        """
+        if not self.archiving_available:
+            raise RuntimeError("Archiving models requires the zstandard package")
+
+        with self.model_lock(model_uuid):
+            model_dir = self.get_model_path(model_uuid)
+            if not (model_dir / PREDICTOR_FILENAME).exists() or (model_dir / ARCHIVE_FILENAME).exists():
+                return None
+            if self.is_in_use(model_uuid):
+                return None
+            if time.time() - self.get_last_used(model_uuid) < older_than_days * 86400:
+                return None
+
+            # Loaded by another process: skip it instead of waiting
+            fd = _lock_file(model_dir / IN_USE_FILENAME, _LOCK_EX | _LOCK_NB)
+            if fd is None:
+                return None
+            try:
+                reclaimed = self._archive(model_dir)
+            finally:
+                os.close(fd)
+            self._index(model_uuid, last_access=self.get_last_used(model_uuid))
+
+        logger.info(f"Model {model_uuid} archived, {reclaimed} bytes reclaimed")
+        return reclaimed
+
+    def archive_idle(self, older_than_days: float) -> Dict[str, Any]:
+        """Archive every hot model not used for older_than_days"""
+        # Persist use times first, so they survive a restart before the next load
+        for model_uuid, last_used in list(self._last_used.items()):
+            if self.get_model_path(model_uuid).is_dir():
+                self._touch(model_uuid, last_used)
+
+        archived: List[str] = []
+        reclaimed_bytes = 0
+        failed: List[str] = []
+
+        for model_uuid in self._iter_model_uuids():
+            try:
+                reclaimed = self.archive(model_uuid, older_than_days)
+            except Exception as e:
+                logger.error(f"Failed to archive model {model_uuid}: {str(e)}")
+                failed.append(model_uuid)
+                continue
+
+            if reclaimed is not None:
+                archived.append(model_uuid)
+                reclaimed_bytes += reclaimed
+
+        return {
+            'archived': archived,
+            'failed': failed,
+            'reclaimed_bytes': reclaimed_bytes
+        }
+
+    def get_last_used(self, model_uuid: str) -> float:
+        """Get the last use of a model, falling back to when it was written"""
+        last_used = self._last_used.get(model_uuid, 0.0)
+
+        entry = self.model_index.get(model_uuid)
+        if entry is not None and entry['last_access'] is not None:
+            return max(last_used, entry['last_access'])
+
+        model_dir = self.get_model_path(model_uuid)
+        for path in (model_dir / PREDICTOR_FILENAME, model_dir):
+            try:
+                return max(last_used, os.stat(path).st_mtime)
+            except OSError:
+                continue
+        return last_used
+
+    def get_model_usage(self, model_uuid: str) -> Optional[Dict[str, Any]]:
+        """Get the disk usage and tier of a model"""
+        model_dir = self.get_model_path(model_uuid)
+        if not model_dir.is_dir():
+            return None
+
+        files_bytes = 0
+        archive_bytes = 0
+        for entry in model_dir.iterdir():
+            if entry.name == ARCHIVE_FILENAME:
+                archive_bytes += _path_size(entry)
+            else:
+                files_bytes += _path_size(entry)
+
+        return {
+            'model_uuid': model_uuid,
+            'tier': 'cold' if archive_bytes else 'hot',
+            'files_bytes': files_bytes,
+            'archive_bytes': archive_bytes,
+            'total_bytes': files_bytes + archive_bytes,
+            'last_used_at': datetime.utcfromtimestamp(self.get_last_used(model_uuid)).isoformat()
+        }
+
+    def get_usage(self) -> Dict[str, Any]:
+        """
+        Get the disk usage of every model, with totals per tier
+
+        Read from the model index: sizes are recorded when a model is
+        trained, archived or rehydrated, and by rebuild_index.
+        """
+        tiers = {
+            'hot': {'models': 0, 'bytes': 0},
+            'cold': {'models': 0, 'bytes': 0}
+        }
+        models = []
+
+        for entry in self.model_index.all():
+            tier = tiers.setdefault(entry['tier'], {'models': 0, 'bytes': 0})
+            tier['models'] += 1
+            tier['bytes'] += entry['size_bytes']
+            models.append({
+                'model_uuid': entry['uuid'],
+                'tier': entry['tier'],
+                'total_bytes': entry['size_bytes'],
+                'last_used_at': (
+                    datetime.utcfromtimestamp(entry['last_access']).isoformat()
+                    if entry['last_access'] is not None else None
+                )
+            })
+
+        return {
+            'tiers': tiers,
+            'total_bytes': sum(tier['bytes'] for tier in tiers.values()),
+            'archiving_available': self.archiving_available,
+            'models': models
+        }
+
+    def rebuild_index(self) -> int:
+        """
+        Index every model directory from scratch, measuring its size
+
+        Walks all model directories; meant for migrations and repairs.
+
+        Returns:
+            Number of models indexed
+        """
+        indexed = set()
+        for model_uuid, _ in iter_model_dirs(self.models_base_path):
+            self._index(model_uuid, last_access=self.get_last_used(model_uuid))
+            indexed.add(model_uuid)
+
+        for entry in self.model_index.all():
+            if entry['uuid'] not in indexed:
+                self.model_index.remove(entry['uuid'])
+
+        return len(indexed)
+
+    def start_sweeper(self, interval_seconds: float, older_than_days: float) -> None:
+        """Archive idle models periodically on a background thread"""
+        if not self.archiving_available:
+            logger.warning("zstandard is not installed: idle models will not be archived")
+            return
+        if self._sweeper is not None:
+            return
+
+        def sweep() -> None:
+            while not self._stop_sweeper.wait(interval_seconds):
+                try:
+                    result = self.archive_idle(older_than_days)
+                    if result['archived']:
+                        logger.info(
+                            f"Archived {len(result['archived'])} idle models, "
+                            f"{result['reclaimed_bytes']} bytes reclaimed"
+                        )
+                except Exception as e:
+                    logger.error(f"Model archive sweep failed: {str(e)}")
+
+        self._sweeper = threading.Thread(target=sweep, name='model-archive-sweeper', daemon=True)
+        self._sweeper.start()
+        logger.info(f"Models idle for {older_than_days} days are archived every {interval_seconds}s")
+
+    def stop_sweeper(self) -> None:
+        self._stop_sweeper.set()
+
+    def _archive(self, model_dir: Path) -> int:
+        """Replace the artifacts of a model directory by their archive"""
+        entries = [
+            entry for entry in model_dir.iterdir()
+            if entry.name not in KEPT_ENTRIES
+            and entry.name != REHYDRATE_DIR_NAME
+            and not entry.name.endswith('.tmp')
+        ]
+        files_bytes = sum(_path_size(entry) for entry in entries)
+
+        archive_path = model_dir / ARCHIVE_FILENAME
+        tmp_path = archive_path.with_name(f"{ARCHIVE_FILENAME}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            compressor = zstandard.ZstdCompressor(level=self.compression_level, threads=-1)
+            with open(tmp_path, 'wb') as archive_file:
+                with compressor.stream_writer(archive_file, closefd=False) as writer:
+                    with tarfile.open(fileobj=writer, mode='w|') as tar:
+                        for entry in entries:
+                            tar.add(entry, arcname=entry.name)
+            os.replace(tmp_path, archive_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        # The archive is complete: from here on the model counts as cold
+        for entry in entries:
+            _remove_path(entry)
+
+        return files_bytes - archive_path.stat().st_size
+
+    def _rehydrate(self, model_dir: Path) -> None:
+        """Unpack the archive of a model directory and remove it"""
+        if zstandard is None:
+            raise RuntimeError("Rehydrating archived models requires the zstandard package")
+
+        archive_path = model_dir / ARCHIVE_FILENAME
+        staging_dir = model_dir / REHYDRATE_DIR_NAME
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+        with open(archive_path, 'rb') as archive_file:
+            with zstandard.ZstdDecompressor().stream_reader(archive_file) as reader:
+                with tarfile.open(fileobj=reader, mode='r|') as tar:
+                    _extract_archive(tar, staging_dir)
+
+        # Files left by an interrupted archive are replaced by their archived copy
+        for entry in staging_dir.iterdir():
+            target = model_dir / entry.name
+            if target.exists():
+                _remove_path(target)
+            os.replace(entry, target)
+
+        staging_dir.rmdir()
+        archive_path.unlink()
+
+    def _touch(self, model_uuid: str, timestamp: Optional[float] = None) -> None:
+        """Persist the last use of a model in the index"""
+        try:
+            self.model_index.upsert(
+                model_uuid,
+                self.get_model_path(model_uuid),
+                last_access=timestamp or time.time()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record use of model {model_uuid}: {str(e)}")
+
+    def _index(self, model_uuid: str, last_access: Optional[float] = None) -> None:
+        """Record the current tier and size of a model in the index"""
+        usage = self.get_model_usage(model_uuid)
+        if usage is None:
+            return
+
+        self.model_index.upsert(
+            model_uuid,
+            self.get_model_path(model_uuid),
+            tier=usage['tier'],
+            size_bytes=usage['total_bytes'],
+            last_access=last_access
+        )
+
+    def _iter_model_uuids(self) -> Iterator[str]:
+        for model_uuid, _ in iter_model_dirs(self.models_base_path):
+            yield model_uuid
+
+_LOCK_SH = fcntl.LOCK_SH if fcntl else 0
+_LOCK_EX = fcntl.LOCK_EX if fcntl else 0
+_LOCK_NB = fcntl.LOCK_NB if fcntl else 0
+
+def _lock_file(path: Path, operation: int) -> Optional[int]:
+    """
+    Open and flock a lock file, returning its descriptor
+
+    Closing the descriptor releases the lock. Returns None when the
+    model directory does not exist or a non-blocking lock is taken, and
+    an unlocked descriptor where flock is not available.
+    """
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        return None
+    if fcntl is None:
+        return fd
+
+    try:
+        fcntl.flock(fd, operation)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+def _extract_archive(tar: tarfile.TarFile, destination: Path) -> None:
+    """
+    Extract an archive, refusing members that would land outside destination
+
+    Uses the 'data' extraction filter where tarfile has it (Python 3.12,
+    and security releases of 3.8 to 3.11); older interpreters get the
+    same path checks done here.
+    """
+    if hasattr(tarfile, 'data_filter'):
+        tar.extractall(destination, filter='data')
+        return
+
+    root = Path(destination).resolve()
+    for member in tar:
+        target = (root / member.name).resolve()
+        if member.issym():
+            link_target = (target.parent / member.linkname).resolve()
+        elif member.islnk():
+            link_target = (root / member.linkname).resolve()
+        elif member.isfile() or member.isdir():
+            link_target = root
+        else:
+            raise tarfile.TarError(f"Refusing to extract special file {member.name}")
+
+        if os.path.isabs(member.name) or os.path.isabs(member.linkname) \
+                or not target.is_relative_to(root) or not link_target.is_relative_to(root):
+            raise tarfile.TarError(f"Refusing to extract {member.name} outside {destination}")
+
+        # Like the data filter: no setuid/setgid bits, nothing writable by group or others
+        member.mode &= 0o755
+        tar.extract(member, destination)
+
+def _path_size(path: Path) -> int:
+    """Get the size of a file, or of all files under a directory"""
+    if not path.is_dir():
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+def _remove_path(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
@@ -0,0 +1,241 @@
+# BE/app/services/prediction_batcher.py
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, replace
+from typing import Dict, Any, List, Optional, Tuple
+
+import pandas as pd
+
+from services.base import PredictionRequest, PredictionResult
+from services.interfaces import IMLService
+from utils.dataframe_utils import build_prediction_frame
+
+logger = logging.getLogger(__name__)
+
+# A model's batching thread exits after this long without requests
+IDLE_TIMEOUT_SECONDS = 60
+
+# How long a caller waits for its batch, including loading a cold model
+RESULT_TIMEOUT_SECONDS = 300
+
+@dataclass
+class BatchingConfig:
+    """Micro-batching settings of a model"""
+    enabled: bool = False
+    window_ms: float = 5.0   # How long the first request of a batch waits for others
+    max_rows: int = 512      # Rows that close a batch before the window ends
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'window_ms': self.window_ms,
+            'max_rows': self.max_rows
+        }
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent prediction requests for the same model
+
+    Requests arriving within a short window are concatenated, run through
+    one inference call and the results are split back to each caller, so
+    many small requests share the fixed per-call overhead. Batching is
+    opt-in, globally or per model.
+    """
+
+    def __init__(self, ml_service: IMLService, default_config: Optional[BatchingConfig] = None):
+        self.ml_service = ml_service
+        self.default_config = default_config or BatchingConfig()
+
+        self._model_configs: Dict[str, BatchingConfig] = {}
+        self._queues: Dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def predict(self, request: PredictionRequest) -> PredictionResult:
+        """Make predictions, batching the request with concurrent ones if enabled"""
+        config = self.get_config(request.model_uuid)
+
+        # Requests that fill a batch on their own gain nothing from waiting
+        if not config.enabled or request.num_rows >= config.max_rows:
+            return self.ml_service.predict(request)
+
+        future: Future = Future()
+        with self._lock:
+            model_queue = self._queues.get(request.model_uuid)
+            if model_queue is None:
+                model_queue = queue.Queue()
+                self._queues[request.model_uuid] = model_queue
+                threading.Thread(
+                    target=self._run_batches,
+                    args=(request.model_uuid, model_queue),
+                    name=f"prediction-batcher-{request.model_uuid}",
+                    daemon=True
+                ).start()
+            model_queue.put((request, future))
+
+        try:
+            return future.result(timeout=RESULT_TIMEOUT_SECONDS)
+        except FuturesTimeoutError:
+            logger.error(f"Batched prediction for model {request.model_uuid} timed out after {RESULT_TIMEOUT_SECONDS}s")
+            return PredictionResult(
+                success=False,
+                error_message=f"Prediction timed out after {RESULT_TIMEOUT_SECONDS} seconds"
+            )
+
+    def get_config(self, model_uuid: str) -> BatchingConfig:
+        """Get the batching settings of a model"""
+        with self._lock:
+            return self._model_configs.get(model_uuid, self.default_config)
+
+    def configure(self, model_uuid: str, **settings: Any) -> BatchingConfig:
+        """Override batching settings for a model (enabled, window_ms, max_rows)"""
+        with self._lock:
+            config = replace(self._model_configs.get(model_uuid, self.default_config), **settings)
+            self._model_configs[model_uuid] = config
+
+        logger.info(f"Batching for model {model_uuid} set to {config.to_dict()}")
+        return config
+
+    def reset(self, model_uuid: str) -> None:
+        """Drop a model's overrides, going back to the default settings"""
+        with self._lock:
+            self._model_configs.pop(model_uuid, None)
+
+    def _run_batches(self, model_uuid: str, model_queue: queue.Queue) -> None:
+        """Collect and run batches for one model until it goes idle"""
+        try:
+            while True:
+                try:
+                    first = model_queue.get(timeout=IDLE_TIMEOUT_SECONDS)
+                except queue.Empty:
+                    with self._lock:
+                        # Items are only queued under the lock, so empty here means idle
+                        if model_queue.empty():
+                            del self._queues[model_uuid]
+                            return
+                    continue
+
+                batch = [first]
+                try:
+                    config = self.get_config(model_uuid)
+                    rows = first[0].num_rows
+                    deadline = time.monotonic() + config.window_ms / 1000.0
+
+                    while rows < config.max_rows:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            item = model_queue.get(timeout=remaining)
+                        except queue.Empty:
+                            break
+                        batch.append(item)
+                        rows += item[0].num_rows
+
+                    self._run_batch(model_uuid, batch)
+                except Exception as e:
+                    logger.error(f"Prediction batch for model {model_uuid} failed: {str(e)}")
+                    self._fail(batch, e)
+        except BaseException as e:
+            # Never leave a queue registered without a thread draining it
+            with self._lock:
+                if self._queues.get(model_uuid) is model_queue:
+                    del self._queues[model_uuid]
+            pending = []
+            while not model_queue.empty():
+                pending.append(model_queue.get_nowait())
+            self._fail(pending, e)
+            raise
+
+    def _run_batch(self, model_uuid: str, batch: List[Tuple[PredictionRequest, Future]]) -> None:
+        """Run a batch, one inference per group of requests with the same columns"""
+        groups: Dict[Any, List[Tuple[PredictionRequest, Future]]] = {}
+        for item in batch:
+            # Requests with rows of differing columns are run on their own
+            signature = _column_signature(item[0]) or id(item)
+            groups.setdefault(signature, []).append(item)
+
+        for group in groups.values():
+            try:
+                self._run_group(model_uuid, group)
+            except Exception as e:
+                logger.error(f"Batched prediction failed for model {model_uuid}: {str(e)}")
+                self._fail(group, e)
+
+    def _run_group(self, model_uuid: str, batch: List[Tuple[PredictionRequest, Future]]) -> None:
+        """Run one inference for requests with the same columns and split the results back"""
+        if len(batch) == 1:
+            request, future = batch[0]
+            self._resolve(future, lambda: self.ml_service.predict(request))
+            return
+
+        include_probabilities = any(request.include_probabilities for request, _ in batch)
+        if all(request.columns is None for request, _ in batch):
+            merged = PredictionRequest(
+                model_uuid=model_uuid,
+                data=[row for request, _ in batch for row in request.data],
+                include_probabilities=include_probabilities
+            )
+        else:
+            frame = pd.concat([build_prediction_frame(request) for request, _ in batch], ignore_index=True)
+            merged = PredictionRequest(
+                model_uuid=model_uuid,
+                data=[],
+                include_probabilities=include_probabilities,
+                columns={column: frame[column].values for column in frame.columns}
+            )
+
+        try:
+            result = self.ml_service.predict(merged)
+        except Exception as e:
+            result = PredictionResult(success=False, error_message=str(e))
+
+        if not result.success:
+            # One bad request must not fail the others: retry them one by one
+            logger.warning(f"Batched prediction failed for model {model_uuid}, retrying {len(batch)} requests individually")
+            for request, future in batch:
+                self._resolve(future, lambda request=request: self.ml_service.predict(request))
+            return
+
+        logger.info(f"Batched {len(batch)} requests ({merged.num_rows} rows) for model {model_uuid}")
+
+        offset = 0
+        for request, future in batch:
+            end = offset + request.num_rows
+            future.set_result(PredictionResult(
+                success=True,
+                predictions=result.predictions[offset:end],
+                probabilities=(
+                    result.probabilities[offset:end]
+                    if request.include_probabilities and result.probabilities is not None else None
+                ),
+                class_labels=result.class_labels if request.include_probabilities else None
+            ))
+            offset = end
+
+    def _resolve(self, future: Future, predict) -> None:
+        """Run a prediction and hand its outcome to the waiting caller"""
+        try:
+            future.set_result(predict())
+        except Exception as e:
+            future.set_exception(e)
+
+    def _fail(self, batch: List[Tuple[PredictionRequest, Future]], error: BaseException) -> None:
+        """Fail the callers of a batch that have not been answered yet"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+def _column_signature(request: PredictionRequest) -> Optional[frozenset]:
+    """Get the columns of a request, None if its rows do not all have the same ones"""
+    if request.columns is not None:
+        return frozenset(request.columns)
+
+    if not all(isinstance(row, dict) for row in request.data):
+        return None
+    signature = frozenset(request.data[0]) if request.data else frozenset()
+    if any(frozenset(row) != signature for row in request.data):
+        return None
+    return signature
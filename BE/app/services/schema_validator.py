@@ -0,0 +1,194 @@
+# BE/app/services/schema_validator.py
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Per-cell errors listed in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+TRUE_VALUES = frozenset(['true', '1', 'yes', 't', 'y'])
+FALSE_VALUES = frozenset(['false', '0', 'no', 'f', 'n'])
+
+@dataclass
+class SchemaValidationReport:
+    """Outcome of checking a prediction batch against a model's input schema"""
+    row_count: int
+    missing_columns: List[str] = field(default_factory=list)
+    ignored_columns: List[str] = field(default_factory=list)
+    missing_values: Dict[str, int] = field(default_factory=dict)  # Nulls in features never null in training
+    unknown_categories: Dict[str, int] = field(default_factory=dict)  # Values not seen in training
+    invalid_rows: int = 0
+    error_count: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.missing_columns and self.error_count == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'row_count': self.row_count,
+            'missing_columns': self.missing_columns,
+            'ignored_columns': self.ignored_columns,
+            'missing_values': self.missing_values,
+            'unknown_categories': self.unknown_categories,
+            'invalid_rows': self.invalid_rows,
+            'error_count': self.error_count,
+            'errors': self.errors
+        }
+
+class SchemaValidationError(ValueError):
+    """Raised when prediction data does not match a model's input schema"""
+
+    def __init__(self, report: SchemaValidationReport):
+        self.report = report
+        if report.missing_columns:
+            message = f"Missing feature columns: {report.missing_columns}"
+        else:
+            message = f"{report.invalid_rows} of {report.row_count} rows do not match the model schema"
+        super().__init__(message)
+
+class SchemaValidator:
+    """
+    Checks and coerces prediction batches against a model manifest
+
+    Every row is checked with whole-column operations: each feature is
+    coerced to its training type at once and the cells that fail are found
+    with boolean masks, so a 100k-row batch costs a handful of vectorized
+    passes rather than a Python loop per row.
+
+    Values that cannot be coerced are errors. Missing values and unseen
+    categories are only counted, since AutoGluon handles both.
+    """
+
+    def __init__(self, features: List[Dict[str, Any]], label: Optional[str] = None):
+        self.features = features
+        self.label = label
+        self.feature_names = [feature['name'] for feature in features]
+
+    @classmethod
+    def from_manifest(cls, manifest: Dict[str, Any]) -> 'SchemaValidator':
+        return cls(manifest['features'], label=manifest.get('label'))
+
+    def validate(self, df: pd.DataFrame, row_offset: int = 0) -> Tuple[pd.DataFrame, SchemaValidationReport]:
+        """
+        Check every row of a batch and coerce its columns to the training types
+
+        Reported row numbers are positions in the batch plus row_offset.
+
+        Returns:
+            Tuple of (DataFrame with only the feature columns, in training
+            order, coerced; validation report)
+        """
+        report = SchemaValidationReport(row_count=len(df))
+        report.missing_columns = [name for name in self.feature_names if name not in df.columns]
+        report.ignored_columns = [
+            column for column in df.columns
+            if column not in self.feature_names and column != self.label
+        ]
+        if report.missing_columns:
+            return df, report
+
+        coerced: Dict[str, Any] = {}
+        invalid = np.zeros(len(df), dtype=bool)
+
+        for feature in self.features:
+            name = feature['name']
+            series, failed, message = self._coerce(df[name], feature)
+            coerced[name] = series
+            self._count_unexpected_values(series, feature, report)
+
+            if failed is None or not failed.any():
+                continue
+
+            invalid |= failed
+            failed_rows = np.flatnonzero(failed)
+            report.error_count += len(failed_rows)
+
+            for row in failed_rows[:MAX_REPORTED_ERRORS - len(report.errors)]:
+                report.errors.append({
+                    'row': int(row) + row_offset,
+                    'column': name,
+                    'value': _json_value(df[name].iat[row]),
+                    'error': message
+                })
+
+        report.invalid_rows = int(invalid.sum())
+        return pd.DataFrame(coerced, index=df.index, copy=False), report
+
+    def _coerce(self, series: pd.Series, feature: Dict[str, Any]) -> Tuple[pd.Series, Optional[np.ndarray], str]:
+        """
+        Coerce a column to a feature's training type
+
+        Returns:
+            Tuple of (coerced column, mask of failed cells or None, error message)
+        """
+        feature_type = feature.get('type')
+        present = series.notna().to_numpy()
+
+        if feature_type in ('int', 'float'):
+            if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                coerced = series
+            else:
+                coerced = pd.to_numeric(series, errors='coerce')
+            failed = present & coerced.isna().to_numpy()
+            message = f"Expected a number ({feature.get('dtype')})"
+
+        elif feature_type == 'bool':
+            if pd.api.types.is_bool_dtype(series.dtype):
+                return series, None, ''
+            text = series.astype(str).str.strip().str.lower()
+            coerced = pd.Series(
+                np.where(text.isin(TRUE_VALUES), True, np.where(text.isin(FALSE_VALUES), False, None)),
+                index=series.index
+            ).where(series.notna())
+            failed = present & coerced.isna().to_numpy()
+            message = "Expected a boolean"
+
+        elif feature_type == 'datetime':
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                return series, None, ''
+            # Each cell is parsed on its own, so clients may mix date formats within a batch
+            coerced = pd.to_datetime(series, errors='coerce', format='mixed')
+            failed = present & coerced.isna().to_numpy()
+            message = "Expected a date"
+
+        else:
+            # Text and categorical features are matched as strings
+            if pd.api.types.is_object_dtype(series.dtype) or isinstance(series.dtype, pd.CategoricalDtype):
+                coerced = series
+            else:
+                coerced = series.astype(object).where(series.isna(), series.astype(str))
+            failed = None
+            message = ''
+
+        return coerced, failed, message
+
+    def _count_unexpected_values(self, series: pd.Series, feature: Dict[str, Any], report: SchemaValidationReport) -> None:
+        """Count nulls and categories the model did not see in training"""
+        name = feature['name']
+
+        if not feature.get('nullable', True):
+            missing = int(series.isna().sum())
+            if missing:
+                report.missing_values[name] = missing
+
+        if feature.get('categories'):
+            unknown = int((series.notna() & ~series.isin(feature['categories'])).sum())
+            if unknown:
+                report.unknown_categories[name] = unknown
+
+def _json_value(value: Any) -> Any:
+    """Make a cell value safe to put in a JSON error report"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
@@ -0,0 +1,240 @@
+# BE/app/services/scoring_jobs.py
+import json
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from services.base import ScoringJob, ScoringJobStatus
+from services.interfaces import IMLService
+from services.model_layout import SCORING_DIR_NAME
+from utils.dataset_files import iter_dataset_chunks, count_dataset_rows, get_dataset_format
+
+logger = logging.getLogger(__name__)
+
+class ScoringJobManager:
+    """
+    Runs offline batch-scoring jobs on background threads
+
+    Jobs run in the web process so they share the loaded predictors of the
+    ML service. Input files are read in chunks and the predictions are
+    appended to a Parquet file next to the model artifacts, so memory use
+    does not depend on the input size. Job state is kept in a JSON file
+    beside the result and survives restarts.
+    """
+
+    def __init__(
+        self,
+        ml_service: IMLService,
+        input_base_path: str,
+        max_workers: int = 1,
+        chunk_rows: int = 50000
+    ):
+        self.ml_service = ml_service
+        self.input_base_path = Path(input_base_path)
+        self.chunk_rows = chunk_rows
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scoring-job')
+        self._jobs: Dict[str, ScoringJob] = {}  # Queued and running jobs
+        self._lock = threading.Lock()
+
+    def resolve_input_path(self, relative_path: str) -> Optional[str]:
+        """Resolve a server-side input file, refusing paths outside the input directory"""
+        base_path = self.input_base_path.resolve()
+        input_path = (base_path / relative_path).resolve()
+
+        if not input_path.is_relative_to(base_path) or not input_path.is_file():
+            return None
+        return str(input_path)
+
+    def submit(
+        self,
+        model_uuid: str,
+        input_path: str,
+        input_name: str,
+        include_probabilities: bool = True,
+        delete_input: bool = False
+    ) -> ScoringJob:
+        """
+        Queue a scoring job over an input file
+
+        With delete_input the job owns the file and removes it once done.
+        """
+        get_dataset_format(input_path)
+
+        job = ScoringJob(
+            job_id=str(uuid.uuid4()),
+            model_uuid=model_uuid,
+            input_name=input_name,
+            include_probabilities=include_probabilities,
+            total_rows=count_dataset_rows(input_path),
+            created_at=datetime.utcnow().isoformat()
+        )
+        self._jobs_dir(model_uuid).mkdir(parents=True, exist_ok=True)
+
+        # Registered before its state file exists so it is never taken for an interrupted job
+        with self._lock:
+            self._jobs[job.job_id] = job
+        self._save(job)
+        self._executor.submit(self._run_job, job, input_path, delete_input)
+
+        logger.info(f"Scoring job {job.job_id} queued for model {model_uuid} ({job.total_rows} rows)")
+        return job
+
+    def get_job(self, model_uuid: str, job_id: str) -> Optional[ScoringJob]:
+        """Get a scoring job of a model"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job if job.model_uuid == model_uuid else None
+
+        return self._load(model_uuid, job_id)
+
+    def list_jobs(self, model_uuid: str) -> List[ScoringJob]:
+        """List the scoring jobs of a model, newest first"""
+        jobs_dir = self._jobs_dir(model_uuid)
+        if not jobs_dir.exists():
+            return []
+
+        jobs = [self.get_job(model_uuid, path.stem) for path in jobs_dir.glob('*.json')]
+        return sorted(
+            (job for job in jobs if job is not None),
+            key=lambda job: job.created_at or '',
+            reverse=True
+        )
+
+    def get_result_path(self, model_uuid: str, job_id: str) -> Optional[Path]:
+        """Get the result file of a completed scoring job"""
+        job = self.get_job(model_uuid, job_id)
+        if job is None or job.status != ScoringJobStatus.COMPLETED:
+            return None
+
+        result_path = self._result_path(model_uuid, job_id)
+        return result_path if result_path.exists() else None
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the job threads"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run_job(self, job: ScoringJob, input_path: str, delete_input: bool) -> None:
+        """Score an input file chunk by chunk into the job's Parquet result"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        result_path = self._result_path(job.model_uuid, job.job_id)
+        tmp_path = result_path.with_name(result_path.name + '.tmp')
+        writer = None
+
+        job.status = ScoringJobStatus.RUNNING
+        job.started_at = datetime.utcnow().isoformat()
+
+        try:
+            self._save(job)
+            chunks = self.ml_service.predict_chunks(
+                job.model_uuid,
+                iter_dataset_chunks(input_path, self.chunk_rows),
+                job.include_probabilities
+            )
+
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                else:
+                    # Later chunks may infer narrower types than the first one
+                    table = table.cast(writer.schema)
+
+                writer.write_table(table)
+                job.processed_rows += len(chunk)
+                self._save(job)
+
+            if writer is None:
+                raise ValueError("Input file has no rows")
+
+            writer.close()
+            writer = None
+            os.replace(tmp_path, result_path)
+
+            job.status = ScoringJobStatus.COMPLETED
+            job.total_rows = job.processed_rows
+            job.result_size = result_path.stat().st_size
+            logger.info(f"Scoring job {job.job_id} completed for model {job.model_uuid} ({job.processed_rows} rows)")
+
+        except Exception as e:
+            job.status = ScoringJobStatus.FAILED
+            job.error_message = f"Scoring failed: {str(e)}"
+            logger.error(f"Scoring job {job.job_id} failed for model {job.model_uuid}: {str(e)}")
+
+        finally:
+            if writer is not None:
+                writer.close()
+            tmp_path.unlink(missing_ok=True)
+            if delete_input and os.path.exists(input_path):
+                os.remove(input_path)
+
+            job.completed_at = datetime.utcnow().isoformat()
+            try:
+                self._save(job)
+            except OSError as e:
+                # The model may have been deleted while its job ran
+                logger.warning(f"Could not save scoring job {job.job_id}: {str(e)}")
+
+            with self._lock:
+                self._jobs.pop(job.job_id, None)
+
+    def _load(self, model_uuid: str, job_id: str) -> Optional[ScoringJob]:
+        """Load a finished job, or an unfinished one left by a stopped process"""
+        job_path = self._job_path(model_uuid, job_id)
+        job = self._read(job_path)
+        if job is None or job.status not in (ScoringJobStatus.QUEUED, ScoringJobStatus.RUNNING):
+            return job
+
+        with self._lock:
+            active = self._jobs.get(job_id)
+        if active is not None:
+            return active
+
+        # Read again: the job may have finished between the two checks
+        job = self._read(job_path)
+        if job is not None and job.status in (ScoringJobStatus.QUEUED, ScoringJobStatus.RUNNING):
+            job.status = ScoringJobStatus.FAILED
+            job.error_message = "Scoring interrupted by a server restart"
+            self._save(job)
+
+        return job
+
+    def _read(self, job_path: Path) -> Optional[ScoringJob]:
+        """Read a job's state file"""
+        try:
+            with open(job_path, 'r') as job_file:
+                return ScoringJob.from_dict(json.load(job_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to read scoring job {job_path.stem}: {str(e)}")
+            return None
+
+    def _save(self, job: ScoringJob) -> None:
+        """Write a job's state file atomically"""
+        job_path = self._job_path(job.model_uuid, job.job_id)
+        tmp_path = job_path.with_name(f"{job_path.name}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            with open(tmp_path, 'w') as job_file:
+                json.dump(job.to_dict(), job_file)
+            os.replace(tmp_path, job_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _jobs_dir(self, model_uuid: str) -> Path:
+        return self.ml_service.get_model_path(model_uuid) / SCORING_DIR_NAME
+
+    def _job_path(self, model_uuid: str, job_id: str) -> Path:
+        return self._jobs_dir(model_uuid) / f"{job_id}.json"
+
+    def _result_path(self, model_uuid: str, job_id: str) -> Path:
+        return self._jobs_dir(model_uuid) / f"{job_id}.parquet"
@@ -0,0 +1,297 @@
+# BE/app/services/training_queue.py
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from typing import Dict, Any, Optional, Tuple
+
+from services.base import TrainingConfig, DatasetInfo, TrainingResult, ModelStatus
+from services.training_scheduler import TrainingScheduler, JobResources
+
+logger = logging.getLogger(__name__)
+
+# Flask app used by worker processes to reach the database
+_worker_app = None
+
+def _init_worker(db_config: Dict[str, Any], instance_path: str) -> None:
+    """Initialize a training worker process with its own database connection"""
+    global _worker_app
+
+    from flask import Flask
+    from extensions import db
+    import models  # noqa: F401 - registers TrainedModel with SQLAlchemy
+    import utils.database  # noqa: F401 - enables WAL on SQLite connections
+
+    app = Flask(__name__, instance_path=instance_path)
+    app.config.update(db_config)
+    db.init_app(app)
+
+    _worker_app = app
+    logger.info("Training worker process initialized")
+
+def _ingest_dataset(model_uuid: str, datasets_path: str, dataset: DatasetInfo, model_repository) -> DatasetInfo:
+    """Store a dataset not yet in the dataset store and record its hash on the model"""
+    from services.dataset_store import DatasetStore
+
+    dataset_store = DatasetStore(datasets_path)
+    if dataset.dataset_hash and dataset_store.exists(dataset.dataset_hash):
+        return dataset
+
+    try:
+        stored = dataset_store.ingest(dataset)
+        # Training reads the stored Parquet file; the pool keeps the job's
+        # arguments alive until it returns, so drop the boxed rows now
+        dataset.rows.clear()
+    finally:
+        # The uploaded file, handed over by the request
+        if dataset.file_path and os.path.exists(dataset.file_path):
+            os.remove(dataset.file_path)
+
+    model_repository.update_status(model_uuid, ModelStatus.TRAINING, {'dataset_hash': stored.dataset_hash})
+    return stored
+
+def run_training_job(
+    model_uuid: str,
+    models_path: str,
+    datasets_path: str,
+    dataset: DatasetInfo,
+    config: TrainingConfig
+) -> TrainingResult:
+    """
+    Train a model inside a worker process and drive its status lifecycle
+
+    Runs in a worker process: a dataset received with the request is
+    parsed and stored first, then the model record is moved from TRAINING
+    to COMPLETED or FAILED depending on the outcome of the training.
+    """
+    from services.ml_service import AutoGluonMLService
+    from repositories.model_repository import ModelRepository
+
+    with _worker_app.app_context():
+        model_repository = ModelRepository()
+        ml_service = AutoGluonMLService(models_base_path=models_path)
+
+        try:
+            dataset = _ingest_dataset(model_uuid, datasets_path, dataset, model_repository)
+            result = ml_service.train_model(dataset, config, model_uuid=model_uuid)
+        except Exception as e:
+            logger.error(f"Training job crashed for model {model_uuid}: {str(e)}")
+            result = TrainingResult(success=False, error_message=f"Training failed: {str(e)}")
+
+        if result.success:
+            model_repository.update_status(
+                model_uuid,
+                ModelStatus.COMPLETED,
+                {
+                    'best_score': result.best_score,
+                    'best_model_name': result.best_model_name,
+                    'eval_metric': result.eval_metric,
+                    'feature_columns': result.feature_columns,
+                    'leaderboard': result.leaderboard,
+                    'feature_importance': result.feature_importance,
+                    **(result.deployment or {})
+                }
+            )
+            logger.info(f"Training job completed for model {model_uuid}")
+        else:
+            model_repository.update_status(
+                model_uuid,
+                ModelStatus.FAILED,
+                {'error_message': result.error_message}
+            )
+            logger.error(f"Training job failed for model {model_uuid}: {result.error_message}")
+
+        return result
+
+class TrainingJobQueue:
+    """
+    Queue of training jobs executed by a pool of worker processes
+    
+    Jobs are only handed to the pool once the scheduler has reserved
+    their share of the machine's cores and memory.
+    
+    While jobs are queued or running, their heartbeat in the database is
+    refreshed every heartbeat_seconds, so other processes can tell a live
+    job from one whose process died.
+    """
+
+    def __init__(
+        self,
+        app,
+        models_path: str,
+        datasets_path: str,
+        max_workers: int = 2,
+        scheduler: Optional[TrainingScheduler] = None,
+        heartbeat_seconds: float = 60
+    ):
+        self.app = app
+        self.models_path = models_path
+        self.datasets_path = datasets_path
+        self.max_workers = max(1, max_workers)
+        self.scheduler = scheduler or TrainingScheduler.from_config(max_concurrent_jobs=self.max_workers)
+        self.heartbeat_seconds = heartbeat_seconds
+
+        self._db_config = {
+            key: value for key, value in app.config.items()
+            if key.startswith('SQLALCHEMY_')
+        }
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, Future] = {}
+        self._pending: Dict[str, Tuple[DatasetInfo, TrainingConfig]] = {}
+        self._lock = threading.Lock()
+
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._heartbeat_stop = threading.Event()
+
+    def check_admission(self, dataset: DatasetInfo, config: TrainingConfig) -> None:
+        """Raise ValueError if the job would never fit in the training budget"""
+        self.scheduler.check_admission(self.scheduler.estimate(dataset, config))
+
+    def submit(self, model_uuid: str, dataset: DatasetInfo, config: TrainingConfig) -> None:
+        """Submit a training job, returning as soon as it is queued"""
+        resources = self.scheduler.estimate(dataset, config)
+        self.scheduler.check_admission(resources)
+
+        with self._lock:
+            self._pending[model_uuid] = (dataset, config)
+            self._start_heartbeat()
+
+        if self.scheduler.request(model_uuid, resources):
+            try:
+                self._dispatch(model_uuid, resources)
+            except Exception:
+                self._release(model_uuid)
+                raise
+
+        logger.info(f"Training job queued for model {model_uuid}")
+
+    def get_job_state(self, model_uuid: str) -> Optional[str]:
+        """Get the queue state of a job ('queued' or 'running'), None if not in the queue"""
+        with self._lock:
+            if model_uuid in self._pending:
+                return 'queued'
+            future = self._jobs.get(model_uuid)
+
+        if future is None or future.done():
+            return None
+
+        return 'running' if future.running() else 'queued'
+
+    def get_usage(self) -> Dict[str, Any]:
+        """Get the training budget usage"""
+        return self.scheduler.get_usage()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool"""
+        self._heartbeat_stop.set()
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info("Training job queue shut down")
+
+    def _dispatch(self, model_uuid: str, resources: JobResources) -> None:
+        """Hand a job with reserved resources over to the worker pool"""
+        with self._lock:
+            dataset, config = self._pending.pop(model_uuid)
+
+            # Each fit() only uses the slice of the machine reserved for it
+            config = replace(config, num_cpus=resources.cpus, memory_limit_gb=resources.memory_gb)
+
+            future = self._get_executor().submit(
+                run_training_job, model_uuid, self.models_path, self.datasets_path, dataset, config
+            )
+            self._jobs[model_uuid] = future
+
+        future.add_done_callback(lambda f: self._on_job_done(model_uuid, f))
+        logger.info(f"Training job started for model {model_uuid} with {resources.cpus} CPUs and {resources.memory_gb:.1f} GB")
+
+    def _start_heartbeat(self) -> None:
+        """Start refreshing job heartbeats on first use (caller holds the lock)"""
+        if self._heartbeat_thread is not None:
+            return
+
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name='training-heartbeat', daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        from repositories.model_repository import ModelRepository
+
+        while not self._heartbeat_stop.wait(self.heartbeat_seconds):
+            with self._lock:
+                model_uuids = list(self._pending) + [
+                    model_uuid for model_uuid, future in self._jobs.items() if not future.done()
+                ]
+            if not model_uuids:
+                continue
+
+            try:
+                with self.app.app_context():
+                    ModelRepository().touch_heartbeat(model_uuids)
+            except Exception as e:
+                logger.error(f"Failed to refresh training heartbeats: {str(e)}")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use"""
+        if self._executor is None:
+            # Spawn fresh interpreters: forking a threaded Flask server is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self._db_config, self.app.instance_path)
+            )
+            logger.info(f"Training worker pool started with {self.max_workers} processes")
+
+        return self._executor
+
+    def _on_job_done(self, model_uuid: str, future: Future) -> None:
+        """Release the job and record failures the worker could not report itself"""
+        with self._lock:
+            self._jobs.pop(model_uuid, None)
+
+        # The worker changed the model record in its own process
+        from repositories.model_repository import ModelRepository
+        ModelRepository().invalidate_metadata(model_uuid)
+
+        if future.cancelled():
+            self._fail_job(model_uuid, "Training job was cancelled")
+        elif future.exception() is not None:
+            if isinstance(future.exception(), BrokenProcessPool):
+                # A worker died: start a fresh pool for the next jobs
+                with self._lock:
+                    self._executor = None
+            self._fail_job(model_uuid, f"Training worker crashed: {str(future.exception())}")
+
+        self._release(model_uuid)
+
+    def _release(self, model_uuid: str) -> None:
+        """Free the resources of a job and start the queued jobs that now fit"""
+        for next_uuid, resources in self.scheduler.release(model_uuid):
+            try:
+                self._dispatch(next_uuid, resources)
+            except Exception as e:
+                self._fail_job(next_uuid, f"Failed to start training job: {str(e)}")
+                self._release(next_uuid)
+
+    def _fail_job(self, model_uuid: str, error_message: str) -> None:
+        """Mark a job that did not finish as FAILED"""
+        logger.error(f"Training job for model {model_uuid} did not finish: {error_message}")
+
+        try:
+            from repositories.model_repository import ModelRepository
+            with self.app.app_context():
+                ModelRepository().update_status(
+                    model_uuid,
+                    ModelStatus.FAILED,
+                    {'error_message': error_message}
+                )
+        except Exception as e:
+            logger.error(f"Failed to mark model {model_uuid} as failed: {str(e)}")
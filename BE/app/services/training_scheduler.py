@@ -0,0 +1,187 @@
+# BE/app/services/training_scheduler.py
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Tuple
+
+from services.base import TrainingConfig, DatasetInfo
+
+logger = logging.getLogger(__name__)
+
+# Peak memory of fit() as a multiple of the in-memory dataset size
+PRESET_MEMORY_FACTORS = {
+    'best_quality': 10.0,          # bagging and stacking keep several model copies alive
+    'good_quality_faster': 6.0,
+    'optimize_for_deployment': 4.0
+}
+
+# Cores a job can use effectively for each preset
+PRESET_CPUS = {
+    'best_quality': 4,             # folds of bagged models train in parallel
+    'good_quality_faster': 2,
+    'optimize_for_deployment': 2
+}
+
+# Fixed memory used by a worker process (interpreter, AutoGluon, model artifacts)
+BASE_JOB_MEMORY_GB = 1.0
+
+# Jobs allowed to run longer than this get twice the preset cores
+LONG_JOB_TIME_LIMIT = 1800
+
+@dataclass
+class ResourceBudget:
+    """Cores and memory available to training jobs"""
+    cpus: int
+    memory_gb: float
+
+@dataclass
+class JobResources:
+    """Resources reserved for a single training job"""
+    cpus: int
+    memory_gb: float
+
+class TrainingScheduler:
+    """
+    Admission control for training jobs against a machine budget
+
+    Every job gets its own slice of cores and memory. A job is admitted when
+    its slice fits in what is still free, queued while it fits in the whole
+    budget, and rejected when it could never fit.
+    """
+
+    def __init__(self, budget: ResourceBudget, max_concurrent_jobs: int):
+        self.budget = budget
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+
+        self._running: Dict[str, JobResources] = {}
+        self._pending: Deque[Tuple[str, JobResources]] = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        cpu_budget: int = 0,
+        memory_budget_gb: float = 0,
+        max_concurrent_jobs: int = 2
+    ) -> 'TrainingScheduler':
+        """Build a scheduler, detecting the machine size for budgets set to 0"""
+        budget = ResourceBudget(
+            cpus=cpu_budget or os.cpu_count() or 1,
+            memory_gb=memory_budget_gb or _detect_memory_gb()
+        )
+        logger.info(f"Training budget: {budget.cpus} CPUs, {budget.memory_gb:.1f} GB")
+        return cls(budget, max_concurrent_jobs)
+
+    def estimate(self, dataset: DatasetInfo, config: TrainingConfig) -> JobResources:
+        """Estimate the cores and memory a training job needs"""
+        dataset_gb = _estimate_dataset_bytes(dataset) / (1024 ** 3)
+        memory_factor = PRESET_MEMORY_FACTORS.get(config.presets, PRESET_MEMORY_FACTORS['best_quality'])
+
+        cpus = PRESET_CPUS.get(config.presets, 2)
+        if config.time_limit >= LONG_JOB_TIME_LIMIT:
+            cpus *= 2
+
+        return JobResources(
+            cpus=max(1, min(cpus, self.budget.cpus)),
+            memory_gb=round(BASE_JOB_MEMORY_GB + dataset_gb * memory_factor, 2)
+        )
+
+    def check_admission(self, resources: JobResources) -> None:
+        """Raise ValueError if a job could never fit in the machine budget"""
+        if resources.memory_gb > self.budget.memory_gb:
+            raise ValueError(
+                f"Training job needs an estimated {resources.memory_gb:.1f} GB of memory, "
+                f"more than the {self.budget.memory_gb:.1f} GB training budget. "
+                f"Use a smaller dataset or a lighter preset"
+            )
+
+    def request(self, job_id: str, resources: JobResources) -> bool:
+        """
+        Reserve resources for a job
+
+        Returns True if the job can start now, False if it has been queued.
+        """
+        self.check_admission(resources)
+
+        with self._lock:
+            if not self._pending and self._fits(resources):
+                self._running[job_id] = resources
+                return True
+
+            self._pending.append((job_id, resources))
+            logger.info(f"Training job {job_id} queued: waiting for {resources.cpus} CPUs and {resources.memory_gb:.1f} GB")
+            return False
+
+    def release(self, job_id: str) -> List[Tuple[str, JobResources]]:
+        """
+        Release the resources of a finished job
+
+        Returns the queued jobs that can start now, in submission order.
+        """
+        with self._lock:
+            self._running.pop(job_id, None)
+
+            started = []
+            while self._pending and self._fits(self._pending[0][1]):
+                next_id, resources = self._pending.popleft()
+                self._running[next_id] = resources
+                started.append((next_id, resources))
+
+            return started
+
+    def cancel(self, job_id: str) -> bool:
+        """Remove a job from the pending queue"""
+        with self._lock:
+            for item in self._pending:
+                if item[0] == job_id:
+                    self._pending.remove(item)
+                    return True
+            return False
+
+    def is_pending(self, job_id: str) -> bool:
+        """Check if a job is waiting for resources"""
+        with self._lock:
+            return any(pending_id == job_id for pending_id, _ in self._pending)
+
+    def get_usage(self) -> Dict[str, float]:
+        """Get the current budget usage"""
+        with self._lock:
+            used_cpus = sum(r.cpus for r in self._running.values())
+            used_memory = sum(r.memory_gb for r in self._running.values())
+            return {
+                'cpu_budget': self.budget.cpus,
+                'memory_budget_gb': self.budget.memory_gb,
+                'cpus_in_use': used_cpus,
+                'memory_in_use_gb': round(used_memory, 2),
+                'running_jobs': len(self._running),
+                'pending_jobs': len(self._pending)
+            }
+
+    def _fits(self, resources: JobResources) -> bool:
+        """Check if a job fits in the free budget (caller holds the lock)"""
+        if len(self._running) >= self.max_concurrent_jobs:
+            return False
+
+        used_cpus = sum(r.cpus for r in self._running.values())
+        used_memory = sum(r.memory_gb for r in self._running.values())
+
+        return (
+            used_cpus + resources.cpus <= self.budget.cpus
+            and used_memory + resources.memory_gb <= self.budget.memory_gb
+        )
+
+def _estimate_dataset_bytes(dataset: DatasetInfo) -> int:
+    """Estimate the in-memory size of a dataset once loaded in a DataFrame"""
+    cells = dataset.total_rows * len(dataset.headers)
+    # 8 bytes per numeric cell; the raw file size bounds string-heavy data better
+    return max(cells * 8, dataset.file_size * 2)
+
+def _detect_memory_gb() -> float:
+    """Detect the physical memory of the machine"""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / (1024 ** 3)
+    except (ValueError, OSError, AttributeError):
+        logger.warning("Could not detect physical memory, assuming 8 GB")
+        return 8.0
@@ -0,0 +1,151 @@
+# BE/app/services/warmup.py
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from services.base import WarmupState
+from services.model_cache import estimate_predictor_size
+
+logger = logging.getLogger(__name__)
+
+class ModelWarmup:
+    """
+    Gets a fresh process ready to serve before it reports ready
+
+    On a background thread it imports AutoGluon, which otherwise costs
+    the first training or prediction request several seconds, then loads
+    the hot models into the predictor cache: the configured ones, the
+    pinned ones and the most recently used ones of the hot storage tier.
+    Preloading stops at the cache's memory ceiling so that it never
+    evicts a model it loaded itself.
+
+    The process is ready once warm-up has finished, whether or not every
+    model loaded; failures are listed in the status.
+    """
+
+    def __init__(
+        self,
+        ml_service,
+        preload_models: Iterable[str] = (),
+        preload_top_n: int = 0,
+        enabled: bool = True
+    ):
+        self.ml_service = ml_service
+        self.preload_models = list(preload_models)
+        self.preload_top_n = preload_top_n
+        self.enabled = enabled
+
+        self._state = WarmupState.PENDING
+        self._status: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start warming up on a background thread"""
+        with self._lock:
+            if self._state != WarmupState.PENDING:
+                return
+            if not self.enabled:
+                self._state = WarmupState.READY
+                self._status = {'skipped': True}
+                return
+            self._state = WarmupState.WARMING_UP
+            self._status = {'started_at': datetime.utcnow().isoformat()}
+
+        self._thread = threading.Thread(target=self._run, name='model-warmup', daemon=True)
+        self._thread.start()
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            return self._state == WarmupState.READY
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for warm-up to finish, returning whether it did"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.is_ready()
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'state': self._state.value, **self._status}
+
+    def _run(self) -> None:
+        start = time.monotonic()
+        preloaded: List[str] = []
+        failed: List[str] = []
+        skipped: List[str] = []
+        error = None
+
+        try:
+            autogluon_available = self._import_autogluon()
+            if autogluon_available:
+                for model_uuid in self._select_models():
+                    if not self._fits_in_cache(model_uuid):
+                        skipped.append(model_uuid)
+                        continue
+
+                    model_start = time.monotonic()
+                    if self.ml_service.preload_model(model_uuid):
+                        preloaded.append(model_uuid)
+                        logger.info(f"Preloaded model {model_uuid} in {time.monotonic() - model_start:.2f}s")
+                    else:
+                        failed.append(model_uuid)
+        except Exception as e:
+            logger.error(f"Warm-up failed: {str(e)}")
+            error = str(e)
+        finally:
+            duration = round(time.monotonic() - start, 3)
+            with self._lock:
+                self._state = WarmupState.READY
+                self._status.update(
+                    finished_at=datetime.utcnow().isoformat(),
+                    duration_seconds=duration,
+                    preloaded_models=preloaded,
+                    failed_models=failed,
+                    skipped_models=skipped,
+                    error=error
+                )
+
+        logger.info(
+            f"Warm-up finished in {duration}s: {len(preloaded)} models preloaded, "
+            f"{len(failed)} failed, {len(skipped)} skipped for cache space"
+        )
+
+    def _import_autogluon(self) -> bool:
+        """Import AutoGluon so later lazy imports find it in sys.modules"""
+        start = time.monotonic()
+        try:
+            from autogluon.tabular import TabularPredictor  # noqa: F401
+        except ImportError:
+            logger.error("AutoGluon not installed, no models preloaded")
+            with self._lock:
+                self._status['autogluon_available'] = False
+            return False
+
+        seconds = round(time.monotonic() - start, 3)
+        logger.info(f"AutoGluon imported in {seconds}s")
+        with self._lock:
+            self._status.update(autogluon_available=True, autogluon_import_seconds=seconds)
+        return True
+
+    def _select_models(self) -> List[str]:
+        """Configured and pinned models first, then the most recently used hot ones"""
+        selected = list(self.preload_models) + self.ml_service.get_cache_stats()['pinned']
+
+        if self.preload_top_n > 0:
+            selected.extend(
+                entry['uuid'] for entry in self.ml_service.model_index.most_recently_used(self.preload_top_n)
+            )
+
+        # Keep the first occurrence of each model, and only models on disk
+        return [
+            model_uuid for model_uuid in dict.fromkeys(selected)
+            if self.ml_service.get_model_path(model_uuid).is_dir()
+        ]
+
+    def _fits_in_cache(self, model_uuid: str) -> bool:
+        stats = self.ml_service.get_cache_stats()
+        size_bytes = estimate_predictor_size(str(self.ml_service.get_serving_path(model_uuid)))
+        return stats['memory_bytes'] + size_bytes <= stats['max_memory_bytes']
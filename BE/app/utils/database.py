@@ -0,0 +1,112 @@
+# BE/app/utils/database.py
+import logging
+import random
+import sqlite3
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Write retries on lock contention, with exponential backoff between attempts
+WRITE_RETRIES = 5
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 2.0
+
+# PostgreSQL serialization failure / deadlock and MySQL deadlock / lock wait timeout
+RETRYABLE_PG_CODES = frozenset(['40001', '40P01'])
+RETRYABLE_MYSQL_ERRORS = frozenset([1205, 1213])
+
+def build_engine_options(
+    database_uri: str,
+    pool_size: int = 10,
+    max_overflow: int = 20,
+    pool_timeout: int = 30,
+    pool_recycle: int = 1800,
+    sqlite_busy_timeout_ms: int = 30000
+) -> Dict[str, Any]:
+    """
+    Get the SQLAlchemy engine options for a database URL
+
+    SQLite connections wait up to the busy timeout for a lock instead of
+    failing at once with 'database is locked'. Server databases get a
+    bounded pool whose connections are checked before use and recycled
+    before the server drops them.
+    """
+    url = make_url(database_uri)
+
+    if url.get_backend_name() == 'sqlite':
+        options: Dict[str, Any] = {
+            'connect_args': {'timeout': sqlite_busy_timeout_ms / 1000}
+        }
+        if url.database and url.database != ':memory:':
+            # In-memory databases use a single static connection
+            options.update(pool_size=pool_size, max_overflow=max_overflow, pool_timeout=pool_timeout)
+        return options
+
+    return {
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_timeout': pool_timeout,
+        'pool_recycle': pool_recycle,
+        'pool_pre_ping': True
+    }
+
+@event.listens_for(Engine, 'connect')
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """
+    Switch file-backed SQLite databases to write-ahead logging
+
+    With WAL readers no longer block the writer and the writer no longer
+    blocks readers, so only concurrent writers wait on each other.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')  # Safe with WAL: commits only skip the fsync
+    finally:
+        cursor.close()
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check whether a database error is transient lock contention"""
+    if not isinstance(error, DBAPIError):
+        return False
+    if error.connection_invalidated:
+        return True
+
+    original = error.orig
+    if isinstance(original, sqlite3.OperationalError):
+        message = str(original).lower()
+        return 'locked' in message or 'busy' in message
+    if getattr(original, 'pgcode', None) in RETRYABLE_PG_CODES:
+        return True
+
+    args = getattr(original, 'args', ())
+    return bool(args) and args[0] in RETRYABLE_MYSQL_ERRORS
+
+def run_with_retry(operation: Callable[[], T], session: Any, description: str = 'database write') -> T:
+    """
+    Run a write transaction, retrying it when the database is busy
+
+    The operation must do its whole transaction, commit included, so a
+    retry after the rollback repeats it from the start.
+    """
+    for attempt in range(WRITE_RETRIES + 1):
+        try:
+            return operation()
+        except DBAPIError as e:
+            session.rollback()
+            if attempt == WRITE_RETRIES or not is_retryable_error(e):
+                raise
+
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+            logger.warning(f"Retrying {description} in {delay:.2f}s after: {str(e.orig)}")
+            time.sleep(delay)
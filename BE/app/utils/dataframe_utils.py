@@ -0,0 +1,118 @@
+# BE/app/utils/dataframe_utils.py
+import warnings
+from typing import Any, Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+from services.base import PredictionRequest
+
+# Text columns with at most this ratio of distinct values become categories
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Values parsed to decide whether a text column holds dates
+DATETIME_SAMPLE_SIZE = 100
+
+def build_prediction_frame(request: PredictionRequest) -> pd.DataFrame:
+    """Build the inference DataFrame of a prediction request"""
+    if request.columns is not None:
+        return pd.DataFrame(request.columns, copy=False)
+
+    return pd.DataFrame(request.data)
+
+def optimize_dtypes(df: pd.DataFrame, exclude_categories: Iterable[str] = ()) -> pd.DataFrame:
+    """
+    Infer column types and downcast them to the smallest fitting dtype
+
+    Text columns holding numbers or dates are converted, low-cardinality
+    text becomes category, integers shrink to int8/16/32 and fractional
+    floats to float32. Text only becomes numbers when every value reads
+    back unchanged, so codes like "007" stay text, and whole-number
+    floats with missing values (IDs with gaps) keep float64 precision.
+    Columns in exclude_categories are never made categorical.
+    """
+    exclude_categories = set(exclude_categories)
+    optimized: Dict[str, Any] = {}
+
+    for column in df.columns:
+        series = df[column]
+
+        if series.dtype == object:
+            series = _infer_object_column(series, allow_category=column not in exclude_categories)
+
+        optimized[column] = _downcast_numeric(series)
+
+    return pd.DataFrame(optimized, index=df.index, copy=False)
+
+def _infer_object_column(series: pd.Series, allow_category: bool) -> pd.Series:
+    """Give a typed dtype to an object column"""
+    # Empty strings from CSV exports are missing values
+    series = series.mask(series == '')
+    non_null = series.dropna()
+
+    if non_null.empty:
+        return series
+
+    inferred = pd.api.types.infer_dtype(non_null, skipna=True)
+
+    if inferred == 'boolean':
+        return series.astype('boolean') if series.hasnans else series.astype(bool)
+
+    if inferred in ('integer', 'floating', 'mixed-integer-float', 'decimal'):
+        return pd.to_numeric(series, errors='coerce')
+
+    if inferred in ('datetime', 'datetime64', 'date'):
+        return pd.to_datetime(series, errors='coerce')
+
+    if inferred != 'string':
+        return series
+
+    # Numbers sent as text, unless converting would rewrite them ("007", "1.50")
+    numeric = pd.to_numeric(series, errors='coerce')
+    if numeric.notna().sum() == len(non_null) and all(_is_plain_number(text) for text in non_null.unique()):
+        return numeric
+
+    # Dates sent as text: check a sample before parsing the whole column
+    parsed = _parse_datetimes(non_null.head(DATETIME_SAMPLE_SIZE))
+    if parsed.notna().all():
+        parsed = _parse_datetimes(series)
+        if parsed.notna().sum() == len(non_null):
+            return parsed
+
+    if allow_category and non_null.nunique() <= len(non_null) * CATEGORY_MAX_UNIQUE_RATIO:
+        return series.astype('category')
+
+    return series
+
+def _is_plain_number(text: str) -> bool:
+    """Whether text is exactly how Python writes the number it holds"""
+    try:
+        return str(int(text)) == text
+    except ValueError:
+        pass
+    try:
+        return repr(float(text)) == text
+    except ValueError:
+        return False
+
+def _parse_datetimes(series: pd.Series) -> pd.Series:
+    """Parse text as dates, returning NaT where it is not a date"""
+    with warnings.catch_warnings():
+        # pandas warns when it falls back to per-element format inference
+        warnings.simplefilter('ignore', UserWarning)
+        return pd.to_datetime(series, errors='coerce')
+
+def _downcast_numeric(series: pd.Series) -> pd.Series:
+    """Shrink numeric columns to the smallest dtype holding their values"""
+    if pd.api.types.is_bool_dtype(series.dtype) or not pd.api.types.is_numeric_dtype(series.dtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast='integer')
+
+    # Whole-number floats are integers in disguise, or IDs with gaps that
+    # float32 would round
+    if np.all(np.mod(series.dropna().values, 1) == 0):
+        return series if series.hasnans else pd.to_numeric(series, downcast='integer')
+
+    return pd.to_numeric(series, downcast='float')
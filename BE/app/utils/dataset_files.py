@@ -0,0 +1,115 @@
+# BE/app/utils/dataset_files.py
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.request_validators import sanitize_filename
+
+# Size of the blocks copied from the upload stream to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+SUPPORTED_DATASET_EXTENSIONS = ('.csv', '.parquet')
+
+def get_dataset_format(filename: str) -> str:
+    """Get the dataset format ('csv' or 'parquet') from a filename"""
+    extension = os.path.splitext(filename.lower())[1]
+    if extension not in SUPPORTED_DATASET_EXTENSIONS:
+        raise ValueError(f"Unsupported dataset file type '{extension}'. Supported: {list(SUPPORTED_DATASET_EXTENSIONS)}")
+    return extension.lstrip('.')
+
+def spool_upload(file_storage, upload_dir: str) -> Tuple[str, int, int, str]:
+    """
+    Copy an uploaded file to disk in fixed-size chunks
+
+    Returns:
+        Tuple of (spooled file path, size in bytes, number of lines, SHA-256 of the content)
+    """
+    upload_path = Path(upload_dir)
+    upload_path.mkdir(parents=True, exist_ok=True)
+
+    filename = sanitize_filename(file_storage.filename)
+    spool_path = upload_path / f"{uuid.uuid4()}_{filename}"
+
+    file_size = 0
+    line_count = 0
+    last_byte = b''
+    digest = hashlib.sha256()
+
+    try:
+        with open(spool_path, 'wb') as output:
+            while True:
+                chunk = file_storage.stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                output.write(chunk)
+                digest.update(chunk)
+                file_size += len(chunk)
+                line_count += chunk.count(b'\n')
+                last_byte = chunk[-1:]
+    except Exception:
+        spool_path.unlink(missing_ok=True)
+        raise
+
+    # Count a final line without trailing newline
+    if last_byte and last_byte != b'\n':
+        line_count += 1
+
+    return str(spool_path), file_size, line_count, digest.hexdigest()
+
+def read_dataset_headers(file_path: str) -> List[str]:
+    """Read the column names of a dataset file without loading its rows"""
+    if get_dataset_format(file_path) == 'parquet':
+        import pyarrow.parquet as pq
+        return list(pq.read_schema(file_path).names)
+
+    return list(pd.read_csv(file_path, nrows=0).columns)
+
+def count_dataset_rows(file_path: str, line_count: Optional[int] = None) -> int:
+    """Get the number of data rows of a dataset file, counting its lines if not given"""
+    if get_dataset_format(file_path) == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(file_path).metadata.num_rows
+
+    if line_count is None:
+        line_count = count_file_lines(file_path)
+
+    # Every line but the header is a row (quoted multi-line values are rare)
+    return max(line_count - 1, 0)
+
+def count_file_lines(file_path: str) -> int:
+    """Count the lines of a text file, reading it in fixed-size chunks"""
+    line_count = 0
+    last_byte = b''
+    with open(file_path, 'rb') as source:
+        for chunk in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b''):
+            line_count += chunk.count(b'\n')
+            last_byte = chunk[-1:]
+
+    # Count a final line without trailing newline
+    if last_byte and last_byte != b'\n':
+        line_count += 1
+    return line_count
+
+def iter_dataset_chunks(file_path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Read a dataset file as consecutive DataFrames of at most chunk_rows rows"""
+    if get_dataset_format(file_path) == 'parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+        return
+
+    with pd.read_csv(file_path, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            yield chunk
+
+def read_dataset_file(file_path: str) -> pd.DataFrame:
+    """Load a dataset file straight into a DataFrame"""
+    if get_dataset_format(file_path) == 'parquet':
+        return pd.read_parquet(file_path)
+
+    return pd.read_csv(file_path)
@@ -0,0 +1,118 @@
+# BE/app/utils/prediction_formats.py
+import json
+from typing import Any, Dict, List
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: JSON falls back to the standard library encoder
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: MessagePack responses are not offered without it
+    msgpack = None
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+# Content type of Arrow IPC streaming-format bodies
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+# Response fields holding NumPy arrays
+ARRAY_FIELDS = ('predictions', 'probabilities')
+
+def read_arrow_stream(body: bytes) -> Dict[str, Any]:
+    """Read an Arrow IPC stream into column arrays without building rows"""
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(body).read_all()
+    df = table.to_pandas()
+    return {column: df[column].values for column in df.columns}
+
+def available_response_mimetypes() -> List[str]:
+    """Get the prediction response formats this server can produce, JSON first"""
+    mimetypes = [JSON_MIMETYPE]
+    if msgpack is not None:
+        mimetypes.append(MSGPACK_MIMETYPE)
+    mimetypes.append(ARROW_STREAM_MIMETYPE)
+    return mimetypes
+
+def encode_prediction_response(payload: Dict[str, Any], mimetype: str, float32: bool = False) -> bytes:
+    """
+    Encode a prediction response holding NumPy prediction arrays
+
+    Arrays are handed to the encoder whole: orjson and Arrow serialize
+    numeric arrays natively and MessagePack receives their raw buffers.
+    With float32 the probabilities are rounded to single precision first.
+    """
+    if float32 and payload.get('probabilities') is not None:
+        payload = {**payload, 'probabilities': np.asarray(payload['probabilities'], dtype=np.float32)}
+
+    if mimetype == MSGPACK_MIMETYPE:
+        return msgpack.packb(payload, default=_pack_numpy)
+
+    if mimetype == ARROW_STREAM_MIMETYPE:
+        return _encode_arrow(payload)
+
+    return encode_json(payload)
+
+def encode_json(payload: Any) -> bytes:
+    """Encode JSON with orjson when installed, serializing NumPy arrays natively"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY, default=_to_builtin)
+
+    return json.dumps(payload, default=_to_builtin).encode('utf-8')
+
+def _encode_arrow(payload: Dict[str, Any]) -> bytes:
+    """
+    Encode predictions as an Arrow IPC stream
+
+    One row per sample with a 'prediction' column and a 'probability_<class>'
+    column per class; the other response fields go in the schema metadata.
+    """
+    import pyarrow as pa
+
+    columns = {'prediction': pa.array(np.asarray(payload['predictions']))}
+
+    probabilities = payload.get('probabilities')
+    if probabilities is not None:
+        probabilities = np.asarray(probabilities)
+        for index, label in enumerate(payload.get('class_labels') or range(probabilities.shape[1])):
+            columns[f'probability_{label}'] = pa.array(probabilities[:, index])
+
+    metadata = {
+        key: encode_json(value)
+        for key, value in payload.items()
+        if key not in ARRAY_FIELDS
+    }
+    table = pa.table(columns).replace_schema_metadata(metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def _pack_numpy(value: Any) -> Any:
+    """Convert NumPy values for MessagePack, sending numeric arrays as raw buffers"""
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return value.tolist()
+        value = np.ascontiguousarray(value)
+        return {'dtype': value.dtype.str, 'shape': list(value.shape), 'data': value.tobytes()}
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def _to_builtin(value: Any) -> Any:
+    """Convert values the JSON encoder does not handle natively"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
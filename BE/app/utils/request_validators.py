@@ -11,6 +11,10 @@ def validate_uuid(uuid_string: str) -> bool:
     except ValueError:
         return False
 
+def validate_dataset_hash(dataset_hash: str) -> bool:
+    """Validate dataset hash format (hex SHA-256)"""
+    return isinstance(dataset_hash, str) and bool(re.match(r'^[0-9a-f]{64}$', dataset_hash))
+
 def validate_training_request(data: Dict[str, Any]) -> Optional[str]:
     """
     Validate training request payload
@@ -19,12 +23,23 @@ def validate_training_request(data: Dict[str, Any]) -> Optional[str]:
         None if valid, error message string if invalid
     """
     # Check required top-level keys
-    if 'dataset' not in data:
-        return "Missing 'dataset' in request"
+    if 'dataset' not in data and 'datasetHash' not in data:
+        return "Missing 'dataset' or 'datasetHash' in request"
     
     if 'config' not in data:
         return "Missing 'config' in request"
     
+    # Stored datasets are checked against the target feature by the service
+    if 'dataset' not in data:
+        if not validate_dataset_hash(data['datasetHash']):
+            return "Invalid 'datasetHash' format"
+        
+        config_error = validate_training_config(data['config'])
+        if config_error:
+            return f"Config validation error: {config_error}"
+        
+        return None
+    
     # Validate dataset
     dataset = data['dataset']
     dataset_error = validate_dataset(dataset)
@@ -137,6 +152,14 @@ def validate_training_config(config: Dict[str, Any]) -> Optional[str]:
         if presets not in valid_presets:
             return f"Presets must be one of: {valid_presets}"
     
+    if 'optimizeForDeployment' in config and not isinstance(config['optimizeForDeployment'], bool):
+        return "optimizeForDeployment must be a boolean"
+    
+    if config.get('inferenceLimitMs') is not None:
+        inference_limit = config['inferenceLimitMs']
+        if isinstance(inference_limit, bool) or not isinstance(inference_limit, (int, float)) or inference_limit <= 0:
+            return "Inference limit must be a positive number of milliseconds per row"
+    
     if 'evalMetric' in config:
         eval_metric = config['evalMetric']
         if eval_metric is not None and (not isinstance(eval_metric, str) or not eval_metric.strip()):
@@ -177,6 +200,93 @@ def validate_prediction_request(data: Dict[str, Any]) -> Optional[str]:
     
     return None
 
+def validate_prediction_columns(columns: Any, max_samples: int = 1000) -> Optional[str]:
+    """Validate column-oriented prediction data (feature name -> values)"""
+    if not isinstance(columns, dict) or len(columns) == 0:
+        return "columns must be a non-empty object mapping feature names to value lists"
+    
+    lengths = set()
+    for name, values in columns.items():
+        if isinstance(values, (str, bytes, dict)) or not hasattr(values, '__len__'):
+            return f"Column '{name}' must be a list of values"
+        lengths.add(len(values))
+    
+    if len(lengths) != 1:
+        return "All columns must have the same number of values"
+    
+    sample_count = lengths.pop()
+    if sample_count == 0:
+        return "Prediction data cannot be empty"
+    
+    if sample_count > max_samples:
+        return f"Too many samples in single request. Maximum {max_samples} allowed"
+    
+    return None
+
+def validate_scoring_job_request(data: Dict[str, Any]) -> Optional[str]:
+    """Validate batch-scoring job payload"""
+    sources = [key for key in ('datasetHash', 'inputPath') if key in data]
+    if len(sources) != 1:
+        return "Provide exactly one of 'datasetHash' or 'inputPath' (or upload a file)"
+    
+    if 'datasetHash' in data and not validate_dataset_hash(data['datasetHash']):
+        return "datasetHash must be a hex SHA-256 digest"
+    
+    if 'inputPath' in data and (not isinstance(data['inputPath'], str) or not data['inputPath'].strip()):
+        return "inputPath must be a non-empty string"
+    
+    return None
+
+def validate_batching_config(data: Dict[str, Any]) -> Optional[str]:
+    """Validate micro-batching settings"""
+    allowed_fields = {'enabled', 'window_ms', 'max_rows'}
+    unknown_fields = set(data.keys()) - allowed_fields
+    if unknown_fields:
+        return f"Unknown fields: {sorted(unknown_fields)}. Allowed: {sorted(allowed_fields)}"
+    
+    if 'enabled' in data and not isinstance(data['enabled'], bool):
+        return "enabled must be a boolean"
+    
+    if 'window_ms' in data:
+        window_ms = data['window_ms']
+        if isinstance(window_ms, bool) or not isinstance(window_ms, (int, float)) or not 0 <= window_ms <= 1000:
+            return "window_ms must be a number between 0 and 1000"
+    
+    if 'max_rows' in data:
+        max_rows = data['max_rows']
+        if isinstance(max_rows, bool) or not isinstance(max_rows, int) or not 1 <= max_rows <= 10000:
+            return "max_rows must be an integer between 1 and 10000"
+    
+    return None
+
+def validate_model_list_params(args: Dict[str, Any], allowed_fields: List[str], max_limit: int = 500) -> Optional[str]:
+    """Validate the query parameters of a model listing"""
+    if 'limit' in args:
+        try:
+            limit = int(args['limit'])
+        except (TypeError, ValueError):
+            return "limit must be an integer"
+        if not 1 <= limit <= max_limit:
+            return f"limit must be between 1 and {max_limit}"
+    
+    valid_statuses = ['training', 'completed', 'failed', 'deleted']
+    if 'status' in args and args['status'] not in valid_statuses:
+        return f"status must be one of: {valid_statuses}"
+    
+    valid_types = ['regression', 'binary', 'multiclass', 'auto']
+    if 'problem_type' in args and args['problem_type'] not in valid_types:
+        return f"problem_type must be one of: {valid_types}"
+    
+    if 'fields' in args:
+        fields = [name.strip() for name in args['fields'].split(',') if name.strip()]
+        if not fields:
+            return "fields must list at least one field"
+        unknown_fields = set(fields) - set(allowed_fields)
+        if unknown_fields:
+            return f"Unknown fields: {sorted(unknown_fields)}. Allowed: {list(allowed_fields)}"
+    
+    return None
+
 def validate_model_name(name: str) -> bool:
     """Validate model name format"""
     if not isinstance(name, str):
@@ -0,0 +1,25 @@
+# BE/app/utils/upload_limits.py
+from typing import Callable, Optional
+
+from flask import Request, current_app
+
+def dataset_upload(view: Callable) -> Callable:
+    """
+    Mark a route that spools dataset files to disk
+
+    Such routes are held to MAX_DATASET_UPLOAD_LENGTH instead of
+    MAX_CONTENT_LENGTH, since the file never sits in memory. Apply it
+    below the route decorator.
+    """
+    view.dataset_upload = True
+    return view
+
+class DatasetUploadRequest(Request):
+    """Request that applies the dataset upload limit to @dataset_upload routes"""
+
+    @property
+    def max_content_length(self) -> Optional[int]:
+        view = current_app.view_functions.get(self.endpoint) if current_app and self.endpoint else None
+        if getattr(view, 'dataset_upload', False):
+            return current_app.config.get('MAX_DATASET_UPLOAD_LENGTH')
+        return super().max_content_length
@@ -0,0 +1,78 @@
+# BE/migrate_model_layout.py
+"""
+Move models from the flat models_output layout into sharded directories
+
+Stop the API server first: loaded predictors keep the paths they were
+loaded from. Each model directory is renamed into models_output/ab/cd/<uuid>,
+its database record is pointed at the new path and the model index is
+rebuilt from disk.
+
+Usage:
+    python migrate_model_layout.py [--dry-run]
+"""
+import argparse
+import sys
+import os
+from pathlib import Path
+
+# Add the app directory to the Python path
+current_dir = Path(__file__).parent
+app_dir = current_dir / 'app'
+sys.path.insert(0, str(app_dir))
+
+from flask import Flask
+
+from config.config import config
+from extensions import db
+from utils.database import build_engine_options
+
+def create_migration_app(config_class) -> Flask:
+    """
+    Build a Flask app with only the database set up
+
+    create_app would also start warm-up, the garbage collector and the
+    archive sweeper, which load, reclaim or archive models while their
+    directories are being moved.
+    """
+    import models  # noqa: F401 - registers TrainedModel with SQLAlchemy
+
+    app = Flask(__name__)
+    app.config.from_object(config_class)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', build_engine_options(
+        app.config['SQLALCHEMY_DATABASE_URI'],
+        sqlite_busy_timeout_ms=app.config.get('SQLITE_BUSY_TIMEOUT_MS', 30000)
+    ))
+    db.init_app(app)
+    return app
+
+def main():
+    """Migrate the model directories and rebuild the model index"""
+    parser = argparse.ArgumentParser(description="Move models into the sharded directory layout")
+    parser.add_argument('--dry-run', action='store_true', help="List the moves without making them")
+    args = parser.parse_args()
+
+    env = os.getenv('FLASK_ENV', 'development')
+    app = create_migration_app(config.get(env, config['default']))
+
+    from repositories.model_repository import ModelRepository
+    from services.ml_service import AutoGluonMLService
+    from services.model_layout import migrate_flat_layout
+
+    with app.app_context():
+        ml_service = AutoGluonMLService(models_base_path=app.config.get('MODELS_PATH', 'models_output'))
+        model_repository = ModelRepository()
+
+        moved = migrate_flat_layout(ml_service.models_base_path, dry_run=args.dry_run)
+        for model_uuid, old_path, new_path in moved:
+            print(f"{model_uuid}: {old_path} -> {new_path}")
+            if not args.dry_run:
+                model_repository.update_model_path(model_uuid, str(new_path))
+
+        print(f"{len(moved)} models {'to move' if args.dry_run else 'moved'}")
+
+        if not args.dry_run:
+            indexed = ml_service.storage.rebuild_index()
+            print(f"{indexed} models indexed")
+
+if __name__ == "__main__":
+    main()
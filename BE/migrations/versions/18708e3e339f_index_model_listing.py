@@ -0,0 +1,32 @@
+"""index the model listing columns
+
+Revision ID: 18708e3e339f
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+Databases created before migrations were introduced already have the
+trained_models table (db.create_all), so every step checks what is there.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '18708e3e339f'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    indexes = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('trained_models')}
+    if 'ix_trained_models_created_at' not in indexes:
+        op.create_index('ix_trained_models_created_at', 'trained_models', ['created_at'])
+    if 'ix_trained_models_status_created_at' not in indexes:
+        op.create_index('ix_trained_models_status_created_at', 'trained_models', ['status', 'created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_trained_models_status_created_at', table_name='trained_models')
+    op.drop_index('ix_trained_models_created_at', table_name='trained_models')
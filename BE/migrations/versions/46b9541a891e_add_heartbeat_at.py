@@ -0,0 +1,27 @@
+"""add the training job heartbeat
+
+Revision ID: 46b9541a891e
+Revises: 704e11183e53
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '46b9541a891e'
+down_revision = '704e11183e53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('trained_models')}
+    if 'heartbeat_at' not in columns:
+        op.add_column('trained_models', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('trained_models') as batch_op:
+        batch_op.drop_column('heartbeat_at')
@@ -0,0 +1,34 @@
+"""add the persisted model details
+
+Revision ID: 704e11183e53
+Revises: b47e1ec5c007
+Create Date: 2026-10-18 09:20:00.000000
+
+Existing rows are filled from their predictors by
+ModelService._backfill_model_details the first time they are read.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '704e11183e53'
+down_revision = 'b47e1ec5c007'
+branch_labels = None
+depends_on = None
+
+DETAIL_COLUMNS = ('feature_columns', 'leaderboard', 'feature_importance')
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('trained_models')}
+    for name in DETAIL_COLUMNS:
+        if name not in columns:
+            op.add_column('trained_models', sa.Column(name, sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('trained_models') as batch_op:
+        for name in DETAIL_COLUMNS:
+            batch_op.drop_column(name)
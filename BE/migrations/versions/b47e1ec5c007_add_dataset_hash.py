@@ -0,0 +1,32 @@
+"""add the dataset store reference
+
+Revision ID: b47e1ec5c007
+Revises: 18708e3e339f
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b47e1ec5c007'
+down_revision = '18708e3e339f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('trained_models')}
+    if 'dataset_hash' not in columns:
+        op.add_column('trained_models', sa.Column('dataset_hash', sa.String(length=64), nullable=True))
+    indexes = {index['name'] for index in inspector.get_indexes('trained_models')}
+    if 'ix_trained_models_dataset_hash' not in indexes:
+        op.create_index('ix_trained_models_dataset_hash', 'trained_models', ['dataset_hash'])
+
+
+def downgrade():
+    op.drop_index('ix_trained_models_dataset_hash', table_name='trained_models')
+    with op.batch_alter_table('trained_models') as batch_op:
+        batch_op.drop_column('dataset_hash')
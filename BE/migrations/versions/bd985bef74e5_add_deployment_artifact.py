@@ -0,0 +1,37 @@
+"""add the deployment artifact measurements
+
+Revision ID: bd985bef74e5
+Revises: 46b9541a891e
+Create Date: 2026-10-18 09:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'bd985bef74e5'
+down_revision = '46b9541a891e'
+branch_labels = None
+depends_on = None
+
+DEPLOYMENT_COLUMNS = (
+    ('deployment_model_name', sa.String(length=255)),
+    ('full_artifact_bytes', sa.BigInteger()),
+    ('deployment_artifact_bytes', sa.BigInteger()),
+    ('full_latency_ms', sa.Float()),
+    ('deployment_latency_ms', sa.Float()),
+)
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('trained_models')}
+    for name, column_type in DEPLOYMENT_COLUMNS:
+        if name not in columns:
+            op.add_column('trained_models', sa.Column(name, column_type, nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('trained_models') as batch_op:
+        for name, _ in DEPLOYMENT_COLUMNS:
+            batch_op.drop_column(name)
@@ -0,0 +1,27 @@
+"""add the per-row predict time budget
+
+Revision ID: ee113a9e319a
+Revises: bd985bef74e5
+Create Date: 2026-10-18 09:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ee113a9e319a'
+down_revision = 'bd985bef74e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('trained_models')}
+    if 'inference_limit_ms' not in columns:
+        op.add_column('trained_models', sa.Column('inference_limit_ms', sa.Float(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('trained_models') as batch_op:
+        batch_op.drop_column('inference_limit_ms')
@@ -0,0 +1,8 @@
+# BE/tests/conftest.py
+import sys
+from pathlib import Path
+
+# Import modules the way run.py does: from the app directory, and the app package from BE
+BE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BE_DIR / 'app'))
+sys.path.insert(1, str(BE_DIR))
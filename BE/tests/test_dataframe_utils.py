@@ -0,0 +1,49 @@
+# BE/tests/test_dataframe_utils.py
+import numpy as np
+import pandas as pd
+
+from utils.dataframe_utils import optimize_dtypes
+
+def test_numeric_text_becomes_numbers():
+    df = optimize_dtypes(pd.DataFrame({'count': ['1', '20', '-3'], 'ratio': ['0.5', '1.25', '2.0']}))
+
+    assert df['count'].tolist() == [1, 20, -3]
+    assert df['count'].dtype == np.int8
+    assert df['ratio'].dtype == np.float32
+
+def test_text_that_would_change_stays_text():
+    df = optimize_dtypes(pd.DataFrame({
+        'zip': ['007', '10115', '02134'],
+        'price': ['1.50', '2', '3'],
+        'padded': [' 1', '2', '3']
+    }))
+
+    assert df['zip'].tolist() == ['007', '10115', '02134']
+    assert df['price'].tolist() == ['1.50', '2', '3']
+    assert df['padded'].tolist() == [' 1', '2', '3']
+
+def test_identifiers_with_gaps_keep_their_precision():
+    ids = [123456789.0, 987654321.0, np.nan, 16777217.0]
+    df = optimize_dtypes(pd.DataFrame({'customer_id': ids}))
+
+    assert df['customer_id'].dtype == np.float64
+    assert df['customer_id'].iloc[3] == 16777217.0
+
+def test_whole_floats_without_gaps_become_integers():
+    df = optimize_dtypes(pd.DataFrame({'rooms': [1.0, 2.0, 3.0]}))
+    assert df['rooms'].dtype == np.int8
+
+def test_low_cardinality_text_becomes_category_except_excluded():
+    df = optimize_dtypes(
+        pd.DataFrame({'color': ['red', 'blue'] * 5, 'label': ['yes', 'no'] * 5}),
+        exclude_categories=['label']
+    )
+
+    assert isinstance(df['color'].dtype, pd.CategoricalDtype)
+    assert df['label'].dtype == object
+
+def test_empty_strings_are_missing_values():
+    df = optimize_dtypes(pd.DataFrame({'day': ['2024-01-01', '', '2024-03-01']}))
+
+    assert pd.api.types.is_datetime64_any_dtype(df['day'])
+    assert df['day'].isna().tolist() == [False, True, False]
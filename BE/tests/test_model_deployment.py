@@ -0,0 +1,15 @@
+# BE/tests/test_model_deployment.py
+from services.model_deployment import deployment_artifact_path
+from services.model_layout import DEPLOYMENT_DIR_NAME
+from services.model_storage import PREDICTOR_FILENAME
+
+def test_deployment_artifact_path(tmp_path):
+    assert deployment_artifact_path(tmp_path) is None
+
+    deployment_dir = tmp_path / DEPLOYMENT_DIR_NAME
+    deployment_dir.mkdir()
+    # An interrupted copy without its predictor is not served
+    assert deployment_artifact_path(tmp_path) is None
+
+    (deployment_dir / PREDICTOR_FILENAME).write_bytes(b'')
+    assert deployment_artifact_path(tmp_path) == deployment_dir
@@ -0,0 +1,73 @@
+# BE/tests/test_model_layout.py
+import uuid
+
+from services.model_layout import (
+    ModelIndex, iter_model_dirs, iter_scratch_dirs, migrate_flat_layout, resolve_model_path,
+    scratch_dir_path, sharded_model_path
+)
+
+def test_sharded_path_uses_the_uuid_prefix(tmp_path):
+    model_uuid = 'abcdef01-2345-4678-9abc-def012345678'
+    assert sharded_model_path(tmp_path, model_uuid) == tmp_path / 'ab' / 'cd' / model_uuid
+
+def test_resolve_falls_back_to_the_flat_layout(tmp_path):
+    flat_uuid, new_uuid = str(uuid.uuid4()), str(uuid.uuid4())
+    (tmp_path / flat_uuid).mkdir()
+
+    assert resolve_model_path(tmp_path, flat_uuid) == tmp_path / flat_uuid
+    assert resolve_model_path(tmp_path, new_uuid) == sharded_model_path(tmp_path, new_uuid)
+
+def test_migration_moves_flat_models_into_shards(tmp_path):
+    flat_uuid, sharded_uuid = str(uuid.uuid4()), str(uuid.uuid4())
+    (tmp_path / flat_uuid).mkdir()
+    (tmp_path / flat_uuid / 'predictor.pkl').write_bytes(b'model')
+    sharded_model_path(tmp_path, sharded_uuid).mkdir(parents=True)
+    (tmp_path / 'not-a-model').mkdir()
+
+    assert migrate_flat_layout(tmp_path, dry_run=True)[0][0] == flat_uuid
+    assert (tmp_path / flat_uuid).exists()
+
+    moved = migrate_flat_layout(tmp_path)
+
+    assert moved == [(flat_uuid, tmp_path / flat_uuid, sharded_model_path(tmp_path, flat_uuid))]
+    assert (sharded_model_path(tmp_path, flat_uuid) / 'predictor.pkl').read_bytes() == b'model'
+    assert sorted(model_uuid for model_uuid, _ in iter_model_dirs(tmp_path)) == sorted([flat_uuid, sharded_uuid])
+
+def test_scratch_dirs_are_found_next_to_their_model(tmp_path):
+    sharded_uuid, flat_uuid = str(uuid.uuid4()), str(uuid.uuid4())
+    refit_dir = scratch_dir_path(sharded_model_path(tmp_path, sharded_uuid), 'refit')
+    staging_dir = scratch_dir_path(tmp_path / flat_uuid, 'deployment')
+    refit_dir.mkdir(parents=True)
+    staging_dir.mkdir()
+    (refit_dir.parent / '.not-a-model.refit').mkdir()
+
+    assert refit_dir.name == f".{sharded_uuid}.refit"
+    assert sorted(iter_scratch_dirs(tmp_path)) == sorted([(sharded_uuid, refit_dir), (flat_uuid, staging_dir)])
+    assert list(iter_model_dirs(tmp_path)) == []
+
+def test_index_upsert_keeps_fields_left_out(tmp_path):
+    index = ModelIndex(tmp_path / 'index.sqlite')
+    index.upsert('a', tmp_path / 'a', tier='hot', size_bytes=100, last_access=10.0)
+    index.upsert('a', tmp_path / 'a', tier='cold')
+
+    entry = index.get('a')
+    assert (entry['tier'], entry['size_bytes'], entry['last_access']) == ('cold', 100, 10.0)
+
+def test_index_most_recently_used(tmp_path):
+    index = ModelIndex(tmp_path / 'index.sqlite')
+    index.upsert('old', tmp_path / 'old', last_access=1.0)
+    index.upsert('new', tmp_path / 'new', last_access=3.0)
+    index.upsert('cold', tmp_path / 'cold', tier='cold', last_access=5.0)
+    index.upsert('unused', tmp_path / 'unused')
+
+    assert [entry['uuid'] for entry in index.most_recently_used(5)] == ['new', 'old']
+    assert [entry['uuid'] for entry in index.most_recently_used(5, tier='cold')] == ['cold']
+
+def test_index_is_shared_through_the_file(tmp_path):
+    ModelIndex(tmp_path / 'index.sqlite').upsert('a', tmp_path / 'a')
+    other = ModelIndex(tmp_path / 'index.sqlite')
+
+    assert other.get('a')['path'] == str(tmp_path / 'a')
+    other.remove('a')
+    assert other.get('a') is None
+    assert other.all() == []
@@ -0,0 +1,31 @@
+# BE/tests/test_model_metadata_cache.py
+from repositories.model_metadata_cache import ModelMetadata, ModelMetadataCache
+
+def metadata(model_uuid):
+    return ModelMetadata(model_uuid, 'name', 'completed', 'target', 'binary', f"/models/{model_uuid}")
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ModelMetadataCache(max_entries=2)
+    generation = cache.generation()
+    cache.put(metadata('a'), generation)
+    cache.put(metadata('b'), generation)
+
+    cache.get('a')
+    cache.put(metadata('c'), generation)
+
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+
+def test_snapshot_read_before_an_invalidation_is_not_stored():
+    cache = ModelMetadataCache()
+    generation = cache.generation()
+    cache.invalidate('a')
+
+    cache.put(metadata('a'), generation)
+    assert cache.get('a') is None
+
+def test_zero_ttl_disables_caching():
+    cache = ModelMetadataCache(ttl_seconds=0)
+    cache.put(metadata('a'), cache.generation())
+    assert cache.get('a') is None
@@ -0,0 +1,89 @@
+# BE/tests/test_model_reconciler.py
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+
+from flask import Flask
+
+from services.model_layout import ModelIndex, scratch_dir_path, sharded_model_path
+from services.model_reconciler import EMPTY_DATABASE_ERROR, ModelReconciler
+
+class FakeRepository:
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def get_status_index(self):
+        return {model_uuid: (status, datetime.utcnow()) for model_uuid, status in self.statuses.items()}
+
+    def get_by_uuid(self, model_uuid):
+        status = self.statuses.get(model_uuid)
+        return SimpleNamespace(status=status) if status else None
+
+    def fail_stale_training(self, model_uuids, error_message, seen_before):
+        return 0
+
+class FakeStorage:
+    @contextmanager
+    def model_lock(self, model_uuid):
+        yield
+
+    def forget(self, model_uuid):
+        pass
+
+def make_reconciler(tmp_path, statuses):
+    ml_service = SimpleNamespace(
+        models_base_path=tmp_path,
+        model_index=ModelIndex(tmp_path / 'index.sqlite'),
+        storage=FakeStorage()
+    )
+    return ModelReconciler(Flask(__name__), ml_service, FakeRepository(statuses), grace_seconds=60)
+
+def make_dir(path, age_seconds=3600):
+    path.mkdir(parents=True)
+    (path / 'file.bin').write_bytes(b'x' * 10)
+    past = time.time() - age_seconds
+    os.utime(path, (past, past))
+    return path
+
+def test_orphan_directories_are_reclaimed_after_the_grace_period(tmp_path):
+    kept_uuid, orphan_uuid, recent_uuid = (str(uuid.uuid4()) for _ in range(3))
+    make_dir(sharded_model_path(tmp_path, kept_uuid))
+    orphan_dir = make_dir(sharded_model_path(tmp_path, orphan_uuid))
+    make_dir(sharded_model_path(tmp_path, recent_uuid), age_seconds=0)
+
+    report = make_reconciler(tmp_path, {kept_uuid: 'completed'}).run()
+
+    assert report['orphan_directories'] == [orphan_uuid]
+    assert report['reclaimed_bytes'] == 10
+    assert not orphan_dir.exists()
+    assert sharded_model_path(tmp_path, recent_uuid).exists()
+
+def test_nothing_is_reclaimed_when_the_database_has_no_models(tmp_path):
+    model_dir = make_dir(sharded_model_path(tmp_path, str(uuid.uuid4())))
+    scratch_dir = make_dir(scratch_dir_path(model_dir, 'refit'))
+
+    report = make_reconciler(tmp_path, {}).run()
+
+    assert report['errors'] == [EMPTY_DATABASE_ERROR]
+    assert report['orphan_directories'] == [] and report['scratch_directories'] == []
+    assert model_dir.exists() and scratch_dir.exists()
+
+def test_work_directories_of_finished_builds_are_reclaimed(tmp_path):
+    done_uuid, training_uuid = str(uuid.uuid4()), str(uuid.uuid4())
+    done_dir = make_dir(sharded_model_path(tmp_path, done_uuid))
+    leftover = make_dir(scratch_dir_path(done_dir, 'refit'))
+    recent = make_dir(scratch_dir_path(done_dir, 'deployment'), age_seconds=0)
+    building = make_dir(scratch_dir_path(sharded_model_path(tmp_path, training_uuid), 'refit'))
+
+    reconciler = make_reconciler(tmp_path, {done_uuid: 'completed', training_uuid: 'training'})
+    assert reconciler.run(dry_run=True)['scratch_directories'] == [leftover.name]
+    assert leftover.exists()
+
+    report = reconciler.run()
+
+    assert report['scratch_directories'] == [leftover.name]
+    assert not leftover.exists()
+    assert recent.exists() and building.exists() and done_dir.exists()
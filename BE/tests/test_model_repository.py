@@ -0,0 +1,84 @@
+# BE/tests/test_model_repository.py
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from extensions import db
+from models import TrainedModel
+from repositories.model_repository import ModelRepository
+from repositories.model_metadata_cache import ModelMetadataCache
+
+@pytest.fixture
+def repository(tmp_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'models.db'}"
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        yield ModelRepository(ModelMetadataCache())
+        db.session.remove()
+
+def add_models(count, start=datetime(2024, 1, 1), **columns):
+    for i in range(count):
+        db.session.add(TrainedModel(
+            name=columns.get('name', f"model-{i:02d}"),
+            model_path=f"/models/{i}",
+            target_feature='y',
+            problem_type=columns.get('problem_type', 'binary'),
+            time_limit=60,
+            status=columns.get('status', 'completed'),
+            created_at=start + timedelta(minutes=i)
+        ))
+    db.session.commit()
+
+def test_pages_cover_every_model_once_newest_first(repository):
+    add_models(7)
+
+    names, cursor = [], None
+    while True:
+        models, cursor = repository.list_page(limit=3, cursor=cursor)
+        names.extend(model.name for model in models)
+        if cursor is None:
+            break
+
+    assert names == [f"model-{i:02d}" for i in reversed(range(7))]
+
+def test_models_created_at_the_same_time_are_not_skipped(repository):
+    add_models(1, name='a')
+    add_models(1, name='b')
+    add_models(1, name='c')
+
+    first, cursor = repository.list_page(limit=2)
+    second, cursor = repository.list_page(limit=2, cursor=cursor)
+
+    assert sorted(model.name for model in first + second) == ['a', 'b', 'c']
+    assert cursor is None
+
+def test_filters(repository):
+    add_models(2, status='failed')
+    add_models(3, problem_type='regression', name='reg_model')
+    add_models(1, name='reg%')
+
+    failed, _ = repository.list_page(limit=10, status='failed')
+    regression, _ = repository.list_page(limit=10, problem_type='regression')
+    prefixed, _ = repository.list_page(limit=10, name_prefix='reg%')
+
+    assert len(failed) == 2
+    assert len(regression) == 3
+    # LIKE wildcards in the prefix match literally
+    assert [model.name for model in prefixed] == ['reg%']
+
+def test_projection_loads_only_the_requested_fields(repository):
+    add_models(3)
+
+    models, cursor = repository.list_page(limit=2, fields=['name'])
+
+    assert [model.to_dict(fields=['name']) for model in models] == [{'name': 'model-02'}, {'name': 'model-01'}]
+    assert all('leaderboard' not in model.__dict__ for model in models)
+    assert repository.list_page(limit=2, cursor=cursor)[0][0].name == 'model-00'
+
+def test_malformed_cursor(repository):
+    with pytest.raises(ValueError):
+        repository.list_page(limit=2, cursor='not-a-cursor')
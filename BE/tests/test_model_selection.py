@@ -0,0 +1,53 @@
+# BE/tests/test_model_selection.py
+import pandas as pd
+
+from services.model_selection import measure_predict_times, select_model_within_budget
+
+# Best validation score first, as AutoGluon sorts its leaderboard
+LEADERBOARD = [
+    {'model': 'WeightedEnsemble_L2', 'score_val': 0.95},
+    {'model': 'LightGBM', 'score_val': 0.93},
+    {'model': 'KNeighbors', 'score_val': 0.90}
+]
+
+PREDICT_TIMES = {'WeightedEnsemble_L2': 30.0, 'LightGBM': 8.0, 'KNeighbors': 2.0}
+
+def test_best_model_when_it_fits():
+    assert select_model_within_budget(LEADERBOARD, PREDICT_TIMES, 50.0) == ('WeightedEnsemble_L2', True)
+
+def test_best_scoring_model_within_budget():
+    assert select_model_within_budget(LEADERBOARD, PREDICT_TIMES, 10.0) == ('LightGBM', True)
+
+def test_budget_is_inclusive():
+    assert select_model_within_budget(LEADERBOARD, PREDICT_TIMES, 2.0) == ('KNeighbors', True)
+
+def test_fastest_model_when_none_fits():
+    assert select_model_within_budget(LEADERBOARD, PREDICT_TIMES, 1.0) == ('KNeighbors', False)
+
+def test_unmeasured_models_are_skipped():
+    assert select_model_within_budget(LEADERBOARD, {'KNeighbors': 2.0}, 50.0) == ('KNeighbors', True)
+    assert select_model_within_budget(LEADERBOARD, {}, 50.0) == (None, False)
+
+class FakePredictor:
+    """Leaderboard timings that change between passes"""
+
+    def __init__(self, timings):
+        self.timings = iter(timings)
+        self.rows = []
+
+    def leaderboard(self, data, skip_score, silent):
+        self.rows.append(len(data))
+        return pd.DataFrame({'model': ['fast', 'slow'], 'pred_time_test': next(self.timings)})
+
+def test_measure_predict_times_keeps_the_median_after_a_warm_up_pass():
+    predictor = FakePredictor([
+        [1.0, 1.0],        # Warm-up, ignored
+        [0.002, 0.010],
+        [0.004, 0.030],
+        [0.003, 0.020]
+    ])
+
+    times = measure_predict_times(predictor, pd.DataFrame({'x': range(10)}))
+
+    assert times == {'fast': 3.0, 'slow': 20.0}
+    assert predictor.rows == [1, 1, 1, 1]
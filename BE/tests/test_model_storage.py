@@ -0,0 +1,54 @@
+# BE/tests/test_model_storage.py
+import io
+import tarfile
+
+import pytest
+
+from services.model_storage import _extract_archive
+
+def make_archive(*members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        for name, kind, target in members:
+            info = tarfile.TarInfo(name)
+            if kind == 'file':
+                info.size = len(target)
+                tar.addfile(info, io.BytesIO(target))
+            else:
+                info.type = tarfile.SYMTYPE if kind == 'symlink' else tarfile.LNKTYPE
+                info.linkname = target
+                tar.addfile(info)
+    buffer.seek(0)
+    return buffer
+
+@pytest.fixture(params=['data_filter', 'fallback'])
+def extract(request, monkeypatch):
+    if request.param == 'fallback':
+        monkeypatch.delattr(tarfile, 'data_filter', raising=False)
+
+    def extract(buffer, destination):
+        with tarfile.open(fileobj=buffer, mode='r|') as tar:
+            _extract_archive(tar, destination)
+    return extract
+
+def test_archive_members_are_extracted(tmp_path, extract):
+    extract(make_archive(
+        ('models/weights.bin', 'file', b'weights'),
+        ('latest', 'symlink', 'models/weights.bin')
+    ), tmp_path)
+
+    assert (tmp_path / 'models' / 'weights.bin').read_bytes() == b'weights'
+    assert (tmp_path / 'latest').read_bytes() == b'weights'
+
+@pytest.mark.parametrize('member', [
+    ('../outside.bin', 'file', b'x'),
+    ('escape', 'symlink', '../../etc/passwd'),
+    ('passwd', 'hardlink', '/etc/passwd')
+])
+def test_members_outside_the_destination_are_refused(tmp_path, extract, member):
+    destination = tmp_path / 'staging'
+    destination.mkdir()
+
+    with pytest.raises(tarfile.TarError):
+        extract(make_archive(member), destination)
+    assert not (tmp_path / 'outside.bin').exists()
@@ -0,0 +1,121 @@
+# BE/tests/test_prediction_batcher.py
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from services.base import PredictionRequest, PredictionResult
+from services.prediction_batcher import BatchingConfig, PredictionBatcher
+
+class FakeMLService:
+    """Predicts each row's position in the request, failing on rows with a 'bad' feature"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, request):
+        rows = request.data if request.columns is None else [
+            dict(zip(request.columns, values)) for values in zip(*request.columns.values())
+        ]
+        self.calls.append(rows)
+        if any('bad' in row for row in rows):
+            return PredictionResult(success=False, error_message="bad feature")
+        return PredictionResult(success=True, predictions=[row.get('x') for row in rows])
+
+def run_batch(batcher, requests):
+    batch = [(request, Future()) for request in requests]
+    batcher._run_batch('model', batch)
+    return [future.result(timeout=1) for _, future in batch]
+
+@pytest.fixture
+def ml_service():
+    return FakeMLService()
+
+@pytest.fixture
+def batcher(ml_service):
+    return PredictionBatcher(ml_service, BatchingConfig(enabled=True, window_ms=50, max_rows=100))
+
+def test_same_columns_share_one_inference(batcher, ml_service):
+    results = run_batch(batcher, [
+        PredictionRequest('model', [{'x': 1}, {'x': 2}]),
+        PredictionRequest('model', [{'x': 3}]),
+        PredictionRequest('model', None, columns={'x': [4, 5]})
+    ])
+
+    assert len(ml_service.calls) == 1
+    assert [result.predictions for result in results] == [[1, 2], [3], [4, 5]]
+
+def test_different_columns_are_not_merged(batcher, ml_service):
+    results = run_batch(batcher, [
+        PredictionRequest('model', [{'x': 1, 'y': 1}]),
+        PredictionRequest('model', [{'x': 2}]),
+        PredictionRequest('model', [{'x': 3, 'y': 3}])
+    ])
+
+    assert sorted(len(call) for call in ml_service.calls) == [1, 2]
+    assert all(set(row) == set(call[0]) for call in ml_service.calls for row in call)
+    assert [result.predictions for result in results] == [[1], [2], [3]]
+
+def test_request_with_mixed_rows_runs_alone(batcher, ml_service):
+    run_batch(batcher, [
+        PredictionRequest('model', [{'x': 1}, {'x': 2, 'y': 2}]),
+        PredictionRequest('model', [{'x': 3}])
+    ])
+
+    assert len(ml_service.calls) == 2
+
+def test_failed_batch_is_retried_per_request(batcher, ml_service):
+    results = run_batch(batcher, [
+        PredictionRequest('model', [{'x': 1, 'bad': 1}]),
+        PredictionRequest('model', [{'x': 2, 'bad': 2}])
+    ])
+
+    assert len(ml_service.calls) == 3
+    assert [result.success for result in results] == [False, False]
+
+def test_errors_building_a_batch_fail_its_callers(batcher, monkeypatch):
+    def broken_frame(request):
+        raise ValueError("cannot build frame")
+    monkeypatch.setattr('services.prediction_batcher.build_prediction_frame', broken_frame)
+
+    batch = [
+        (PredictionRequest('model', None, columns={'x': [1]}), Future()),
+        (PredictionRequest('model', None, columns={'x': [2]}), Future())
+    ]
+    batcher._run_batch('model', batch)
+
+    for _, future in batch:
+        with pytest.raises(ValueError):
+            future.result(timeout=1)
+
+def test_batching_thread_survives_errors(batcher, monkeypatch):
+    monkeypatch.setattr('services.prediction_batcher._column_signature', lambda request: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        batcher.predict(PredictionRequest('model', [{'x': 1}]))
+
+    monkeypatch.undo()
+    result = batcher.predict(PredictionRequest('model', [{'x': 2}]))
+    assert result.predictions == [2]
+
+def test_concurrent_requests_are_coalesced(ml_service):
+    batcher = PredictionBatcher(ml_service, BatchingConfig(enabled=True, window_ms=200, max_rows=100))
+    results = [None] * 4
+    def predict(i):
+        results[i] = batcher.predict(PredictionRequest('model', [{'x': i}]))
+
+    threads = [threading.Thread(target=predict, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [result.predictions for result in results] == [[0], [1], [2], [3]]
+    assert sum(len(call) for call in ml_service.calls) == 4
+    assert len(ml_service.calls) < 4
+
+def test_disabled_batching_calls_through(ml_service):
+    batcher = PredictionBatcher(ml_service)
+    result = batcher.predict(PredictionRequest('model', [{'x': 7}]))
+
+    assert result.predictions == [7]
+    assert len(ml_service.calls) == 1
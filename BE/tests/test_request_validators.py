@@ -0,0 +1,101 @@
+# BE/tests/test_request_validators.py
+import pytest
+
+from utils.request_validators import (
+    validate_batching_config, validate_model_list_params, validate_prediction_columns,
+    validate_scoring_job_request, validate_training_config
+)
+
+DATASET_HASH = 'ab' * 32
+
+@pytest.mark.parametrize('data', [
+    {},
+    {'enabled': True, 'window_ms': 0, 'max_rows': 1},
+    {'window_ms': 2.5, 'max_rows': 10000}
+])
+def test_valid_batching_config(data):
+    assert validate_batching_config(data) is None
+
+@pytest.mark.parametrize('data, error', [
+    ({'size': 1}, "Unknown fields"),
+    ({'enabled': 'yes'}, "enabled must be a boolean"),
+    ({'window_ms': True}, "window_ms must be a number"),
+    ({'window_ms': 1001}, "window_ms must be a number"),
+    ({'max_rows': 0}, "max_rows must be an integer"),
+    ({'max_rows': 1.5}, "max_rows must be an integer")
+])
+def test_invalid_batching_config(data, error):
+    assert error in validate_batching_config(data)
+
+@pytest.mark.parametrize('data', [
+    {'datasetHash': DATASET_HASH},
+    {'inputPath': 'scoring/input.csv'}
+])
+def test_valid_scoring_job_request(data):
+    assert validate_scoring_job_request(data) is None
+
+@pytest.mark.parametrize('data, error', [
+    ({}, "Provide exactly one"),
+    ({'datasetHash': DATASET_HASH, 'inputPath': 'input.csv'}, "Provide exactly one"),
+    ({'datasetHash': 'not-a-hash'}, "datasetHash must be"),
+    ({'inputPath': '  '}, "inputPath must be"),
+    ({'inputPath': 3}, "inputPath must be")
+])
+def test_invalid_scoring_job_request(data, error):
+    assert error in validate_scoring_job_request(data)
+
+def test_valid_prediction_columns():
+    assert validate_prediction_columns({'x': [1, 2], 'col': ['a', 'b']}) is None
+
+@pytest.mark.parametrize('columns, error', [
+    ([], "columns must be a non-empty object"),
+    ({}, "columns must be a non-empty object"),
+    ({'x': 'abc'}, "Column 'x' must be a list"),
+    ({'x': 1}, "Column 'x' must be a list"),
+    ({'x': [1, 2], 'y': [1]}, "same number of values"),
+    ({'x': []}, "cannot be empty")
+])
+def test_invalid_prediction_columns(columns, error):
+    assert error in validate_prediction_columns(columns)
+
+def test_prediction_columns_sample_limit():
+    assert validate_prediction_columns({'x': [0] * 10}, max_samples=10) is None
+    assert "Too many samples" in validate_prediction_columns({'x': [0] * 11}, max_samples=10)
+
+LIST_FIELDS = ['uuid', 'name', 'status']
+
+def test_valid_model_list_params():
+    assert validate_model_list_params(
+        {'limit': '20', 'status': 'completed', 'problem_type': 'binary', 'fields': 'uuid, name'},
+        LIST_FIELDS
+    ) is None
+
+@pytest.mark.parametrize('args, error', [
+    ({'limit': 'ten'}, "limit must be an integer"),
+    ({'limit': '0'}, "limit must be between"),
+    ({'limit': '501'}, "limit must be between"),
+    ({'status': 'archived'}, "status must be one of"),
+    ({'problem_type': 'ranking'}, "problem_type must be one of"),
+    ({'fields': ' , '}, "fields must list at least one field"),
+    ({'fields': 'name,leaderboard'}, "Unknown fields: ['leaderboard']")
+])
+def test_invalid_model_list_params(args, error):
+    assert error in validate_model_list_params(args, LIST_FIELDS)
+
+TRAINING_CONFIG = {'modelName': 'churn', 'targetFeature': 'churned', 'problemType': 'binary'}
+
+def test_optimize_for_deployment_must_be_boolean():
+    assert validate_training_config({**TRAINING_CONFIG, 'optimizeForDeployment': True}) is None
+    assert "optimizeForDeployment must be a boolean" in validate_training_config(
+        {**TRAINING_CONFIG, 'optimizeForDeployment': 'yes'}
+    )
+
+@pytest.mark.parametrize('limit', [None, 5, 0.25])
+def test_valid_inference_limit(limit):
+    assert validate_training_config({**TRAINING_CONFIG, 'inferenceLimitMs': limit}) is None
+
+@pytest.mark.parametrize('limit', [0, -1, True, '5'])
+def test_invalid_inference_limit(limit):
+    assert "Inference limit must be a positive number" in validate_training_config(
+        {**TRAINING_CONFIG, 'inferenceLimitMs': limit}
+    )
@@ -0,0 +1,92 @@
+# BE/tests/test_schema_validator.py
+import pandas as pd
+import pytest
+
+from services.schema_validator import MAX_REPORTED_ERRORS, SchemaValidationError, SchemaValidator
+
+MANIFEST = {
+    'label': 'target',
+    'features': [
+        {'name': 'age', 'dtype': 'int64', 'type': 'int', 'nullable': False, 'categories': None},
+        {'name': 'income', 'dtype': 'float64', 'type': 'float', 'nullable': True, 'categories': None},
+        {'name': 'member', 'dtype': 'bool', 'type': 'bool', 'nullable': False, 'categories': None},
+        {'name': 'joined', 'dtype': 'datetime64[ns]', 'type': 'datetime', 'nullable': True, 'categories': None},
+        {'name': 'color', 'dtype': 'object', 'type': 'object', 'nullable': False, 'categories': ['blue', 'red']}
+    ]
+}
+
+@pytest.fixture
+def validator():
+    return SchemaValidator.from_manifest(MANIFEST)
+
+def make_frame(**overrides):
+    data = {
+        'age': [30, 41],
+        'income': [1200.5, 800.0],
+        'member': [True, False],
+        'joined': ['2024-01-01', '2023-06-30'],
+        'color': ['red', 'blue']
+    }
+    data.update(overrides)
+    return pd.DataFrame(data)
+
+def test_valid_batch_is_coerced_to_training_types(validator):
+    df, report = validator.validate(make_frame(age=['30', '41'], member=['yes', 'F'], extra=[1, 2]))
+
+    assert report.is_valid
+    assert list(df.columns) == validator.feature_names
+    assert pd.api.types.is_numeric_dtype(df['age'])
+    assert df['member'].tolist() == [True, False]
+    assert pd.api.types.is_datetime64_any_dtype(df['joined'])
+    assert report.ignored_columns == ['extra']
+
+def test_dates_in_mixed_formats_are_accepted(validator, recwarn):
+    df, report = validator.validate(make_frame(joined=['2024-01-31', '03/15/2024 10:30']))
+
+    assert report.is_valid
+    assert df['joined'].tolist() == [pd.Timestamp('2024-01-31'), pd.Timestamp('2024-03-15 10:30')]
+    assert not [warning for warning in recwarn if issubclass(warning.category, UserWarning)]
+
+def test_label_column_is_not_reported_as_ignored(validator):
+    _, report = validator.validate(make_frame(target=[0, 1]))
+    assert report.ignored_columns == []
+
+def test_missing_columns(validator):
+    _, report = validator.validate(make_frame().drop(columns=['income', 'color']))
+
+    assert not report.is_valid
+    assert report.missing_columns == ['income', 'color']
+    assert "Missing feature columns" in str(SchemaValidationError(report))
+
+def test_uncoercible_cells_are_errors(validator):
+    _, report = validator.validate(
+        make_frame(age=['30', 'old'], member=['maybe', True], joined=['someday', '2024-01-01']),
+        row_offset=100
+    )
+
+    assert not report.is_valid
+    assert report.invalid_rows == 2
+    assert report.error_count == 3
+    assert {(error['row'], error['column']) for error in report.errors} == {
+        (101, 'age'), (100, 'member'), (100, 'joined')
+    }
+
+def test_nulls_and_unknown_categories_are_only_counted(validator):
+    _, report = validator.validate(make_frame(age=[30, None], income=[None, 1.0], color=['green', 'red']))
+
+    assert report.is_valid
+    assert report.missing_values == {'age': 1}
+    assert report.unknown_categories == {'color': 1}
+
+def test_reported_errors_are_capped(validator):
+    rows = MAX_REPORTED_ERRORS + 20
+    _, report = validator.validate(pd.DataFrame({
+        'age': ['x'] * rows,
+        'income': [1.0] * rows,
+        'member': [True] * rows,
+        'joined': ['2024-01-01'] * rows,
+        'color': ['red'] * rows
+    }))
+
+    assert report.error_count == rows
+    assert len(report.errors) == MAX_REPORTED_ERRORS
@@ -0,0 +1,34 @@
+# BE/tests/test_scoring_jobs.py
+import os
+
+import pytest
+
+from services.scoring_jobs import ScoringJobManager
+
+@pytest.fixture
+def manager(tmp_path):
+    input_dir = tmp_path / 'inputs'
+    (input_dir / 'nested').mkdir(parents=True)
+    (input_dir / 'data.csv').write_text('x\n1\n')
+    (input_dir / 'nested' / 'more.csv').write_text('x\n2\n')
+    (tmp_path / 'secret.csv').write_text('x\n3\n')
+
+    manager = ScoringJobManager(ml_service=None, input_base_path=str(input_dir))
+    yield manager
+    manager._executor.shutdown(wait=False)
+
+def test_resolves_files_inside_the_input_directory(manager):
+    assert manager.resolve_input_path('data.csv') == str((manager.input_base_path / 'data.csv').resolve())
+    assert manager.resolve_input_path('nested/more.csv') is not None
+    assert manager.resolve_input_path('nested/../data.csv') is not None
+
+@pytest.mark.parametrize('path', ['../secret.csv', 'nested/../../secret.csv', 'missing.csv', 'nested'])
+def test_refuses_paths_outside_or_missing(manager, path):
+    assert manager.resolve_input_path(path) is None
+
+def test_refuses_absolute_paths_outside(manager, tmp_path):
+    assert manager.resolve_input_path(str(tmp_path / 'secret.csv')) is None
+
+def test_refuses_symlinks_leaving_the_input_directory(manager, tmp_path):
+    os.symlink(tmp_path / 'secret.csv', manager.input_base_path / 'link.csv')
+    assert manager.resolve_input_path('link.csv') is None
@@ -0,0 +1,21 @@
+# BE/tests/test_training_queue.py
+from services.base import DatasetInfo
+from services.training_queue import _ingest_dataset
+
+class FakeRepository:
+    def __init__(self):
+        self.updates = []
+
+    def update_status(self, model_uuid, status, additional_data=None):
+        self.updates.append((model_uuid, status.value, additional_data))
+
+def test_ingest_stores_request_rows_and_releases_them(tmp_path):
+    rows = [['007', 1.5, 'a'], ['042', 2.5, 'b']]
+    dataset = DatasetInfo(filename='data.json', headers=['code', 'x', 'y'], rows=rows, total_rows=2, file_size=0)
+    repository = FakeRepository()
+
+    stored = _ingest_dataset('model-1', str(tmp_path), dataset, repository)
+
+    assert rows == []
+    assert stored.file_path.endswith('.parquet') and stored.total_rows == 2
+    assert repository.updates == [('model-1', 'training', {'dataset_hash': stored.dataset_hash})]
@@ -2,6 +2,9 @@
 import { ref } from 'vue';
 import type { TrainingRequest, TrainedModel } from '../types';
 
+// Largest page GET /api/models serves
+const MODELS_PAGE_SIZE = 500;
+
 export function useApi() {
   const isLoading = ref(false);
   const error = ref<string | null>(null);
@@ -63,19 +66,33 @@ export function useApi() {
     error.value = null;
 
     try {
-      const response = await fetch(`${apiUrl}/api/models`);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
-
-      const result = await response.json();
-      
-      if (!result.success) {
-        throw new Error(result.error || 'Failed to fetch models');
-      }
-
-      return result.models || [];
+      // The API returns one page at a time; follow next_cursor until the last one
+      const models: TrainedModel[] = [];
+      let cursor: string | null = null;
+
+      do {
+        const params = new URLSearchParams({ limit: String(MODELS_PAGE_SIZE) });
+        if (cursor) {
+          params.set('cursor', cursor);
+        }
+
+        const response = await fetch(`${apiUrl}/api/models?${params}`);
+        
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const result = await response.json();
+        
+        if (!result.success) {
+          throw new Error(result.error || 'Failed to fetch models');
+        }
+
+        models.push(...(result.models || []));
+        cursor = result.next_cursor || null;
+      } while (cursor);
+
+      return models;
     } catch (err) {
       error.value = err instanceof Error ? err.message : 'Failed to fetch models';
       throw err;